@@ -0,0 +1,57 @@
+"""Compare the per-call overhead of the replacements of stubbed methods.
+
+Times a call of an unpatched method, of the generic replacement, and of a
+trampoline (``MOCKITO_TRAMPOLINES=1``), each answering with the original
+implementation and with a constant.  Run from the repository root::
+
+    python benchmarks/stubbed_calls.py
+
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mockito import unstub, when  # noqa: E402
+
+
+NUMBER = 100000
+
+
+class Dog(object):
+    def bark(self, sound, times=1, *, loud=False):
+        return sound * times
+
+
+def per_call(fn):
+    return min(timeit.repeat(fn, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def stubbed(trampolines, answer):
+    os.environ['MOCKITO_TRAMPOLINES'] = '1' if trampolines else '0'
+    rex = Dog()
+    try:
+        answer(when(rex).bark(...))
+        return per_call(lambda: rex.bark('Wuff', 2))
+    finally:
+        unstub()
+
+
+def main():
+    rex = Dog()
+    print('%-26s %.2f us' % (
+        'unpatched', per_call(lambda: rex.bark('Wuff', 2))))
+    for name, answer in [
+        ('original', lambda stub: stub.thenCallOriginalImplementation()),
+        ('constant', lambda stub: stub.thenReturn('Wuff')),
+    ]:
+        for trampolines in (False, True):
+            print('%-26s %.2f us' % (
+                '%s, %s' % (name, 'trampoline' if trampolines else 'generic'),
+                stubbed(trampolines, answer)))
+
+
+if __name__ == '__main__':
+    main()
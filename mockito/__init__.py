@@ -28,6 +28,8 @@ from .mockito import (
     expect,
     unstub,
     forget_invocations,
+    reset,
+    latency,
     ensureNoUnverifiedInteractions,
     verify,
     verifyZeroInteractions,
@@ -39,7 +41,7 @@ from .mockito import (
 )
 from . import inorder
 from .spying import spy, spy2
-from .mocking import mock
+from .mocking import mock, mock_many, MockPool
 from .verification import VerificationError
 
 from .matchers import *  # noqa: F401 F403
@@ -50,6 +52,8 @@ __version__ = '2.0.0-dev'
 
 __all__ = [
     'mock',
+    'mock_many',
+    'MockPool',
     'spy',
     'spy2',
     'when',
@@ -64,6 +68,8 @@ __all__ = [
     'inorder',
     'unstub',
     'forget_invocations',
+    'reset',
+    'latency',
     'VerificationError',
     'ArgumentError',
 
@@ -0,0 +1,283 @@
+# Copyright (c) 2008-2016 Szczepan Faber, Serhiy Oplakanets, Herr Kaste
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+'''Record digests of the arguments of calls instead of the arguments.
+
+A mock created with ``fingerprint=True`` doesn't keep the (possibly huge)
+arguments it gets called with, but a `Fingerprint` of each: a digest of
+its content, plus its type and length, and for arrays their shape and
+dtype.  A fingerprint equals every value with the same digest, so
+verifying with concrete values works as before.  Matchers need the real
+value though, and raise, except for `ANY` and `eq`.
+
+We only take fingerprints of values whose digest agrees with their
+equality: strings, everything which supports the buffer protocol
+(`bytes`, `bytearray`, `array`, numpy arrays etc.), and lists, tuples,
+sets and dicts of these and of numbers.  Buffers are hashed in place
+through a `memoryview`, t.i. without copying them.  Numbers, `None`, all
+other objects, and values smaller than `MIN_SIZE` we keep as they are;
+they don't pin much memory, and stay readable in error messages.
+'''
+
+from __future__ import annotations
+from hashlib import blake2b
+
+from . import matchers
+
+from typing import Any
+
+__all__ = ['Fingerprint', 'take', 'take_all', 'wanted']
+
+DIGEST_SIZE = 16
+#: Values which digest fewer bytes than this we keep as they are.
+MIN_SIZE = 256
+_SCALARS = (int, float, complex, type(None))
+
+
+class Fingerprint(object):
+    """Stands in for an argument a mock did not keep."""
+    __slots__ = ('type', 'digest', 'length', 'shape', 'dtype')
+
+    # Let numpy hand comparisons with arrays over to our `__eq__`.
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        type: type,
+        digest: bytes,
+        length: int | None = None,
+        shape: tuple | None = None,
+        dtype: str | None = None
+    ) -> None:
+        self.type = type
+        self.digest = digest
+        self.length = length
+        self.shape = shape
+        self.dtype = dtype
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Fingerprint):
+            other = take(other)
+            if not isinstance(other, Fingerprint):
+                return NotImplemented
+        return self.digest == other.digest
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __repr__(self):
+        details = [self.type.__name__]
+        if self.shape is not None:
+            details.append('shape=%s' % (self.shape,))
+        elif self.length is not None:
+            details.append('len=%s' % self.length)
+        if self.dtype is not None:
+            details.append('dtype=%s' % self.dtype)
+        details.append('digest=%s' % self.digest.hex()[:12])
+        return '<%s>' % ' '.join(details)
+
+
+class _Undigestable(Exception):
+    pass
+
+
+def take(value: Any) -> Any:
+    """Return the fingerprint of `value`, or `value` if we keep it as is."""
+    if isinstance(value, _SCALARS) or isinstance(value, Fingerprint):
+        return value
+    if isinstance(value, (str, bytes)) and len(value) < MIN_SIZE:
+        return value
+    hash_ = _Hash()
+    try:
+        _feed(hash_, value)
+    except (_Undigestable, RecursionError):
+        return value
+    if hash_.size < MIN_SIZE:
+        return value
+
+    try:
+        length = len(value)
+    except TypeError:
+        length = None
+    shape = getattr(value, 'shape', None)
+    dtype = getattr(value, 'dtype', None)
+    return Fingerprint(
+        type(value), hash_.digest(), length,
+        tuple(shape) if shape is not None else None,
+        str(dtype) if dtype is not None else None)
+
+
+def take_all(params: tuple, named_params: dict) -> tuple[tuple, dict]:
+    """Take the fingerprints of the arguments of a call."""
+    return (
+        tuple(take(p) for p in params),
+        {key: take(value) for key, value in named_params.items()}
+    )
+
+
+def wanted(params: tuple, named_params: dict) -> tuple[tuple, dict]:
+    """Prepare the arguments of a verification to match fingerprints.
+
+    Values we take the fingerprint of once, instead of on each compare,
+    but print them as the user wrote them.  Matchers raise if they get a
+    fingerprint, see `_NeedsValue`.
+    """
+    def prepare(p):
+        if isinstance(p, matchers.Matcher):
+            return _NeedsValue(p)
+        fingerprint = take(p)
+        if fingerprint is p:
+            return p
+        return _Wanted(fingerprint, p)
+
+    return (
+        tuple(prepare(p) for p in params),
+        {key: prepare(value) for key, value in named_params.items()}
+    )
+
+
+class _Wanted(Fingerprint):
+    """The fingerprint of a value of a verification."""
+    __slots__ = ('value',)
+
+    def __init__(self, fingerprint: Fingerprint, value: Any) -> None:
+        super().__init__(
+            fingerprint.type, fingerprint.digest, fingerprint.length,
+            fingerprint.shape, fingerprint.dtype)
+        self.value = value
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class _NeedsValue(matchers.Matcher, matchers.Capturing):
+    def __init__(self, matcher: matchers.Matcher) -> None:
+        self.matcher = matcher
+
+    def matches(self, arg):
+        matcher = self.matcher
+        if not isinstance(arg, Fingerprint):
+            return matcher.matches(arg)
+
+        if isinstance(matcher, matchers.Any):
+            return (
+                not matcher.wanted_type
+                or issubclass(arg.type, matcher.wanted_type)
+            )
+        if isinstance(matcher, (matchers.Eq, matchers.Neq)):
+            # These compare with `==`, t.i. by digest.
+            return matcher.matches(arg)
+        raise matchers.MatcherError(
+            "%r needs the real value, but the mock only kept a fingerprint "
+            "of it: %r" % (matcher, arg))
+
+    def capture_value(self, value):
+        if isinstance(self.matcher, matchers.Capturing):
+            self.matcher.capture_value(value)
+
+    def forget_values(self):
+        if isinstance(self.matcher, matchers.Capturing):
+            self.matcher.forget_values()
+
+    def __repr__(self):
+        return repr(self.matcher)
+
+
+class _Hash(object):
+    """A digest which also counts how many bytes it got."""
+    __slots__ = ('_hash', 'size')
+
+    def __init__(self) -> None:
+        self._hash = blake2b(digest_size=DIGEST_SIZE)
+        self.size = 0
+
+    def update(self, data: Any) -> None:
+        self._hash.update(data)
+        self.size += data.nbytes if isinstance(data, memoryview) \
+            else len(data)
+
+    def absorb(self, other: _Hash) -> None:
+        self._hash.update(other.digest())
+        self.size += other.size
+
+    def digest(self) -> bytes:
+        return self._hash.digest()
+
+
+def _feed(hash_: _Hash, value: Any) -> None:  # noqa: C901 (too complex)
+    # Values which are equal must feed the same bytes, e.g. `1 == 1.0`.
+    # Containers prefix their size, so that `[[1], 2]` and `[[1, 2]]`
+    # differ.
+    if isinstance(value, str):
+        data = value.encode('utf-8', 'surrogatepass')
+        hash_.update(b's%d;' % len(data))
+        hash_.update(data)
+    elif isinstance(value, (int, type(None))):
+        hash_.update(b'i%d;' % value if value is not None else b'n;')
+    elif isinstance(value, float):
+        if value.is_integer():
+            hash_.update(b'i%d;' % value)
+        else:
+            hash_.update(b'f%r;' % value)
+    elif isinstance(value, complex):
+        if value.imag == 0:
+            _feed(hash_, value.real)
+        else:
+            hash_.update(b'c%r;' % value)
+    elif isinstance(value, (list, tuple)):
+        hash_.update(b'%s%d;' % (
+            b'l' if isinstance(value, list) else b't', len(value)))
+        for item in value:
+            _feed(hash_, item)
+    elif isinstance(value, dict):
+        hash_.update(b'd%d;' % len(value))
+        for item_hash in sorted(
+            (_hash_of(key, item) for key, item in value.items()),
+            key=_Hash.digest
+        ):
+            hash_.absorb(item_hash)
+    elif isinstance(value, (set, frozenset)):
+        hash_.update(b'e%d;' % len(value))
+        for item_hash in sorted(
+            (_hash_of(item) for item in value), key=_Hash.digest
+        ):
+            hash_.absorb(item_hash)
+    else:
+        _feed_buffer(hash_, value)
+
+
+def _feed_buffer(hash_: _Hash, value: Any) -> None:
+    try:
+        view = memoryview(value)
+    except (TypeError, ValueError):
+        # Not a buffer, or e.g. an array of Python objects
+        raise _Undigestable()
+
+    with view:
+        hash_.update(b'b%s;%r;' % (view.format.encode(), view.shape))
+        # Hash contiguous buffers in place; the others need a copy.
+        hash_.update(view if view.c_contiguous else view.tobytes())
+
+
+def _hash_of(*values: Any) -> _Hash:
+    hash_ = _Hash()
+    for value in values:
+        _feed(hash_, value)
+    return hash_
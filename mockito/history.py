@@ -0,0 +1,597 @@
+# Copyright (c) 2008-2016 Szczepan Faber, Serhiy Oplakanets, Herr Kaste
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+'''Keep the invocations a mock records.
+
+By default, a mock keeps all of them, in order, in an `InvocationLog`.  For
+mocks in long running loops, e.g. heartbeats or polling clients, that grows
+without limit.  A `BoundedLog` keeps only the latest `history` invocations,
+like a ring buffer, but still counts all calls per method.  It can also
+guard against runaway loops: once a mock recorded `max_invocations` calls,
+the next one raises.  With ``history='counts'``, a `CountingLog` only
+counts how often each method was called with which arguments, t.i. it
+needs memory for each distinct call, but not for each call.  With
+``history='disk'``, a `SpillLog` writes the arguments of all invocations
+to a temporary file, and reads them back through an `mmap` when we
+verify.
+
+Pass `history` and `max_invocations` to `mock()` or `spy()`, or set the
+environment variables `MOCKITO_HISTORY` and `MOCKITO_MAX_INVOCATIONS` to
+apply them to all mocks.  We read them only once, when we create the
+first log, as looking them up for every new mock would double the time
+`mock()` takes.
+'''
+
+from __future__ import annotations
+import io
+import mmap
+import os
+import pickle
+import tempfile
+import weakref
+from array import array
+from collections import deque
+
+from .invocation import InvocationError, SpilledInvocation
+
+from typing import (
+    IO, TYPE_CHECKING, Any, Iterable, Iterator, NoReturn, Union)
+
+if TYPE_CHECKING:
+    from .invocation import MatchingInvocation, RealInvocation
+    from .mocking import Mock
+
+__all__ = [
+    'InvocationLog', 'BoundedLog', 'CountingLog', 'SpillLog', 'CombinedLog',
+    'new_log']
+
+HISTORY_ENV_VAR = 'MOCKITO_HISTORY'
+MAX_INVOCATIONS_ENV_VAR = 'MOCKITO_MAX_INVOCATIONS'
+COUNTS = 'counts'
+DISK = 'disk'
+
+
+class InvocationLog(list):
+    """All invocations of a mock, in order."""
+    __slots__ = ()
+    #: Whether we know in which order the invocations happened
+    ordered = True
+
+    def match(
+        self, wanted: MatchingInvocation
+    ) -> tuple[list[RealInvocation], int, bool]:
+        """Return the invocations `wanted` matches, and how many calls.
+
+        The count is exact if the flag is set, otherwise it is only a lower
+        bound, as we forgot some of the invocations.
+        """
+        matched = [
+            invocation for invocation in self if wanted.matches(invocation)]
+        return matched, len(matched), True
+
+
+class BoundedLog(deque):
+    """The latest `maxlen` invocations of a mock, and the count of all."""
+    ordered = True
+
+    def __init__(
+        self,
+        maxlen: int | None = None,
+        max_invocations: int | None = None
+    ) -> None:
+        super().__init__(maxlen=maxlen)
+        self.max_invocations = max_invocations
+        #: The number of all invocations, by method name
+        self.totals: dict[str, int] = {}
+        self.total = 0
+
+    def append(self, invocation: RealInvocation) -> None:
+        if self.total == self.max_invocations:
+            _refuse(invocation, self.total)
+
+        method_name = invocation.method_name
+        self.totals[method_name] = self.totals.get(method_name, 0) + 1
+        self.total += 1
+        super().append(invocation)
+
+    def match(
+        self, wanted: MatchingInvocation
+    ) -> tuple[list[RealInvocation], int, bool]:
+        """Return the invocations `wanted` matches, and how many calls.
+
+        The count is exact if the flag is set, otherwise it is only a lower
+        bound, as we forgot some of the invocations.
+        """
+        method_name = wanted.method_name
+        matched = []
+        kept = 0
+        for invocation in self:
+            if invocation.method_name == method_name:
+                kept += 1
+                if wanted.matches(invocation):
+                    matched.append(invocation)
+
+        total = self.totals.get(method_name, 0)
+        if wanted.matches_any_arguments:
+            return matched, total, True
+        return matched, len(matched), kept == total
+
+
+class CountingLog(object):
+    """How often a mock was called with which arguments.
+
+    For each distinct call, we keep its first invocation and count the
+    calls.  Arguments which are not hashable are compared with the
+    distinct ones of their method one by one.  We don't know the order of
+    the calls.
+    """
+    ordered = False
+
+    def __init__(self, max_invocations: int | None = None) -> None:
+        self.max_invocations = max_invocations
+        self.total = 0
+        #: The first invocation of each distinct call and how often it
+        #: happened, by method name and arguments
+        self._counts: dict[str, dict[tuple, list]] = {}
+        self._unhashable: dict[str, list[list]] = {}
+
+    def append(self, invocation: RealInvocation) -> None:
+        if self.total == self.max_invocations:
+            _refuse(invocation, self.total)
+        self.total += 1
+
+        method_name = invocation.method_name
+        params, named_params = invocation.params, invocation.named_params
+        try:
+            counts = self._counts[method_name]
+        except KeyError:
+            counts = self._counts[method_name] = {}
+        # Arguments of different types may be equal, e.g. `1 == 1.0`, but
+        # matchers like `any(float)` tell them apart.
+        types = tuple(map(type, params))
+        try:
+            key = (params, types, frozenset(
+                (name, value, type(value))
+                for name, value in named_params.items()
+            )) if named_params else (params, types)
+            entry = counts.get(key)
+        except TypeError:
+            self._append_unhashable(invocation)
+            return
+
+        if entry is None:
+            counts[key] = [invocation, 1]
+        else:
+            entry[1] += 1
+
+    def _append_unhashable(self, invocation: RealInvocation) -> None:
+        entries = self._unhashable.setdefault(invocation.method_name, [])
+        types = _types_of(invocation)
+        for entry in entries:
+            first = entry[0]
+            if _types_of(first) != types:
+                continue
+            try:
+                same = (
+                    first.params == invocation.params
+                    and first.named_params == invocation.named_params
+                )
+            except Exception:
+                # e.g. numpy arrays don't tell if they are equal
+                continue
+            if same is True:
+                entry[1] += 1
+                return
+        entries.append([invocation, 1])
+
+    def _entries(self, method_name: str | None = None):
+        if method_name is not None:
+            yield from self._counts.get(method_name, {}).values()
+            yield from self._unhashable.get(method_name, ())
+            return
+
+        for counts in self._counts.values():
+            yield from counts.values()
+        for entries in self._unhashable.values():
+            yield from entries
+
+    def match(
+        self, wanted: MatchingInvocation
+    ) -> tuple[list[RealInvocation], int, bool]:
+        """Return the invocations `wanted` matches, and how many calls."""
+        matched = []
+        count = 0
+        for invocation, calls in self._entries(wanted.method_name):
+            if wanted.matches(invocation):
+                matched.append(invocation)
+                count += calls
+        return matched, count, True
+
+    def __iter__(self):
+        """Iterate over the first invocation of each distinct call."""
+        return (invocation for invocation, _ in self._entries())
+
+    def __len__(self) -> int:
+        return (
+            sum(len(counts) for counts in self._counts.values())
+            + sum(len(entries) for entries in self._unhashable.values()))
+
+    def __getitem__(self, index: int) -> RealInvocation:
+        return list(self)[index]
+
+
+def _types_of(invocation: RealInvocation) -> tuple[tuple, dict]:
+    return (
+        tuple(map(type, invocation.params)),
+        {name: type(value)
+         for name, value in invocation.named_params.items()}
+    )
+
+
+class SpillLog(object):
+    """All invocations of a mock, in order, with their arguments on disk.
+
+    We pickle the arguments of each call into a temporary file, opened on
+    the first call, and only keep its offset, method and flags in memory,
+    13 bytes per call.
+    Reading them back, we stream through an `mmap` of the file.
+
+    The arguments are copies, so objects which are only equal to
+    themselves, e.g. instances of plain classes, stay in memory and are
+    pickled by reference.  Calls with arguments we can't pickle at all
+    are kept in memory as they are.
+    """
+    ordered = True
+
+    def __init__(self, max_invocations: int | None = None) -> None:
+        self.max_invocations = max_invocations
+        self.total = 0
+        #: The temporary file, only opened on the first call, see `_open`
+        self._file: IO[bytes] | None = None
+        self._map: mmap.mmap | None = None
+        self._mock_ref: weakref.ref[Mock] | None = None
+
+        #: Where the record of each invocation starts; it ends where the
+        #: next one starts.
+        self._offsets = array('q')
+        self._size = 0
+        self._methods = array('I')
+        self._flags = bytearray()
+        self._method_names: list[str] = []
+        self._method_ids: dict[str, int] = {}
+        #: The objects we pickle by reference, by their id
+        self.objects: dict[int, object] = {}
+        self._pickler: _Pickler | None = None
+        self._unspilled: dict[int, RealInvocation] = {}
+        #: The latest invocation, as `expect` checks it off only after we
+        #: got it, see `_take_flags`.
+        self._latest: RealInvocation | None = None
+
+    def append(self, invocation: RealInvocation) -> None:
+        if self.total == self.max_invocations:
+            _refuse(invocation, self.total)
+        self.total += 1
+        if self._mock_ref is None:
+            self._mock_ref = weakref.ref(invocation.mock)
+        self._take_flags()
+
+        method_name = invocation.method_name
+        try:
+            method_id = self._method_ids[method_name]
+        except KeyError:
+            method_id = self._method_ids[method_name] = \
+                len(self._method_names)
+            self._method_names.append(method_name)
+
+        pickler = self._pickler or self._open()
+        pickler.has_references = False
+        flags = 0
+        try:
+            pickler.dump(
+                (invocation.params, invocation.named_params or None))
+        except Exception:
+            pickler.file.seek(self._size)
+            pickler.file.truncate()
+            self._unspilled[len(self._offsets)] = invocation
+        else:
+            if pickler.has_references:
+                flags = _HAS_REFERENCES
+        finally:
+            pickler.clear_memo()
+
+        self._offsets.append(self._size)
+        self._size = pickler.file.tell()
+        self._methods.append(method_id)
+        self._flags.append(flags)
+        self._latest = invocation
+
+    def _open(self) -> _Pickler:
+        # Most mocks never get called, so they shouldn't take a file
+        # descriptor for nothing.
+        file = self._file = tempfile.TemporaryFile(prefix='mockito-')
+        # Mocks drop their logs on `unstub` etc., so we close quietly then
+        weakref.finalize(self, file.close)
+        self._pickler = _Pickler(file, self.objects)
+        return self._pickler
+
+    def _take_flags(self) -> None:
+        invocation = self._latest
+        if invocation is None:
+            return
+
+        self._latest = None
+        index = len(self._offsets) - 1
+        if index not in self._unspilled:
+            self._flags[index] |= (
+                (invocation.verified and SpilledInvocation.VERIFIED)
+                | (invocation.verified_inorder
+                   and SpilledInvocation.VERIFIED_INORDER))
+
+    def _read(self, indexes: Iterable[int]) -> Iterator[RealInvocation]:
+        mock = self._mock_ref() if self._mock_ref else None
+        if mock is None:
+            return
+
+        self._take_flags()
+        mapped = self._mapped()
+        offsets, flags, unspilled = self._offsets, self._flags, self._unspilled
+        method_names, methods = self._method_names, self._methods
+        last = len(offsets) - 1
+        for index in indexes:
+            if index in unspilled:
+                yield unspilled[index]
+                continue
+
+            assert mapped is not None
+            record = mapped[
+                offsets[index]:
+                offsets[index + 1] if index < last else len(mapped)]
+            if flags[index] & _HAS_REFERENCES:
+                params, named_params = \
+                    _Unpickler(io.BytesIO(record), self.objects).load()
+            else:
+                params, named_params = pickle.loads(record)
+            yield SpilledInvocation(
+                mock, method_names[methods[index]],
+                params, named_params or {}, flags, index)
+
+    def _mapped(self) -> mmap.mmap | None:
+        # We grow the map with the file.  Readers still streaming through
+        # an older, smaller map keep it open.
+        if self._map is not None and len(self._map) == self._size:
+            return self._map
+        file = self._file
+        if self._size and file is not None:
+            file.flush()
+            self._map = mmap.mmap(
+                file.fileno(), self._size, access=mmap.ACCESS_READ)
+        return self._map
+
+    def match(
+        self, wanted: MatchingInvocation
+    ) -> tuple[list[RealInvocation], int, bool]:
+        """Return the invocations `wanted` matches, and how many calls."""
+        method_id = self._method_ids.get(wanted.method_name)
+        if method_id is None:
+            return [], 0, True
+
+        methods = self._methods
+        matched = [
+            invocation
+            for invocation in self._read(
+                i for i in range(len(methods)) if methods[i] == method_id)
+            if wanted.matches(invocation)
+        ]
+        return matched, len(matched), True
+
+    def __iter__(self) -> Iterator[RealInvocation]:
+        return self._read(range(len(self._offsets)))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> RealInvocation:
+        index = range(len(self._offsets))[index]
+        for invocation in self._read((index,)):
+            return invocation
+        raise IndexError(index)
+
+
+#: A flag of `SpillLog` records, in addition to the ones of the invocation
+_HAS_REFERENCES = 4
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file: Any, objects: dict[int, object]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.file = file
+        self.objects = objects
+        self.has_references = False
+
+    def persistent_id(self, obj: object) -> int | None:
+        # Copies of objects which only equal themselves would not match
+        # anymore.  Functions, classes etc. pickle by reference anyway.
+        if type(obj).__eq__ is _object_eq and obj is not None:
+            key = id(obj)
+            self.objects[key] = obj
+            self.has_references = True
+            return key
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: Any, objects: dict[int, object]) -> None:
+        super().__init__(file)
+        self.objects = objects
+
+    def persistent_load(self, key: int) -> object:
+        return self.objects[key]
+
+
+_object_eq = object.__eq__
+
+
+class CombinedLog(object):
+    """The invocations of several mocks, one log after the other.
+
+    We never copy the invocations, but ask the current log of each mock,
+    as e.g. `forget_invocations` replaces them.
+    """
+    __slots__ = ('mocks',)
+
+    def __init__(self, mocks: list[Mock]) -> None:
+        self.mocks = mocks
+
+    def match(
+        self, wanted: MatchingInvocation
+    ) -> tuple[list[RealInvocation], int, bool]:
+        all_matched: list[RealInvocation] = []
+        all_count, all_exact = 0, True
+        for m in self.mocks:
+            matched, count, exact = m.invocations.match(wanted)
+            all_matched.extend(matched)
+            all_count += count
+            all_exact = all_exact and exact
+        return all_matched, all_count, all_exact
+
+    def __iter__(self) -> Iterator[RealInvocation]:
+        return (invocation for m in self.mocks for invocation in m.invocations)
+
+    def __len__(self) -> int:
+        return sum(len(m.invocations) for m in self.mocks)
+
+    def __getitem__(self, index: int) -> RealInvocation:
+        index = range(len(self))[index]
+        for m in self.mocks:
+            log = m.invocations
+            if index < len(log):
+                return log[index]
+            index -= len(log)
+        raise IndexError(index)
+
+    @property
+    def ordered(self) -> bool:
+        return all(m.invocations.ordered for m in self.mocks)
+
+
+def _refuse(invocation: RealInvocation, total: int) -> NoReturn:
+    raise InvocationError(
+        "\n%s got more than %s calls; the last one of '%s'.  Is it called "
+        "in a runaway loop?  Otherwise raise its `max_invocations`."
+        % (invocation.mock.mocked_obj, total, invocation.method_name))
+
+
+Log = Union[InvocationLog, BoundedLog, CountingLog, SpillLog]
+
+
+
+def _check_history(history: int | str | None) -> None:
+    if history in (None, COUNTS, DISK):
+        return
+    if (
+        isinstance(history, bool)
+        or not isinstance(history, int)
+        or history < 1
+    ):
+        raise ValueError(
+            "history must keep at least one invocation, or be 'counts' "
+            "or 'disk'")
+
+
+def _check_max_invocations(max_invocations: int | None) -> None:
+    if max_invocations is None:
+        return
+    if (
+        isinstance(max_invocations, bool)
+        or not isinstance(max_invocations, int)
+        or max_invocations < 1
+    ):
+        raise ValueError(
+            'max_invocations must be a whole number of at least one')
+
+
+def _from_env(name: str) -> int | str | None:
+    value = os.environ.get(name)
+    if not value:
+        return None
+    history = int(value) if value.isdigit() else value
+    try:
+        _check_history(history)
+    except ValueError as e:
+        raise ValueError('%s=%r: %s' % (name, value, e)) from None
+    return history
+
+
+def _int_from_env(name: str) -> int | None:
+    value = os.environ.get(name)
+    if not value:
+        return None
+    if not value.isdigit():
+        raise ValueError(
+            '%s=%r: must be a whole number, e.g. 1000000' % (name, value))
+    max_invocations = int(value)
+    try:
+        _check_max_invocations(max_invocations)
+    except ValueError as e:
+        raise ValueError('%s=%r: %s' % (name, value, e)) from None
+    return max_invocations
+
+
+#: The `history` and `max_invocations` from the environment, once read
+_defaults: tuple[int | str | None, int | None] | None = None
+
+
+def _read_defaults() -> tuple[int | str | None, int | None]:
+    global _defaults
+    # A bad value raises on each new mock, until it is fixed.
+    _defaults = (
+        _from_env(HISTORY_ENV_VAR), _int_from_env(MAX_INVOCATIONS_ENV_VAR))
+    return _defaults
+
+
+def new_log(
+    history: int | str | None = None,
+    max_invocations: int | None = None
+) -> Log:
+    """Return an empty log which keeps the latest `history` invocations.
+
+    `history` may also be ``'counts'`` to only count the calls, or
+    ``'disk'`` to keep their arguments in a temporary file.  Omitted
+    values default to the environment variables, and are otherwise
+    unlimited.
+    """
+    default_history, default_max_invocations = \
+        _defaults or _read_defaults()
+    if history is None:
+        history = default_history
+    if max_invocations is None:
+        max_invocations = default_max_invocations
+
+    if history is None and max_invocations is None:
+        return InvocationLog()
+
+    _check_max_invocations(max_invocations)
+    _check_history(history)
+    if history == COUNTS:
+        return CountingLog(max_invocations)
+    if history == DISK:
+        return SpillLog(max_invocations)
+    # `_check_history` made sure `history` is a positive `int` or None
+    return BoundedLog(history, max_invocations)  # type: ignore[arg-type]
@@ -21,11 +21,14 @@
 from __future__ import annotations
 from abc import ABC
 import os
+import functools
 import inspect
 import operator
+import weakref
 from collections import deque
+from time import perf_counter_ns
 
-from . import matchers, signature
+from . import fingerprints, matchers, signature, timing
 from . import verification as verificationModule
 from .utils import contains_strict
 
@@ -37,6 +40,10 @@ if TYPE_CHECKING:
     T = TypeVar('T')
 
 
+#: The `named_params` of invocations called without any; never mutated
+_NO_NAMED_PARAMS: dict[str, Any] = {}
+
+
 class InvocationError(AttributeError):
     pass
 
@@ -51,17 +58,21 @@ __tracebackhide__ = operator.methodcaller(
 
 
 class Invocation(object):
+    # Mocks may record millions of invocations, so all of them are slotted.
+    # The subclasses decide how to refer to the `mock`.
+    __slots__ = ('method_name', 'params', 'named_params')
+
     def __init__(self, mock: Mock, method_name: str) -> None:
-        self.mock = mock
         self.method_name = method_name
-        self.strict = mock.strict
 
         self.params: tuple[Any, ...] = ()
-        self.named_params: dict[str, Any] = {}
+        self.named_params: dict[str, Any] = _NO_NAMED_PARAMS
 
     def _remember_params(self, params: tuple, named_params: dict) -> None:
         self.params = params
-        self.named_params = named_params
+        # Python passes a new, empty dict for each call without keyword
+        # arguments; we don't keep these around.
+        self.named_params = named_params or _NO_NAMED_PARAMS
 
     def __repr__(self):
         args = [repr(p) if p is not Ellipsis else '...'
@@ -74,54 +85,76 @@ class Invocation(object):
 
 
 class RealInvocation(Invocation, ABC):
+    # The mock keeps its `invocations`, so a strong reference back would
+    # make each of them a reference cycle, only freed by the cyclic GC.
+    __slots__ = ('_mock_ref', 'verified', 'verified_inorder')
+
     def __init__(self, mock: Mock, method_name: str) -> None:
         super(RealInvocation, self).__init__(mock, method_name)
+        # Python hands out the same `ref` for every call, t.i. this does
+        # not allocate anything per invocation.
+        self._mock_ref = weakref.ref(mock)
         self.verified = False
         self.verified_inorder = False
 
+    @property
+    def mock(self) -> Mock:
+        return self._mock_ref()  # type: ignore[return-value]
 
-class RememberedInvocation(RealInvocation):
-    def ensure_mocked_object_has_method(self, method_name: str) -> None:
-        if not self.mock.has_method(method_name):
-            raise InvocationError(
-                "You tried to call a method '%s' the object (%s) doesn't "
-                "have." % (method_name, self.mock.mocked_obj))
-
-    def ensure_signature_matches(
-        self, method_name: str, args: tuple, kwargs: dict
-    ) -> None:
-        sig = self.mock.get_signature(method_name)
-        if not sig:
-            return
 
-        signature.match_signature(sig, args, kwargs)
+class RememberedInvocation(RealInvocation):
+    __slots__ = ()
 
     def __call__(self, *params: Any, **named_params: Any) -> Any | None:
-        if self.mock.eat_self(self.method_name):
+        mock = self.mock
+        plan = mock.call_plan(self.method_name)
+        if plan.eat_self:
             params_without_first_arg = params[1:]
         else:
             params_without_first_arg = params
-        if self.strict:
-            self.ensure_mocked_object_has_method(self.method_name)
-            self.ensure_signature_matches(
-                self.method_name, params_without_first_arg, named_params)
+        if plan.strict:
+            if not plan.has_method:
+                raise InvocationError(
+                    "You tried to call a method '%s' the object (%s) doesn't "
+                    "have." % (self.method_name, mock.mocked_obj))
+            if plan.signature:
+                signature.match_signature(
+                    plan.signature, params_without_first_arg, named_params)
+
+        return self.dispatch(
+            params, params_without_first_arg, named_params, plan.strict)
 
+    def dispatch(
+        self,
+        params: tuple,
+        params_without_first_arg: tuple,
+        named_params: dict,
+        strict: bool
+    ) -> Any | None:
+        """Remember an already validated call and answer it.
+
+        `params` are passed on to the answer, `params_without_first_arg`
+        are the ones we remember (and match).  See `trampoline`.
+        """
+        mock = self.mock
         self._remember_params(params_without_first_arg, named_params)
-        self.mock.remember(self)
 
-        for matching_invocation in self.mock.stubbed_invocations:
+        stubbed_invocations = mock.stubbed_invocations_for(self.method_name)
+        # We match the stubs before the mock remembers us, as it may then
+        # replace our arguments with their fingerprints.  It still has to
+        # remember us before the answer runs, which may call it again.
+        for matching_invocation in stubbed_invocations:
             if matching_invocation.matches(self):
-                matching_invocation.should_answer(self)
-                matching_invocation.capture_arguments(self)
+                try:
+                    matching_invocation.should_answer(self)
+                    matching_invocation.capture_arguments(self)
+                finally:
+                    mock.remember(self)
                 return matching_invocation.answer_first(
                     *params, **named_params)
 
-        if self.strict:
-            stubbed_invocations = [
-                invoc
-                for invoc in self.mock.stubbed_invocations
-                if invoc.method_name == self.method_name
-            ]
+        mock.remember(self)
+        if strict:
             raise InvocationError(
                 """
 Called but not expected:
@@ -147,11 +180,36 @@ Stubbed invocations are:
 class RememberedProxyInvocation(RealInvocation):
     """Remember params and proxy to method of original object.
 
-    Calls method on original object and returns it's return value.
+    Calls method on original object and returns it's return value.  The
+    caller may pass the already resolved `method`, otherwise we look it up
+    on the original object.
     """
+    __slots__ = ('method',)
+
+    def __init__(
+        self, mock: Mock, method_name: str, method: Callable | None = None
+    ) -> None:
+        super(RememberedProxyInvocation, self).__init__(mock, method_name)
+        self.method = method
+
     def __call__(self, *params: Any, **named_params: Any) -> Any:
+        mock = self.mock
         self._remember_params(params, named_params)
-        self.mock.remember(self)
+        mock.remember(self)
+        method = self.method
+        if method is None:
+            method = self.resolve_method()
+        if mock.timings is None:
+            return method(*params, **named_params)
+
+        record = mock.histogram_for(self.method_name).record
+        start = perf_counter_ns()
+        try:
+            return method(*params, **named_params)
+        finally:
+            record(perf_counter_ns() - start)
+
+    def resolve_method(self) -> Callable:
         obj = self.mock.spec
         try:
             method = getattr(obj, self.method_name)
@@ -159,7 +217,72 @@ class RememberedProxyInvocation(RealInvocation):
             raise AttributeError(
                 "You tried to call method '%s' which '%s' instance does not "
                 "have." % (self.method_name, obj))
-        return method(*params, **named_params)
+        return method
+
+
+
+class ObservedInvocation(RealInvocation):
+    """Remember a call we only observed, see `monitoring`."""
+    __slots__ = ()
+
+    def __init__(
+        self,
+        mock: Mock,
+        method_name: str,
+        params: tuple,
+        named_params: dict[str, Any]
+    ) -> None:
+        super(ObservedInvocation, self).__init__(mock, method_name)
+        self._remember_params(params, named_params)
+
+
+class SpilledInvocation(ObservedInvocation):
+    """Remember a call read back from a `history.SpillLog`.
+
+    The log creates these on demand, so their flags live in the log.
+    """
+    __slots__ = ('_flags', '_index')
+
+    VERIFIED = 1
+    VERIFIED_INORDER = 2
+
+    def __init__(
+        self,
+        mock: Mock,
+        method_name: str,
+        params: tuple,
+        named_params: dict[str, Any],
+        flags: bytearray,
+        index: int
+    ) -> None:
+        # We don't call `super`, as `RealInvocation` would reset the flags.
+        self.method_name = method_name
+        self._remember_params(params, named_params)
+        self._mock_ref = weakref.ref(mock)
+        self._flags = flags
+        self._index = index
+
+    @property
+    def verified(self) -> bool:
+        return bool(self._flags[self._index] & self.VERIFIED)
+
+    @verified.setter
+    def verified(self, value: bool) -> None:
+        self._set_flag(self.VERIFIED, value)
+
+    @property
+    def verified_inorder(self) -> bool:
+        return bool(self._flags[self._index] & self.VERIFIED_INORDER)
+
+    @verified_inorder.setter
+    def verified_inorder(self, value: bool) -> None:
+        self._set_flag(self.VERIFIED_INORDER, value)
+
+    def _set_flag(self, flag: int, value: bool) -> None:
+        if value:
+            self._flags[self._index] |= flag
+        else:
+            self._flags[self._index] &= ~flag
 
 
 
@@ -173,6 +296,14 @@ class MatchingInvocation(Invocation, ABC):
     consume multiple arguments of the (other) `invocation`.
 
     """
+    __slots__ = (
+        'mock', 'matches_any_arguments', '_params_matcher',
+        '_params_matcher_compare')
+
+    def __init__(self, mock: Mock, method_name: str) -> None:
+        super(MatchingInvocation, self).__init__(mock, method_name)
+        self.mock = mock
+
     @staticmethod
     def compare(p1, p2):
         if isinstance(p1, matchers.Matcher):
@@ -201,6 +332,7 @@ class MatchingInvocation(Invocation, ABC):
                     continue
 
                 p1.capture_value(p2)
+                self.mock.add_captor(p1)
 
         for key, p1 in self.named_params.items():
             if isinstance(p1, matchers.Capturing):
@@ -210,6 +342,7 @@ class MatchingInvocation(Invocation, ABC):
                     continue
 
                 p1.capture_value(p2)
+                self.mock.add_captor(p1)
 
 
     def _remember_params(self, params: tuple, named_params: dict) -> None:
@@ -236,52 +369,126 @@ class MatchingInvocation(Invocation, ABC):
         self.params = tuple(wrap(p) for p in params)
         self.named_params = {k: wrap(v) for k, v in named_params.items()}
 
+        #: A sole `Ellipsis` matches every call; `matches` then only has to
+        #: compare the method name.
+        self.matches_any_arguments = (
+            len(params) == 1 and params[0] is Ellipsis and not named_params
+        )
+        self._compile_params_matcher(self.compare)
+
     # Note: matches(a, b) does not imply matches(b, a) because
     # the left side might contain wildcards (like Ellipsis) or matchers.
     # In its current form the right side is a concrete call signature.
-    def matches(self, invocation: Invocation) -> bool:  # noqa: C901, E501  (too complex)
+    def matches(self, invocation: Invocation) -> bool:
         if self.method_name != invocation.method_name:
             return False
 
-        for x, p1 in enumerate(self.params):
-            # assume Ellipsis is the last thing a user declares
-            if p1 is Ellipsis:
-                return True
+        if self.matches_any_arguments:
+            return True
 
-            if p1 is matchers.ARGS_SENTINEL:
-                break
+        # `compare` is the official hook to customize how arguments are
+        # compared (e.g. for numpy arrays), so it can be patched any time.
+        compare = self.compare
+        if compare is not self._params_matcher_compare:
+            self._compile_params_matcher(compare)
+        return self._params_matcher(invocation.params, invocation.named_params)
 
-            try:
-                p2 = invocation.params[x]
-            except IndexError:
-                return False
+    def _compile_params_matcher(self, compare: Callable) -> None:
+        self._params_matcher = compile_params_matcher(
+            self.params, self.named_params, compare)
+        self._params_matcher_compare = compare
 
-            if not self.compare(p1, p2):
-                return False
-        else:
-            if len(self.params) != len(invocation.params):
-                return False
 
-        for key, p1 in sorted(
-            self.named_params.items(),
-            key=lambda k_v: 1 if k_v[0] is matchers.KWARGS_SENTINEL else 0
-        ):
-            if key is matchers.KWARGS_SENTINEL:
-                break
+_default_compare = MatchingInvocation.compare
 
-            try:
-                p2 = invocation.named_params[key]
-            except KeyError:
-                return False
 
-            if not self.compare(p1, p2):
+def compile_params_matcher(  # noqa: C901 (too complex)
+    params: tuple,
+    named_params: dict,
+    compare: Callable[[Any, Any], bool] = _default_compare
+) -> Callable[[tuple, dict], bool]:
+    """Compile the argument pattern of a stub or verification.
+
+    Returns a predicate `(args, kwargs) -> bool` which answers if a concrete
+    call matches the pattern.  All interpretation of the pattern (the
+    `Ellipsis`, `*args` and `**kwargs` placeholders, matchers vs. plain
+    values) happens once here, and not on every call.
+    """
+    positional = []
+    consume_rest = False
+    skip_named = False
+    for p in params:
+        # assume Ellipsis is the last thing a user declares
+        if p is Ellipsis:
+            consume_rest = skip_named = True
+            break
+        if p is matchers.ARGS_SENTINEL:
+            consume_rest = True
+            break
+        positional.append(p)
+
+    if compare is _default_compare:
+        def is_value(p):
+            return not isinstance(p, matchers.Matcher)
+
+        def predicate_for(p):
+            return p.matches
+    else:
+        def is_value(p):
+            return False
+
+        def predicate_for(p):
+            return functools.partial(compare, p)
+
+    arity = len(positional)
+    values = tuple(
+        (x, p) for x, p in enumerate(positional) if is_value(p)
+    )
+    predicates = tuple(
+        (x, predicate_for(p))
+        for x, p in enumerate(positional) if not is_value(p)
+    )
+
+    consume_named_rest = matchers.KWARGS_SENTINEL in named_params
+    named = [
+        (key, p) for key, p in named_params.items()
+        if key is not matchers.KWARGS_SENTINEL
+    ]
+    named_arity = len(named)
+    named_values = tuple((key, p) for key, p in named if is_value(p))
+    named_predicates = tuple(
+        (key, predicate_for(p)) for key, p in named if not is_value(p)
+    )
+
+    def params_match(args: tuple, kwargs: dict) -> bool:
+        if len(args) != arity and not (consume_rest and len(args) >= arity):
+            return False
+        for x, p in values:
+            if p != args[x]:
                 return False
-        else:
-            if len(self.named_params) != len(invocation.named_params):
+        for x, predicate in predicates:
+            if not predicate(args[x]):
                 return False
+        if skip_named:
+            return True
 
+        if len(kwargs) != named_arity and not (
+            consume_named_rest and len(kwargs) >= named_arity
+        ):
+            return False
+        try:
+            for key, p in named_values:
+                if p != kwargs[key]:
+                    return False
+            for key, predicate in named_predicates:
+                if not predicate(kwargs[key]):
+                    return False
+        except KeyError:
+            return False
         return True
 
+    return params_match
+
 
 class VerifiableInvocation(MatchingInvocation):
     """
@@ -302,6 +509,8 @@ class VerifiableInvocation(MatchingInvocation):
     call.  But the `__call__` is essentially virtual and can contain
     placeholders and matchers.
     """
+    __slots__ = ('verification',)
+
     def __init__(
         self,
         mock: Mock,
@@ -312,14 +521,25 @@ class VerifiableInvocation(MatchingInvocation):
         self.verification = verification
 
     def __call__(self, *params: Any, **named_params: Any) -> None:
+        normalizers = self.mock.normalizers
+        if normalizers and self.method_name in normalizers:
+            params, named_params = \
+                normalizers[self.method_name](params, named_params)
+        if self.mock.fingerprint:
+            params, named_params = fingerprints.wanted(params, named_params)
         self._remember_params(params, named_params)
-        matched_invocations = []
-        for invocation in self.mock.invocations:
-            if self.matches(invocation):
-                self.capture_arguments(invocation)
-                matched_invocations.append(invocation)
+        matched_invocations, actual_count, exact = \
+            self.mock.invocations.match(self)
+        for invocation in matched_invocations:
+            self.capture_arguments(invocation)
 
-        self.verification.verify(self, len(matched_invocations))
+        if exact or self._at_least(actual_count):
+            self.verification.verify(self, actual_count)
+        else:
+            raise verificationModule.VerificationError(
+                "\nCan't tell how often %s was invoked, as its mock only "
+                "kept its latest invocations.  Verify with `...` to count "
+                "all of its calls." % self)
 
         # check (real) invocations as verified
         for invocation in matched_invocations:
@@ -334,6 +554,18 @@ class VerifiableInvocation(MatchingInvocation):
                     stub.allow_zero_invocations = True
 
 
+    def _at_least(self, lower_bound: int) -> bool:
+        # Some invocations are gone, but if we've seen enough of them, an
+        # `atleast` verification passes anyway.
+        verification = self.verification
+        if isinstance(verification, verificationModule.InOrder):
+            verification = verification.original_verification
+        return (
+            isinstance(verification, verificationModule.AtLeast)
+            and lower_bound >= max(verification.wanted_count, 1)
+        )
+
+
 def verification_has_lower_bound_of_zero(
     verification: verificationModule.VerificationMode | None
 ) -> bool:
@@ -387,6 +619,9 @@ class StubbedInvocation(MatchingInvocation):
     there is no "new" keyword in Python.)
 
     """
+    __slots__ = (
+        'verification', 'strict', 'answers', 'used', 'allow_zero_invocations')
+
     def __init__(
         self,
         mock: Mock,
@@ -400,8 +635,7 @@ class StubbedInvocation(MatchingInvocation):
         #: The verification will be verified implicitly, while using this stub.
         self.verification = verification
 
-        if strict is not None:
-            self.strict = strict
+        self.strict = mock.strict if strict is None else strict
 
         self.answers = CompositeAnswer()
 
@@ -560,6 +794,10 @@ class AnswerSelector(object):
         ):
             answer = answer.__func__
 
+        mock = self.invocation.mock
+        if mock.timings is not None:
+            answer = timing.timed(
+                answer, mock.histogram_for(self.invocation.method_name))
         self.__then(answer)
         return self
 
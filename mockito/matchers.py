@@ -124,6 +124,10 @@ class Capturing(ABC):
     def capture_value(self, value):
         pass
 
+    def forget_values(self):
+        """Forget the captured values, e.g. on `reset`."""
+        pass
+
 
 class Any(Matcher):
     def __init__(self, wanted_type=None):
@@ -275,6 +279,9 @@ class ArgumentCaptor(Matcher, Capturing):
     def capture_value(self, value):
         self.all_values.append(value)
 
+    def forget_values(self):
+        self.all_values.clear()
+
     def __repr__(self):
         return "<ArgumentCaptor: matcher=%s values=%s>" % (
             repr(self.matcher), self.all_values,
@@ -19,7 +19,8 @@
 # THE SOFTWARE.
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+import weakref
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from .mocking import Mock
@@ -35,8 +36,22 @@ class MockRegistry:
     def __init__(self):
         self.mocks = IdentityMap()
 
-    def register(self, obj: object, mock: Mock) -> None:
-        self.mocks[obj] = mock
+    def register(self, obj: object, mock: Mock, weak: bool = False) -> None:
+        """Register `mock` for `obj`.
+
+        If `weak` is set, neither `obj` nor `mock` are kept alive by the
+        registry.  The entry vanishes as soon as `obj` gets garbage
+        collected.  This is only sound for objects which keep their `mock`
+        alive themselves, t.i. the dummies created by `mock()` and `spy()`.
+        """
+        if weak:
+            self.mocks.set_weakly(obj, mock)
+        else:
+            self.mocks[obj] = mock
+
+    def register_many(self, items: Iterable[tuple[object, Mock]]) -> None:
+        """Register each `(obj, mock)` pair of `items` in one go."""
+        self.mocks.update(items)
 
     def mock_for(self, obj: object) -> Mock | None:
         return self.mocks.get(obj, None)
@@ -59,36 +74,67 @@ class MockRegistry:
 
 
 # We have this dict like because we want non-hashable items in our registry.
+# Keys are indexed by their `id()`; we store the key alongside its value so
+# that it stays alive (and its `id()` cannot be reused) while it is
+# registered.  Weakly held entries store weak references instead, and drop
+# out of the map via the finalizer callback, before their `id()` can be
+# reused.
 class IdentityMap(object):
     def __init__(self):
-        self._store = []
+        self._store = {}
 
     def __setitem__(self, key, value):
-        self.remove(key)
-        self._store.append((key, value))
+        # Re-registering moves the key to the end, like removing and
+        # appending would.
+        self._store.pop(id(key), None)
+        self._store[id(key)] = (key, value)
+
+    def update(self, items):
+        store = self._store
+        for key, value in items:
+            store.pop(id(key), None)
+            store[id(key)] = (key, value)
+
+    def set_weakly(self, key, value):
+        key_id = id(key)
+        store = self._store
+
+        def forget(ref):
+            if store.get(key_id, (None,))[0] is ref:
+                del store[key_id]
+
+        store.pop(key_id, None)
+        store[key_id] = (weakref.ref(key, forget), weakref.ref(value))
+
+    def __len__(self):
+        return len(self._store)
 
     def remove(self, key):
-        self._store = [(k, v) for k, v in self._store if k is not key]
+        self._store.pop(id(key), None)
 
     def pop(self, key):
-        rv = self.get(key)
-        if rv is not None:
-            self.remove(key)
-            return rv
-        else:
-            raise KeyError()
+        try:
+            k, value = self._store.pop(id(key))
+        except KeyError:
+            raise KeyError(key)
+        return value() if type(k) is weakref.ref else value
 
     def get(self, key, default=None):
-        for k, value in self._store:
-            if k is key:
-                return value
-        return default
+        try:
+            k, value = self._store[id(key)]
+        except KeyError:
+            return default
+        return value() if type(k) is weakref.ref else value
 
     def values(self):
-        return [v for k, v in self._store]
+        values = (
+            value() if type(k) is weakref.ref else value
+            for k, value in self._store.values()
+        )
+        return [v for v in values if v is not None]
 
     def clear(self):
-        self._store[:] = []
+        self._store.clear()
 
 
 mock_registry = MockRegistry()
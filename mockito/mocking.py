@@ -21,14 +21,17 @@
 from __future__ import annotations
 import inspect
 import operator
+import weakref
 from collections import deque
 
-from . import invocation, signature, utils
+from . import (
+    fingerprints, history, invocation, matchers, signature, timing,
+    trampoline, utils)
 from .mock_registry import mock_registry
 
-from typing import Callable
+from typing import Any, Callable, NamedTuple
 
-__all__ = ['mock']
+__all__ = ['mock', 'mock_many', 'MockPool']
 
 __tracebackhide__ = operator.methodcaller(
     "errisinstance",
@@ -44,6 +47,10 @@ class _Dummy:
         return self.__getattr__('__call__')(*args, **kwargs)  # type: ignore[attr-defined]  # noqa: E501
 
 
+_NO_STUBS: deque[invocation.StubbedInvocation] = deque(maxlen=0)
+_MISSING = object()
+
+
 def remembered_invocation_builder(
     mock: Mock, method_name: str, *args, **kwargs
 ):
@@ -51,34 +58,96 @@ def remembered_invocation_builder(
     return invoc(*args, **kwargs)
 
 
+class CallPlan(NamedTuple):
+    """Everything a call of a (patched) method needs to know upfront.
+
+    All of it is fixed between `Mock.stub` and unstubbing, so we look it up
+    once instead of introspecting the mocked object on every call.
+    """
+    #: Whether the first argument is `self` (or `cls`), and not recorded
+    eat_self: bool
+    #: Whether we check the method exists and its signature matches
+    strict: bool
+    has_method: bool
+    signature: signature.Signature | None
+
+
 class Mock(object):
+    #: Called once on the next `unstub`, see `add_unstub_hook`.
+    _unstub_hooks: tuple[Callable[[], None], ...] = ()
+    #: The latencies of the original implementations per method name, if
+    #: enabled with `enable_timing`
+    timings: dict[str, timing.Histogram] | None = None
+    #: How to bring the arguments of a verification into the form we record
+    #: the calls of a method in, by method name, see `monitoring`
+    normalizers: dict[str, Callable[[tuple, dict], tuple[tuple, dict]]] \
+        | None = None
+    #: The captors which captured arguments of our calls, by their `id()`,
+    #: see `add_captor`
+    _captors: dict[int, matchers.Capturing] | None = None
+
     def __init__(
         self,
         mocked_obj: object,
         strict: bool = True,
-        spec: object | None = None
+        spec: object | None = None,
+        history: int | str | None = None,
+        max_invocations: int | None = None,
+        fingerprint: bool = False
     ) -> None:
         self.mocked_obj = mocked_obj
         self.strict = strict
         self.spec = spec
 
-        self.invocations: list[invocation.RealInvocation] = []
+        #: See `history.new_log`
+        self.history = history
+        self.max_invocations = max_invocations
+        #: Keep only the fingerprints of the arguments, see `fingerprints`
+        self.fingerprint = fingerprint
+        self.invocations = self.new_invocation_log()
         self.stubbed_invocations: deque[invocation.StubbedInvocation] = deque()
+        self._stubbed_invocations_by_method: \
+            dict[str, deque[invocation.StubbedInvocation]] = {}
 
         self._original_methods: dict[str, Callable | None] = {}
         self._methods_to_unstub: dict[str, Callable | None] = {}
         self._signatures_store: dict[str, signature.Signature | None] = {}
+        self._call_plans: dict[str, CallPlan] = {}
+        #: The methods we replaced with a function which just forwards to
+        #: the original implementation, see `pass_through`
+        self._passed_through: set[str] = set()
 
     def remember(self, invocation: invocation.RealInvocation) -> None:
+        if self.fingerprint:
+            invocation._remember_params(*fingerprints.take_all(
+                invocation.params, invocation.named_params))
         self.invocations.append(invocation)
 
     def finish_stubbing(
         self, stubbed_invocation: invocation.StubbedInvocation
     ) -> None:
         self.stubbed_invocations.appendleft(stubbed_invocation)
+        self._stubbed_invocations_by_method.setdefault(
+            stubbed_invocation.method_name, deque()
+        ).appendleft(stubbed_invocation)
+        method_name = stubbed_invocation.method_name
+        if method_name in self._passed_through:
+            # The new stub needs the full dispatch again.
+            self._passed_through.discard(method_name)
+            self.replace_method(
+                method_name, self._original_methods[method_name])
+
+    def stubbed_invocations_for(
+        self, method_name: str
+    ) -> deque[invocation.StubbedInvocation]:
+        """Return the stubs for `method_name`, the latest stub first."""
+        return self._stubbed_invocations_by_method.get(method_name, _NO_STUBS)
+
+    def new_invocation_log(self) -> history.Log:
+        return history.new_log(self.history, self.max_invocations)
 
     def clear_invocations(self) -> None:
-        self.invocations = []
+        self.invocations = self.new_invocation_log()
 
     def get_original_method(self, method_name: str) -> Callable | None:
         return self._original_methods.get(method_name, None)
@@ -105,18 +174,23 @@ class Mock(object):
             # Classes with defined `__slots__` and then no `__dict__` are not
             # patchable but if we catch the `AttributeError` here, we get
             # the better error message for the user.
-            return getattr(self.spec, method_name, None), False
+            return self.get_spec_member(method_name), False
 
     def set_method(self, method_name: str, new_method: object) -> None:
         setattr(self.mocked_obj, method_name, new_method)
 
+    def delete_method(self, method_name: str) -> None:
+        delattr(self.mocked_obj, method_name)
+
     def replace_method(
-        self, method_name: str, original_method: object | None
+        self,
+        method_name: str,
+        original_method: object | None,
+        new_mocked_method: Callable | None = None
     ) -> None:
-
-        def new_mocked_method(*args, **kwargs):
-            return remembered_invocation_builder(
-                self, method_name, *args, **kwargs)
+        if new_mocked_method is None:
+            new_mocked_method = self._new_mocked_method(
+                method_name, original_method)
 
         new_mocked_method.__name__ = method_name
         if original_method:
@@ -144,6 +218,40 @@ class Mock(object):
 
         self.set_method(method_name, new_mocked_method)
 
+    def _new_mocked_method(
+        self, method_name: str, original_method: object | None
+    ) -> Callable:
+
+        def new_mocked_method(*args, **kwargs):
+            return remembered_invocation_builder(
+                self, method_name, *args, **kwargs)
+
+        if (
+            self.strict
+            and original_method is not None
+            and trampoline.trampolines_enabled()
+        ):
+            new_mocked_method = (
+                self._make_trampoline(method_name) or new_mocked_method
+            )
+        return new_mocked_method
+
+    def _make_trampoline(self, method_name: str) -> Callable | None:
+        sig = self.get_signature(method_name)
+        if sig is None:
+            return None
+
+        def dispatch(params, params_without_first_arg, named_params):
+            return invocation.RememberedInvocation(self, method_name) \
+                .dispatch(
+                    params, params_without_first_arg, named_params, True)
+
+        def validate(params, named_params):
+            signature.match_signature(sig, params, named_params)
+
+        return trampoline.make_trampoline(
+            method_name, sig, self.eat_self(method_name), dispatch, validate)
+
     def stub(self, method_name: str) -> None:
         try:
             self._methods_to_unstub[method_name]
@@ -161,6 +269,67 @@ class Mock(object):
 
             self._original_methods[method_name] = original_method
             self.replace_method(method_name, original_method)
+            # We plan *after* patching, t.i. we can see the added methods
+            self._call_plans[method_name] = self._plan_call(method_name)
+
+    def pass_through(self, method_name: str) -> None:
+        """Record all calls of `method_name`, and answer them originally.
+
+        Like a stub for any arguments which answers with
+        `thenCallOriginalImplementation`, but the replacement does nothing
+        else: no matching, no stubs to look up.  It only checks the
+        arguments, so that calls the original refuses are not recorded.  A
+        later stub for the same method brings back the full dispatch.
+        """
+        stub = invocation.StubbedInvocation(self, method_name)
+        stub(Ellipsis).thenCallOriginalImplementation()
+        answer = stub.answers.answers[0]
+        plan = self.call_plan(method_name)
+        eat_self = plan.eat_self
+        sig = plan.signature if plan.strict else None
+        match_signature = signature.match_signature
+        outcomes: dict = {}
+        remember = self.remember
+        new_invocation = invocation.RememberedInvocation
+
+        def forward(*args, **kwargs):
+            params = args[1:] if eat_self else args
+            if sig is not None:
+                match_signature(sig, params, kwargs, outcomes)
+            invoc = new_invocation(self, method_name)
+            invoc._remember_params(params, kwargs)
+            remember(invoc)
+            stub.used += 1
+            return answer(*args, **kwargs)
+
+        self.replace_method(
+            method_name, self._original_methods[method_name], forward)
+        self._passed_through.add(method_name)
+
+    def call_plan(self, method_name: str) -> CallPlan:
+        try:
+            return self._call_plans[method_name]
+        except KeyError:
+            plan = self._call_plans[method_name] = \
+                self._plan_call(method_name)
+            return plan
+
+    def _plan_call(self, method_name: str) -> CallPlan:
+        if not self.strict:
+            return CallPlan(
+                eat_self=self.eat_self(method_name),
+                strict=False,
+                has_method=True,
+                signature=None
+            )
+
+        has_method = self.has_method(method_name)
+        return CallPlan(
+            eat_self=self.eat_self(method_name),
+            strict=True,
+            has_method=has_method,
+            signature=self.get_signature(method_name) if has_method else None
+        )
 
     def forget_stubbed_invocation(
         self, invocation: invocation.StubbedInvocation
@@ -172,11 +341,11 @@ class Mock(object):
             return
 
         self.stubbed_invocations.remove(invocation)
+        stubs = self._stubbed_invocations_by_method[invocation.method_name]
+        stubs.remove(invocation)
 
-        if not any(
-            inv.method_name == invocation.method_name
-            for inv in self.stubbed_invocations
-        ):
+        if not stubs:
+            del self._stubbed_invocations_by_method[invocation.method_name]
             original_method = self._methods_to_unstub.pop(
                 invocation.method_name
             )
@@ -185,27 +354,79 @@ class Mock(object):
     def restore_method(
         self, method_name: str, original_method: object | None
     ) -> None:
+        self._call_plans.pop(method_name, None)
+        self._passed_through.discard(method_name)
         # If original_method is None, we *added* it to mocked_obj, so we
         # must delete it here.
         if original_method:
             self.set_method(method_name, original_method)
         else:
-            delattr(self.mocked_obj, method_name)
+            self.delete_method(method_name)
+
+    def enable_timing(self) -> None:
+        if self.timings is None:
+            self.timings = {}
+
+    def histogram_for(self, method_name: str) -> timing.Histogram:
+        assert self.timings is not None
+        try:
+            return self.timings[method_name]
+        except KeyError:
+            histogram = self.timings[method_name] = timing.Histogram()
+            return histogram
+
+    def add_unstub_hook(self, hook: Callable[[], None]) -> None:
+        """Call `hook` on the next `unstub`, for things we did not patch."""
+        self._unstub_hooks += (hook,)
 
     def unstub(self) -> None:
+        if self._unstub_hooks:
+            hooks = self._unstub_hooks
+            del self._unstub_hooks
+            for hook in hooks:
+                hook()
         while self._methods_to_unstub:
             method_name, original_method = self._methods_to_unstub.popitem()
             self.restore_method(method_name, original_method)
         self.stubbed_invocations = deque()
-        self.invocations = []
+        self._stubbed_invocations_by_method = {}
+        self._call_plans = {}
+        self.invocations = self.new_invocation_log()
+        if self.timings is not None:
+            self.timings = {}
+
+    def add_captor(self, captor: matchers.Capturing) -> None:
+        """Remember that `captor` captured an argument, to clear on `reset`.
+        """
+        if self._captors is None:
+            self._captors = {}
+        self._captors[id(captor)] = captor
+
+    def forget_captured_values(self) -> None:
+        if self._captors is not None:
+            for captor in self._captors.values():
+                captor.forget_values()
+            del self._captors
+
+    def reset(self) -> None:
+        """Forget all calls and stubs, like `unstub`, but stay registered.
+
+        Also the captors which captured arguments of our calls forget
+        their values.
+        """
+        self.forget_captured_values()
+        self.unstub()
 
     # SPECCING
 
+    def get_spec_member(self, name: str, default: Any = None) -> Any:
+        return getattr(self.spec, name, default)
+
     def has_method(self, method_name: str) -> bool:
         if self.spec is None:
             return True
 
-        return hasattr(self.spec, method_name)
+        return self.get_spec_member(method_name, _MISSING) is not _MISSING
 
     def get_signature(self, method_name: str) -> signature.Signature | None:
         if self.spec is None:
@@ -238,6 +459,309 @@ class Mock(object):
             )
 
 
+class _DummyMock(Mock):
+    """The Mock behind a dummy created by `mock()`.
+
+    All dummies of a spec share their `Dummy` class, so we must not patch
+    it.  Stubbed methods go into the dummy's `__dict__` instead, bound as
+    if they were looked up on the class.  Only magic methods, which Python
+    looks up on the type, and configured attributes need a class of their
+    own; we then move the dummy to a private subclass, see `own_class`.
+    """
+    #: The stubs of the configuration of a `mock_many`, see `share`
+    _shared_stubs: tuple[invocation.StubbedInvocation, ...] = ()
+
+    def __init__(
+        self,
+        dummy: _Dummy,
+        strict: bool = True,
+        spec: object | None = None,
+        members: SpecMembers | None = None,
+        history: int | str | None = None,
+        max_invocations: int | None = None,
+        fingerprint: bool = False
+    ) -> None:
+        super().__init__(
+            type(dummy), strict=strict, spec=spec,
+            history=history, max_invocations=max_invocations,
+            fingerprint=fingerprint)
+        # The dummy holds on to us, see `Dummy._mockito_mock`.  Holding on
+        # to it in turn would make a reference cycle, t.i. a dropped dummy
+        # and all it recorded would wait for the cyclic GC.
+        self._dummy_ref = weakref.ref(dummy)
+        #: Set for lazy dummies, see `mock(lazy=True)`
+        self.members = members
+        self._configured_functions: dict[str, Callable] = {}
+
+    @property
+    def dummy(self) -> _Dummy:
+        return self._dummy_ref()  # type: ignore[return-value]
+
+    def configure(self, functions: dict[str, Callable]) -> None:
+        """Answer all calls of each method with the given function."""
+        self._configured_functions = functions
+        for name, fn in functions.items():
+            invocation.StubbedInvocation(self, name)(Ellipsis) \
+                .thenAnswer(fn)
+
+    def new_configured_stubs(
+        self, functions: dict[str, Callable]
+    ) -> tuple[invocation.StubbedInvocation, ...]:
+        """Return a stub per function, which answers all calls with it.
+
+        Unlike `configure`, stub nothing yet, see `share`.
+        """
+        stubs = []
+        for name, fn in functions.items():
+            stub = invocation.StubbedInvocation(self, name)
+            if stub.strict:
+                stub.ensure_mocked_object_has_method(name)
+            stub._remember_params((Ellipsis,), {})
+            stub.add_answer(invocation.discard_self(fn))
+            stubs.append(stub)
+        return tuple(stubs)
+
+    def share(
+        self, stubs: tuple[invocation.StubbedInvocation, ...]
+    ) -> None:
+        """Answer with `stubs`, which other dummies answer with too.
+
+        The methods already live on the class the dummies share, see
+        `mock_many`, we only look up the stubs.  Note that the dummies
+        share the `used` count of each stub, too.
+        """
+        self._shared_stubs = stubs
+        for stub in stubs:
+            name = stub.method_name
+            self._original_methods[name] = None
+            self._methods_to_unstub[name] = None
+            self.stubbed_invocations.appendleft(stub)
+            self._stubbed_invocations_by_method[name] = deque((stub,))
+
+    def own_class(self) -> type:
+        """Return the private class of the dummy, create it on first use."""
+        cls = type(self.dummy)
+        if cls is self.mocked_obj:
+            cls = type(cls.__name__, (cls,), {
+                '__slots__': (), '__qualname__': cls.__qualname__})
+            _set_class(self.dummy, cls)
+        return cls
+
+    def set_method(self, method_name: str, new_method: object) -> None:
+        if _is_dunder(method_name):
+            setattr(self.own_class(), method_name, new_method)
+            return
+
+        bind = getattr(type(new_method), '__get__', None)
+        self.dummy.__dict__[method_name] = (
+            new_method
+            if bind is None
+            else bind(new_method, self.dummy, type(self.dummy))
+        )
+
+    def delete_method(self, method_name: str) -> None:
+        if _is_dunder(method_name):
+            cls = type(self.dummy)
+            if cls is not self.mocked_obj and method_name in cls.__dict__:
+                delattr(cls, method_name)
+        else:
+            self.dummy.__dict__.pop(method_name, None)
+
+    def restore_method(
+        self, method_name: str, original_method: object | None
+    ) -> None:
+        # The original method lives on the spec, the dummy just never had
+        # the method.
+        super().restore_method(method_name, None)
+
+    def get_spec_member(self, name: str, default: Any = None) -> Any:
+        if self.members is None:
+            return super().get_spec_member(name, default)
+        return self.members.get(name, default)
+
+    def get_signature(self, method_name: str) -> signature.Signature | None:
+        if self.members is None:
+            return super().get_signature(method_name)
+        return self.members.signature_of(method_name)
+
+    def reset(self) -> None:
+        # Back to how `mock()` made it: also drop what users set on the
+        # dummy, but keep its configuration.
+        super().reset()
+        self.dummy.__dict__.clear()
+        self.configure(self._configured_functions)
+        if self._shared_stubs:
+            self.share(self._shared_stubs)
+
+    def __deepcopy__(self, memo: dict) -> _DummyMock:
+        # Copies of a dummy share its mock, as they share its class.
+        return self
+
+
+_set_class = object.__dict__['__class__'].__set__
+
+
+def _is_dunder(name: str) -> bool:
+    return len(name) >= 4 and name[:2] == name[-2:] == '__'
+
+
+class SpecMembers(object):
+    """The members of a spec and their signatures, looked up on first use.
+
+    All lazy dummies of a spec share its table.  For huge specs, e.g. SDK
+    clients or namespaces like `numpy`, we so only pay for the members
+    actually used, and only once.
+    """
+    def __init__(self, spec: object) -> None:
+        self.spec = spec
+        self._members: dict[str, Any] = {}
+        self._signatures: dict[str, signature.Signature | None] = {}
+
+    def get(self, name: str, default: Any = None) -> Any:
+        try:
+            member = self._members[name]
+        except KeyError:
+            member = self._members[name] = \
+                getattr(self.spec, name, _MISSING)
+        return default if member is _MISSING else member
+
+    def signature_of(self, name: str) -> signature.Signature | None:
+        try:
+            return self._signatures[name]
+        except KeyError:
+            member = self.get(name, _MISSING)
+            if member is _MISSING:
+                # Raise the same AttributeError as `get_signature` would
+                getattr(self.spec, name)
+            sig = self._signatures[name] = \
+                signature.get_member_signature(self.spec, name, member)
+            return sig
+
+
+class _AdHocMethod(object):
+    # What a non-strict dummy hands out for attributes nobody configured.
+    # It looks up the `__doc__` and `__wrapped__` of the member of the spec
+    # only when asked for, e.g. by `help()` or `inspect.signature()`.  The
+    # dummy caches it in its `__dict__`, so we must not refer back to the
+    # dummy, or dropped dummies would end up in a reference cycle.
+
+    def __init__(self, mock: _DummyMock, name: str) -> None:
+        self.__name__ = name
+        self._mock = mock
+
+    def __call__(self, *args, **kwargs):
+        return remembered_invocation_builder(
+            self._mock, self.__name__, *args, **kwargs)
+
+    @property
+    def __self__(self) -> _Dummy:
+        return self._mock.dummy
+
+    @property
+    def __wrapped__(self) -> Any:
+        original = self._mock.get_spec_member(self.__name__, _MISSING)
+        if original is _MISSING:
+            raise AttributeError('__wrapped__')
+        return original
+
+    @property
+    def __doc__(self) -> str | None:  # type: ignore[override]
+        original = self._mock.get_spec_member(self.__name__, _MISSING)
+        if original is _MISSING:
+            return None
+        return getattr(original, '__doc__', None)
+
+    def __repr__(self):
+        return "<ad-hoc method %s of %r>" % (self.__name__, self.__self__)
+
+
+class _SpecCache(object):
+    """What we derive from a spec, shared as long as some mock uses it.
+
+    Keyed by the `id()` of the spec, and the further arguments for the
+    `factory`.  We only hold the values weakly, t.i. we don't keep any spec
+    alive.  The values hold on to their spec in turn, so its id stays
+    valid as long as we have an entry for it.
+    """
+    def __init__(self, factory: Callable) -> None:
+        self.factory = factory
+        self._store: weakref.WeakValueDictionary[tuple, Any] = \
+            weakref.WeakValueDictionary()
+
+    def get(self, spec: object, *args: Any) -> Any:
+        key = (id(spec),) + args
+        value = self._store.get(key)
+        if value is None:
+            value = self._store[key] = self.factory(spec, *args)
+        return value
+
+
+def _make_dummy_class(  # noqa: C901
+    spec: object, strict: bool
+) -> type[_Dummy]:
+    class Dummy(_Dummy):
+        __slots__ = ('_mockito_mock',)
+
+        if spec:
+            # make isinstance work
+            __class__ = spec  # type: ignore[assignment]
+        else:
+            # Give out a private class, t.i. users who set up e.g.
+            # properties on `dummy.__class__` don't change all dummies.
+            __class__ = property(  # type: ignore[assignment]
+                lambda self: self._mockito_mock.own_class(), _set_class)
+
+        def __getattr__(self, method_name):
+            if strict:
+                __tracebackhide__ = operator.methodcaller(
+                    "errisinstance", AttributeError
+                )
+                # deepcopy catches a possible AttributeError, fallback
+                # to an arbitrary RuntimeError
+                error_type = (
+                    RuntimeError
+                    if method_name == '__deepcopy__'
+                    else AttributeError
+                )
+                raise error_type(
+                    "'Dummy' has no attribute %r configured" % method_name)
+
+            if (
+                method_name != "__call__" and _is_dunder(method_name)
+                # A copy of a dummy in the making has no mock yet
+                or method_name == '_mockito_mock'
+            ):
+                raise AttributeError(method_name)
+
+            if method_name == '__call__':
+                # Python looks up `__call__` on the type, so `_Dummy`
+                # asks us every time.
+                try:
+                    return self.__dict__[method_name]
+                except KeyError:
+                    pass
+
+            ad_hoc_method = self.__dict__[method_name] = \
+                _AdHocMethod(self._mockito_mock, method_name)
+            return ad_hoc_method
+
+        def __repr__(self):
+            name = 'Dummy'
+            if spec:
+                name += spec.__name__
+            return "<%s id=%s>" % (name, id(self))
+
+    # Keep the name it had when `mock()` defined it, it shows up in errors
+    Dummy.__qualname__ = 'mock.<locals>.Dummy'
+    return Dummy
+
+
+#: The `Dummy` classes by spec and strictness
+_dummy_classes = _SpecCache(_make_dummy_class)
+#: The `SpecMembers` of the specs of lazy dummies
+_spec_members = _SpecCache(SpecMembers)
+
+
 class _OMITTED(object):
     def __repr__(self):
         return 'OMITTED'
@@ -245,7 +769,9 @@ class _OMITTED(object):
 
 OMITTED = _OMITTED()
 
-def mock(config_or_spec=None, spec=None, strict=OMITTED):  # noqa: C901
+def mock(config_or_spec=None, spec=None, strict=OMITTED,  # noqa: C901
+         weak=False, lazy=False, history=None, max_invocations=None,
+         fingerprint=False):
     """Create 'empty' objects ('Mocks').
 
     Will create an empty unconfigured object, that you can pass
@@ -285,6 +811,48 @@ def mock(config_or_spec=None, spec=None, strict=OMITTED):  # noqa: C901
     All other magic methods must be configured this way or they will raise an
     AttributeError.
 
+    Usually, a mock stays registered, and thus alive together with all its
+    recorded interactions, until you :func:`unstub` it.  Pass ``weak=True``
+    to let the registry only hold a weak reference to it instead.  Such a
+    mock, and everything it recorded, is released as soon as your code
+    drops the last reference to it, even if you never unstub::
+
+        dummy = mock(weak=True)
+
+    For huge specs, e.g. clients of big SDKs, pass ``lazy=True``.  Then
+    mockito looks up each member of the spec, and its signature, only once
+    for all lazy mocks of that spec, when first used.  The functions handed
+    out by non-strict mocks look up the `__doc__` and `__wrapped__` of the
+    member only if asked for, e.g. by `help()` or `inspect`.  The spec must
+    not change meanwhile, as the lookups are never repeated.
+
+    A mock which gets called in a long running loop, e.g. a heartbeat, can
+    keep only its latest invocations with ``history=n``.  It still counts
+    all calls, so ``verify(dummy, times=n).beat(...)`` stays exact, but
+    verifying specific arguments only sees the kept invocations.  Set
+    ``max_invocations=n`` to raise on the call after the `n`-th, instead
+    of recording a runaway loop until you run out of memory::
+
+        heart = mock(history=100, max_invocations=10_000)
+
+    With ``history='counts'``, the mock only counts how often it got
+    called with which arguments, and verifications sum these up.  It then
+    needs memory for each distinct call, not for each call, but can't tell
+    the order of the calls.  With ``history='disk'``, it writes the
+    arguments of all calls to a temporary file, and reads them back to
+    verify.
+
+    Set the environment variables ``MOCKITO_HISTORY`` and
+    ``MOCKITO_MAX_INVOCATIONS`` to apply these to all mocks.
+
+    A mock which gets called with large payloads, e.g. megabytes of
+    `bytes` or numpy arrays, can keep only a fingerprint of them with
+    ``fingerprint=True``: a digest of their content plus their type,
+    length, shape and dtype.  Small values it keeps as they are.
+    Verifying with concrete values compares their digests, but matchers,
+    except for `ANY` and `eq`, raise as they need the real value.  Stubs
+    still see the real arguments.
+
 
     See :func:`verify` to verify your interactions after usage.
 
@@ -299,64 +867,214 @@ def mock(config_or_spec=None, spec=None, strict=OMITTED):  # noqa: C901
         strict = False if spec is None else True
 
 
-    class Dummy(_Dummy):
-        if spec:
-            __class__ = spec  # make isinstance work
+    # All dummies of a spec share their class.  The mock we register
+    # patches the dummy itself, and only moves it to a class of its own for
+    # magic methods (`__call__` etc.) and configured attributes.
+    obj = _dummy_classes.get(spec, strict)()
+    theMock = obj._mockito_mock = _DummyMock(
+        obj, strict=strict, spec=spec,
+        members=_spec_members.get(spec) if lazy and spec else None,
+        history=history, max_invocations=max_invocations,
+        fingerprint=fingerprint
+    )
 
-        def __getattr__(self, method_name):
-            if strict:
-                __tracebackhide__ = operator.methodcaller(
-                    "errisinstance", AttributeError
-                )
-                # deepcopy catches a possible AttributeError, fallback
-                # to an arbitrary RuntimeError
-                error_type = (
-                    RuntimeError
-                    if method_name == '__deepcopy__'
-                    else AttributeError
-                )
-                raise error_type(
-                    "'Dummy' has no attribute %r configured" % method_name)
+    functions = {}
+    for n, v in config.items():
+        if inspect.isfunction(v):
+            functions[n] = v
+        else:
+            setattr(theMock.own_class(), n, v)
+    theMock.configure(functions)
 
-            if (
-                method_name != "__call__"
-                and method_name == "__{}__".format(method_name[2:-2])
-            ):
-                raise AttributeError(method_name)
+    mock_registry.register(obj, theMock, weak=weak)
+    return obj
 
-            def ad_hoc_function(*args, **kwargs):
-                return remembered_invocation_builder(
-                    theMock, method_name, *args, **kwargs)
-            ad_hoc_function.__name__ = method_name
-            ad_hoc_function.__self__ = obj  # type: ignore[attr-defined]
-            if spec:
-                try:
-                    original_method = getattr(spec, method_name)
-                    ad_hoc_function.__wrapped__ = original_method  # type: ignore[attr-defined]  # noqa: E501
-                    ad_hoc_function.__doc__ = original_method.__doc__
-                except AttributeError:
-                    pass
 
-            return ad_hoc_function
+class Mocks(tuple):
+    """The dummies `mock_many` creates, in order.
 
-        def __repr__(self):
-            name = 'Dummy'
-            if spec:
-                name += spec.__name__
-            return "<%s id=%s>" % (name, id(self))
+    Use its items like dummies from `mock()`.  The sequence itself can be
+    verified too, which then counts the interactions of all of its dummies.
+    """
+    __slots__ = ()
 
+    def __repr__(self):
+        return "<Mocks len=%s id=%s>" % (len(self), id(self))
 
-    # That's a tricky one: The object we will return is an *instance* of our
-    # Dummy class, but the mock we register will point and patch the class.
-    # T.i. so that magic methods (`__call__` etc.) can be configured.
-    obj = Dummy()
-    theMock = Mock(Dummy, strict=strict, spec=spec)
 
-    for n, v in config.items():
-        if inspect.isfunction(v):
-            invocation.StubbedInvocation(theMock, n)(Ellipsis).thenAnswer(v)
-        else:
-            setattr(Dummy, n, v)
+class _AggregateMock(Mock):
+    """The Mock registered for the `Mocks` of `mock_many`.
 
-    mock_registry.register(obj, theMock)
-    return obj
+    It has no stubs and sees no calls of its own, but reads the ones of all
+    its members.
+    """
+    def __init__(
+        self,
+        dummies: Mocks,
+        mocks: list[Mock],
+        strict: bool = True,
+        spec: object | None = None
+    ) -> None:
+        self.mocks = mocks
+        self._log = history.CombinedLog(mocks)
+        super().__init__(dummies, strict=strict, spec=spec)
+
+    @property  # type: ignore[override]
+    def invocations(self) -> history.CombinedLog:
+        return self._log
+
+    @invocations.setter
+    def invocations(self, value: history.Log) -> None:
+        # Called by `Mock.__init__`; the members keep their own logs
+        pass
+
+    def new_invocation_log(  # type: ignore[override]
+        self
+    ) -> history.CombinedLog:
+        return self._log
+
+    def clear_invocations(self) -> None:
+        for m in self.mocks:
+            m.clear_invocations()
+
+    @property  # type: ignore[override]
+    def stubbed_invocations(self) -> deque[invocation.StubbedInvocation]:
+        return deque(i for m in self.mocks for i in m.stubbed_invocations)
+
+    @stubbed_invocations.setter
+    def stubbed_invocations(
+        self, value: deque[invocation.StubbedInvocation]
+    ) -> None:
+        pass
+
+    def unstub(self) -> None:
+        for dummy in self.mocked_obj:  # type: ignore[attr-defined]
+            mock_registry.unstub(dummy)
+
+    def reset(self) -> None:
+        self.forget_captured_values()
+        for m in self.mocks:
+            m.reset()
+
+
+def _configured_method(method_name: str) -> Callable:
+    # Looks up the mock of the dummy it is called on, t.i. one function
+    # serves all the dummies of a `mock_many`.
+    def configured_method(*args, **kwargs):
+        return remembered_invocation_builder(
+            args[0]._mockito_mock, method_name, *args, **kwargs)
+
+    configured_method.__name__ = method_name
+    return configured_method
+
+
+def mock_many(spec=None, n=0, config=None, strict=OMITTED):
+    """Create `n` dummies like `mock(config, spec=spec, strict=strict)`.
+
+    Compared to calling :func:`mock` `n` times, the dummies share the work
+    that only depends on `spec` and `config`, and get registered at once.
+    Returns them as a tuple, which you can verify as a whole, t.i.::
+
+        conns = mock_many(Connection, 1000)
+        when(conns[0]).send(...).thenRaise(IOError)
+
+        run(conns)
+
+        verify(conns[0]).send(...)  # as usual
+        verify(conns, times=1000).close()  # all of them together
+
+    """
+    if strict is OMITTED:
+        strict = False if spec is None else True
+
+    config = config or {}
+    functions = {k: v for k, v in config.items() if inspect.isfunction(v)}
+    attributes = {
+        k: v for k, v in config.items() if not inspect.isfunction(v)}
+
+    cls = _dummy_classes.get(spec, strict)
+    if config:
+        # The configuration goes on a class all the dummies share, in
+        # contrast to `mock()`, where each dummy gets a class of its own.
+        namespace = dict(
+            attributes, __slots__=(), __qualname__=cls.__qualname__)
+        for name in functions:
+            namespace[name] = _configured_method(name)
+        cls = type(cls.__name__, (cls,), namespace)
+
+    # The signatures only depend on the spec, t.i. we look them up only
+    # once for all the mocks.  Likewise, all the mocks share the stubs
+    # of the configuration.
+    signatures = {}  # type: ignore[var-annotated]
+    stubs = None
+    dummies = []
+    mocks = []
+    for _ in range(n):
+        obj = cls()
+        theMock = obj._mockito_mock = _DummyMock(obj, strict=strict, spec=spec)
+        theMock._signatures_store = signatures
+        if functions:
+            if stubs is None:
+                stubs = theMock.new_configured_stubs(functions)
+            theMock.share(stubs)
+        dummies.append(obj)
+        mocks.append(theMock)
+
+    result = Mocks(dummies)
+    mock_registry.register_many(zip(dummies, mocks))
+    mock_registry.register(
+        result, _AggregateMock(result, mocks, strict=strict, spec=spec))
+    return result
+
+
+class MockPool(object):
+    """Hands out dummies of one spec, and takes them back for reuse.
+
+    Creating dummies over and over is not free.  A pool, e.g. in a
+    session wide fixture, creates each dummy only once::
+
+        pool = MockPool(Connection)
+
+        @pytest.fixture
+        def conn():
+            yield pool.get()
+            pool.release()
+
+    `get` returns a dummy as ``mock(config, spec=spec, strict=strict)``
+    would.  `release` resets all the dummies handed out so far, see
+    :func:`reset`, and takes them back.
+    """
+    def __init__(
+        self,
+        spec: object = None,
+        config: dict | None = None,
+        strict: bool | _OMITTED = OMITTED
+    ) -> None:
+        self.spec = spec
+        self.config = config
+        self.strict = strict
+        self._free: list[_Dummy] = []
+        self._taken: list[_Dummy] = []
+
+    def get(self):
+        """Return a free dummy, or create one."""
+        try:
+            obj = self._free.pop()
+        except IndexError:
+            obj = mock(self.config, spec=self.spec, strict=self.strict)
+        else:
+            theMock = obj._mockito_mock
+            # A plain `unstub()` drops the dummy from the registry, and its
+            # configuration along with all the other stubs.
+            if mock_registry.mock_for(obj) is not theMock:
+                theMock.reset()
+                mock_registry.register(obj, theMock)
+        self._taken.append(obj)
+        return obj
+
+    def release(self):
+        """Reset the dummies handed out and take them back."""
+        for obj in self._taken:
+            obj._mockito_mock.reset()
+        self._free.extend(self._taken)
+        self._taken = []
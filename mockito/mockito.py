@@ -25,7 +25,7 @@ from . import invocation
 from . import verification
 
 from .utils import deprecated, get_obj, get_obj_attr_tuple
-from .mocking import Mock
+from .mocking import Mock, Mocks
 from .mock_registry import mock_registry
 from .verification import VerificationError
 
@@ -96,12 +96,25 @@ def _get_wanted_verification(
 
 
 def _get_mock(obj: object, strict=True) -> Mock:
+    if isinstance(obj, Mocks):
+        raise ArgumentError(
+            "Can't stub %s as a whole; stub the individual dummies instead, "
+            "e.g. `when(dummies[0])`." % (obj,))
     theMock = mock_registry.mock_for(obj)
     if theMock is None:
         theMock = Mock(obj, strict=strict, spec=obj)
         mock_registry.register(obj, theMock)
     return theMock
 
+def _ensure_not_watched(theMock: Mock, method_name: str) -> None:
+    # We record the calls of watched functions in a normalized form, but
+    # the calls of stubs as they come, t.i. verifications would mix both.
+    normalizers = theMock.normalizers
+    if normalizers and method_name in normalizers:
+        raise ArgumentError(
+            "Can't stub '%s', it is watched with `spy2(fn, monitor=True)`."
+            % method_name)
+
 def _get_mock_or_raise(obj: object) -> Mock:
     theMock = mock_registry.mock_for(obj)
     if theMock is None:
@@ -235,6 +248,7 @@ def when(obj, strict=True):
 
     class When(object):
         def __getattr__(self, method_name):
+            _ensure_not_watched(theMock, method_name)
             return invocation.StubbedInvocation(
                 theMock, method_name, strict=strict)
 
@@ -262,6 +276,7 @@ def when2(fn, *args, **kwargs):
     """
     obj, name = get_obj_attr_tuple(fn)
     theMock = _get_mock(obj, strict=True)
+    _ensure_not_watched(theMock, name)
     return invocation.StubbedInvocation(theMock, name)(*args, **kwargs)
 
 
@@ -291,6 +306,7 @@ def patch(fn, attr_or_replacement, replacement=None):
     else:
         obj, name = fn, attr_or_replacement
         theMock = _get_mock(obj, strict=True)
+        _ensure_not_watched(theMock, name)
         return invocation.StubbedInvocation(
             theMock, name, strict=False)(Ellipsis).thenAnswer(replacement)
 
@@ -327,6 +343,7 @@ def expect(obj, strict=True,
 
     class Expect(object):
         def __getattr__(self, method_name):
+            _ensure_not_watched(theMock, method_name)
             return invocation.StubbedInvocation(
                 theMock, method_name, verification=verification_fn,
                 strict=strict)
@@ -367,6 +384,41 @@ def forget_invocations(*objs):
         theMock.clear_invocations()
 
 
+def reset(*objs):
+    """Reset given objs to a clean state, but keep them registered.
+
+    Like :func:`unstub`, ``reset`` unstubs everything and forgets all
+    interactions, including the expectations set up with :func:`expect`.
+    But the mocks stay registered and can be stubbed and verified again.
+    Dummies created by :func:`mock` even get back their configuration,
+    t.i. you can reuse them instead of creating new ones, see also
+    :class:`MockPool`.
+    """
+    for obj in objs:
+        theMock = _get_mock_or_raise(obj)
+        theMock.reset()
+
+
+def latency(obj, method_name):
+    """Return how long the calls of a timed spy's method took.
+
+    Spies created with ``timing=True``, see :func:`spy` and :func:`spy2`,
+    measure the wall time of each call of the original implementation.
+    Returns a :class:`~mockito.timing.Histogram` of these, in nanoseconds,
+    e.g.::
+
+        service = spy(service, timing=True)
+        run(service)
+
+        assert latency(service, 'fetch').p99 < 5_000_000  # 5ms
+
+    """
+    theMock = _get_mock_or_raise(obj)
+    if theMock.timings is None:
+        raise ArgumentError("obj '%s' is not timed" % obj)
+    return theMock.histogram_for(method_name)
+
+
 def ensureNoUnverifiedInteractions(*objs):
     """Check if any given object has any unverified interaction.
 
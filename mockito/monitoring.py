@@ -0,0 +1,266 @@
+# Copyright (c) 2008-2016 Szczepan Faber, Serhiy Oplakanets, Herr Kaste
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+'''Spy on functions through `sys.monitoring` (PEP 669), t.i. without patching.
+
+Instead of replacing a function on its host, we ask the interpreter to call
+us back whenever the code of the function starts.  We thus also see calls
+from modules which imported the function by name, e.g. with
+``from os.path import exists``, and the function keeps running without a
+wrapper.  Only the watched code objects emit events, all other functions
+run at full speed.  Needs Python 3.12.
+
+We see the arguments only after they have been bound to the parameters,
+so we record them in a normalized form: positional parameters as
+positional arguments, keyword-only parameters and ``**kwargs`` as keyword
+arguments, all of them including their defaults.  We bring the arguments
+of verifications into the same form, see `Mock.normalizers`.
+'''
+
+from __future__ import annotations
+import inspect
+import sys
+
+from . import invocation, matchers
+from .utils import contains_strict
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from types import CodeType, FrameType
+    from typing import Callable
+    from .mocking import Mock
+
+__all__ = ['AVAILABLE', 'check_available', 'watch']
+
+# Python 3.12+
+monitoring: Any = getattr(sys, 'monitoring', None)
+AVAILABLE = monitoring is not None
+TOOL_NAME = 'mockito'
+# The ids not reserved for debuggers, coverage, profilers and optimizers.
+_FREE_TOOL_IDS = (3, 4)
+
+_tool_id: int | None = None
+_watchers: dict[CodeType, list[Watcher]] = {}
+
+
+class Watcher(object):
+    """Record the calls of one function on the mock of its host."""
+
+    def __init__(
+        self,
+        mock: Mock,
+        method_name: str,
+        fn: Callable,
+        eat_self: bool,
+        owner: object | None
+    ) -> None:
+        self.mock = mock
+        self.method_name = method_name
+        self.fn = fn
+        self.eat_self = eat_self
+        #: For instance methods, the instance we're interested in
+        self.owner = owner
+
+    def record(self, frame: FrameType) -> None:
+        params, named_params = _arguments(self.fn, frame)
+        if self.eat_self:
+            if not params or (
+                self.owner is not None and params[0] is not self.owner
+            ):
+                return
+            params = params[1:]
+
+        self.mock.remember(invocation.ObservedInvocation(
+            self.mock, self.method_name, params, named_params))
+
+
+def check_available() -> None:
+    if not AVAILABLE:
+        raise RuntimeError(
+            "Spying through 'sys.monitoring' needs Python 3.12 or later.")
+
+
+def watch(mock: Mock, method_name: str) -> None:
+    """Record all calls of `method_name` of the object `mock` stands for.
+
+    Stops recording when the mock gets unstubbed.
+    """
+    check_available()
+
+    host = mock.mocked_obj
+    fn = getattr(host, method_name)
+    eat_self = False
+    owner = None
+    if inspect.ismethod(fn):
+        eat_self = True
+        if not inspect.isclass(fn.__self__):
+            owner = fn.__self__
+        fn = fn.__func__
+    elif inspect.isclass(host) and not isinstance(
+        inspect.getattr_static(host, method_name, None), staticmethod
+    ):
+        eat_self = True
+
+    # Decorators usually share their wrapper code across all the functions
+    # they decorate, so we watch the decorated function itself.
+    fn = inspect.unwrap(fn)
+    if not inspect.isfunction(fn):
+        raise TypeError(
+            "Can only watch Python functions, but '%s' is %r."
+            % (method_name, fn))
+
+    code = fn.__code__
+    if any(
+        watcher.mock is mock and watcher.method_name == method_name
+        for watcher in _watchers.get(code, ())
+    ):
+        return
+
+    watcher = Watcher(mock, method_name, fn, eat_self, owner)
+    tool_id = _acquire_tool_id()
+    watchers = _watchers.setdefault(code, [])
+    if not watchers:
+        monitoring.set_local_events(
+            tool_id, code, monitoring.events.PY_START)
+    watchers.append(watcher)
+
+    if mock.normalizers is None:
+        mock.normalizers = {}
+    mock.normalizers[method_name] = _normalizer(fn, eat_self)
+
+    mock.add_unstub_hook(lambda: _unwatch(code, watcher))
+
+
+def _unwatch(code: CodeType, watcher: Watcher) -> None:
+    if watcher.mock.normalizers:
+        watcher.mock.normalizers.pop(watcher.method_name, None)
+
+    watchers = _watchers.get(code)
+    if watchers is None or watcher not in watchers:
+        return
+
+    watchers.remove(watcher)
+    if watchers:
+        return
+
+    del _watchers[code]
+    if _tool_id is not None:
+        monitoring.set_local_events(_tool_id, code, 0)
+    if not _watchers:
+        _release_tool_id()
+
+
+def _on_start(code: CodeType, instruction_offset: int) -> Any:
+    # We're called from within the frame which just started.
+    frame = sys._getframe(1)
+    for watcher in _watchers.get(code, ()):
+        watcher.record(frame)
+
+
+def _acquire_tool_id() -> int:
+    global _tool_id
+    if _tool_id is not None:
+        return _tool_id
+
+    for tool_id in _FREE_TOOL_IDS:
+        if monitoring.get_tool(tool_id) is None:
+            break
+    else:
+        raise RuntimeError(
+            "All 'sys.monitoring' tool ids we could use are taken.")
+
+    monitoring.use_tool_id(tool_id, TOOL_NAME)
+    monitoring.register_callback(
+        tool_id, monitoring.events.PY_START, _on_start)
+    _tool_id = tool_id
+    return tool_id
+
+
+def _release_tool_id() -> None:
+    global _tool_id
+    if _tool_id is None:
+        return
+
+    monitoring.register_callback(_tool_id, monitoring.events.PY_START, None)
+    monitoring.free_tool_id(_tool_id)
+    _tool_id = None
+
+
+def _arguments(fn: Callable, frame: FrameType) -> tuple[tuple, dict]:
+    code = fn.__code__
+    f_locals = frame.f_locals
+    names = code.co_varnames
+    argcount = code.co_argcount
+    kwonlycount = code.co_kwonlyargcount
+
+    params = tuple(f_locals[name] for name in names[:argcount])
+    named_params = {
+        name: f_locals[name]
+        for name in names[argcount:argcount + kwonlycount]
+    }
+
+    i = argcount + kwonlycount
+    if code.co_flags & inspect.CO_VARARGS:
+        params += f_locals[names[i]]
+        i += 1
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        named_params.update(f_locals[names[i]])
+
+    return params, named_params
+
+
+def _normalizer(
+    fn: Callable, eat_self: bool
+) -> Callable[[tuple, dict], tuple[tuple, dict]]:
+    """Return a function which binds wanted arguments like `_arguments`."""
+    sig = inspect.signature(fn)
+    parameters = list(sig.parameters.values())
+
+    def normalize(params: tuple, named_params: dict) -> tuple[tuple, dict]:
+        # `...`, `*args` and `**kwargs` stand for arguments we don't know.
+        if (
+            contains_strict(params, Ellipsis)
+            or contains_strict(params, matchers.ARGS_SENTINEL)
+            or matchers.KWARGS_SENTINEL in named_params
+        ):
+            return params, named_params
+        try:
+            bound = sig.bind(
+                *((None,) + params if eat_self else params), **named_params)
+        except TypeError:
+            return params, named_params
+        bound.apply_defaults()
+
+        args: tuple = ()
+        kwargs = {}
+        for parameter in parameters:
+            value = bound.arguments[parameter.name]
+            if parameter.kind is parameter.VAR_POSITIONAL:
+                args += value
+            elif parameter.kind is parameter.KEYWORD_ONLY:
+                kwargs[parameter.name] = value
+            elif parameter.kind is parameter.VAR_KEYWORD:
+                kwargs.update(value)
+            else:
+                args += (value,)
+        return args[1:] if eat_self else args, kwargs
+
+    return normalize
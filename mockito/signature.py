@@ -1,9 +1,12 @@
 from __future__ import annotations
-from . import matchers
+from . import matchers, spec_cache
 from .utils import contains_strict
 
 import functools
 import inspect
+import weakref
+from collections import OrderedDict
+from typing import Callable, NamedTuple
 
 try:
     from inspect import signature, Parameter, Signature
@@ -11,28 +14,240 @@ except ImportError:
     from funcsigs import signature, Parameter, Signature  # type: ignore[import-not-found, no-redef]  # noqa: E501
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class SignatureCache(object):
+    """Process-wide, bounded cache for computed signatures.
+
+    Computing a signature is expensive, and we compute the same signatures
+    over and over for each new `mock(spec)`, or `when(obj)` for another
+    instance of the same class.  The cache is keyed by the underlying
+    function object.  Replacing a function (or its code or defaults) thus
+    naturally invalidates its entry.  We only hold Python functions weakly,
+    and drop their entry when they get collected, e.g. the methods of
+    classes defined in a test.
+    """
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._store: OrderedDict[tuple[int, bool], tuple] = OrderedDict()
+
+    def _hold(self, fn: Callable, key: tuple[int, bool]) -> object:
+        if not inspect.isfunction(fn):
+            # Builtins can't be referenced weakly, but live as long as
+            # their module anyway.
+            return fn
+
+        store = self._store
+
+        def forget(ref):
+            # Runs before the `id()` of `fn` can be reused.
+            entry = store.get(key)
+            if entry is not None and entry[0] is ref:
+                del store[key]
+
+        return weakref.ref(fn, forget)
+
+    def get(self, fn: Callable, eat_self: bool) -> Signature | None:
+        """Return the signature of `fn`, computing it on a miss.
+
+        If `eat_self` is set, the first parameter, t.i. `self` or `cls`,
+        is dropped.
+        """
+        if not _is_cacheable(fn):
+            return _compute_signature(fn, eat_self)
+
+        key = (id(fn), eat_self)
+        fingerprint = _fingerprint(fn)
+        try:
+            holder, cached_fingerprint, sig = self._store[key]
+        except KeyError:
+            pass
+        else:
+            cached_fn = holder() if type(holder) is weakref.ref else holder
+            if cached_fn is fn and cached_fingerprint == fingerprint:
+                self.hits += 1
+                self._store.move_to_end(key)
+                return sig
+
+        self.misses += 1
+        sig = _load_or_compute_signature(fn, eat_self)
+        self._store[key] = (self._hold(fn, key), fingerprint, sig)
+        self._store.move_to_end(key)
+        if len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+        return sig
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._store))
+
+    def clear(self) -> None:
+        self._store.clear()
+        self.hits = self.misses = 0
+
+
+def _is_cacheable(fn: object) -> bool:
+    # Bound builtin methods are created anew on each attribute access, so
+    # there is no stable object to key them by.
+    return inspect.isfunction(fn) or (
+        inspect.isbuiltin(fn)
+        and (fn.__self__ is None or inspect.ismodule(fn.__self__))
+    )
+
+
+def _fingerprint(fn) -> tuple:
+    return (
+        getattr(fn, '__code__', None),
+        getattr(fn, '__defaults__', None),
+        getattr(fn, '__kwdefaults__', None),
+    )
+
+
+def _load_or_compute_signature(
+    fn: Callable, eat_self: bool
+) -> Signature | None:
+    cache_file = spec_cache.get_spec_cache()
+    if cache_file is None:
+        return _compute_signature(fn, eat_self)
+
+    sig = cache_file.load(fn, eat_self)
+    if sig is spec_cache.MISS:
+        sig = _compute_signature(fn, eat_self)
+        cache_file.store(fn, eat_self, sig)
+    return sig  # type: ignore[return-value]
+
+
+def _compute_signature(fn: Callable, eat_self: bool) -> Signature | None:
+    if eat_self:
+        fn = functools.partial(fn, None)
+
+    try:
+        return signature(fn)
+    except Exception:
+        return None
+
+
+signature_cache = SignatureCache()
+
+
 def get_signature(obj: object, method_name: str) -> Signature | None:
-    method = getattr(obj, method_name)
+    return get_member_signature(obj, method_name, getattr(obj, method_name))
 
+
+def get_member_signature(
+    obj: object, method_name: str, method: Callable
+) -> Signature | None:
+    """Like `get_signature` for the already looked up `method`."""
     # Eat self for unbound methods bc signature doesn't do it
-    if (
+    if inspect.ismethod(method):
+        return signature_cache.get(method.__func__, eat_self=True)
+
+    eat_self = (
         inspect.isclass(obj)
-        and not inspect.ismethod(method)
         and not isinstance(obj.__dict__.get(method_name), staticmethod)
-    ):
-        method = functools.partial(method, None)
+    )
+    return signature_cache.get(method, eat_self=eat_self)
+
+
+class ValidationCache(object):
+    """Remembers the outcome of validating calls against a signature.
+
+    Whether a call binds to a signature only depends on the *shape* of the
+    call, t.i. the number of positional arguments and the names of the
+    keyword arguments, not on the actual values.  So we store the outcome,
+    `None` or the error message, per signature and shape.
+    """
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._store: OrderedDict[int, tuple[Signature, dict]] = OrderedDict()
+
+    def outcomes_for(self, sig: Signature) -> dict:
+        key = id(sig)
+        try:
+            cached_sig, outcomes = self._store[key]
+        except KeyError:
+            pass
+        else:
+            if cached_sig is sig:
+                self._store.move_to_end(key)
+                return outcomes
+
+        # Storing `sig` keeps it alive, so its `id()` cannot be reused.
+        outcomes = {}
+        self._store[key] = (sig, outcomes)
+        self._store.move_to_end(key)
+        if len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+        return outcomes
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+validation_cache = ValidationCache()
+
 
+def _validate(check, sig: Signature, args: tuple, kwargs: dict) -> str | None:
     try:
-        return signature(method)
-    except Exception:
-        return None
+        check(sig, args, kwargs)
+    except TypeError as e:
+        return str(e)
+    return None
+
+
+def match_signature(
+    sig: Signature, args: tuple, kwargs: dict, outcomes: dict | None = None
+) -> None:
+    """Raise a `TypeError` if a call with `args` and `kwargs` doesn't bind.
+
+    Callers which check many calls against the same `sig` can keep the
+    `outcomes` per shape themselves, instead of looking them up in the
+    shared `validation_cache`.
+    """
+    if outcomes is None:
+        outcomes = validation_cache.outcomes_for(sig)
+    shape = (len(args), tuple(kwargs))
+    try:
+        error = outcomes[shape]
+    except KeyError:
+        error = outcomes[shape] = _validate(_bind, sig, args, kwargs)
+    if error is not None:
+        raise TypeError(error)
 
 
-def match_signature(sig: Signature, args: tuple, kwargs: dict) -> None:
+def _bind(sig: Signature, args: tuple, kwargs: dict) -> None:
     sig.bind(*args, **kwargs)
 
 
-def match_signature_allowing_placeholders(  # noqa: C901
+def _placeholder(arg: object) -> object:
+    if arg is Ellipsis or arg is matchers.ARGS_SENTINEL:
+        return arg
+    return None
+
+
+def match_signature_allowing_placeholders(
+    sig: Signature, args: tuple, kwargs: dict
+) -> None:
+    outcomes = validation_cache.outcomes_for(sig)
+    # For the shape, we need to know where the placeholders are
+    shape = (tuple(map(_placeholder, args)), tuple(kwargs))
+    try:
+        error = outcomes[shape]
+    except KeyError:
+        error = outcomes[shape] = _validate(
+            _match_signature_allowing_placeholders, sig, args, kwargs)
+    if error is not None:
+        raise TypeError(error)
+
+
+def _match_signature_allowing_placeholders(  # noqa: C901
     sig: Signature, args: tuple, kwargs: dict
 ) -> None:
     # Let's face it. If this doesn't work out, we have to do it the hard
@@ -0,0 +1,336 @@
+# Copyright (c) 2008-2016 Szczepan Faber, Serhiy Oplakanets, Herr Kaste
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+'''Keep the signatures of specs in a file, across test runs and processes.
+
+Set the environment variable `MOCKITO_SPEC_CACHE` to a file path to enable
+the cache.  Each process maps the file read-only, and looks up signatures
+through the hash table at its start.  New signatures are written back,
+merged with the ones in the file, when the process exits.
+
+We only store what validating calls needs: the names and kinds of the
+parameters, and whether they have a default.  Only plain Python functions
+are stored, keyed by their source file, qualified name, first line and
+number of defaults.  An entry also records the modification time and size
+of the source file; if they don't match anymore, we introspect the
+function live as usual.
+'''
+
+from __future__ import annotations
+import atexit
+import functools
+import inspect
+import mmap
+import os
+import struct
+import zlib
+
+from inspect import Parameter, Signature
+
+from typing import Callable
+
+__all__ = ['get_spec_cache']
+
+ENV_VAR = 'MOCKITO_SPEC_CACHE'
+HEADER = b'mockito-spec-cache 2\n'
+
+# The file starts with `HEADER`, followed by the number of slots of the hash
+# table, and the slots.  A slot holds the CRC32 of a key, and the offset of
+# its record, or zero if it is empty.  The records follow as lines of
+# `key \x1f value`.
+_COUNT = struct.Struct('<I')
+_SLOT = struct.Struct('<II')
+
+#: Returned by `SpecCacheFile.load` if there is no valid entry
+MISS = object()
+
+
+class _CachedDefault(object):
+    # Stands in for the actual default value, which we don't store
+    def __repr__(self):
+        return '...'
+
+
+CACHED_DEFAULT = _CachedDefault()
+
+_KINDS = {int(kind): kind for kind in (
+    Parameter.POSITIONAL_ONLY,
+    Parameter.POSITIONAL_OR_KEYWORD,
+    Parameter.VAR_POSITIONAL,
+    Parameter.KEYWORD_ONLY,
+    Parameter.VAR_KEYWORD,
+)}
+
+
+class SpecCacheFile(object):
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._new: dict[bytes, bytes] = {}
+        self._tokens: dict[str, str | None] = {}
+        self._map: mmap.mmap | None = None
+        self._slots = 0
+        try:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # missing or empty
+            return
+
+        slots = _table_size(mapped)
+        if slots:
+            self._map, self._slots = mapped, slots
+        else:
+            mapped.close()
+
+    def load(self, fn: Callable, eat_self: bool) -> object:
+        """Return the signature of `fn`, maybe None, or `MISS`."""
+        key, token = self._key(fn, eat_self)
+        if key is None:
+            return MISS
+
+        value = self._new.get(key) or self._find(key)
+        if value is None:
+            return MISS
+
+        entry_token, _, params = value.decode().partition('|')
+        if entry_token != token:
+            return MISS
+        return _decode_signature(params)
+
+    def store(self, fn: Callable, eat_self: bool, sig: Signature | None):
+        key, token = self._key(fn, eat_self)
+        if key is None:
+            return
+
+        params = _encode_signature(sig)
+        if params is not None:
+            self._new[key] = ('%s|%s' % (token, params)).encode()
+
+    def flush(self) -> None:
+        """Merge the new entries into the file."""
+        if not self._new:
+            return
+
+        # Other processes may have written the file meanwhile, so we merge
+        # into what is there *now*.
+        self.close()
+        entries = dict(_read_entries(self.path))
+        entries.update(self._new)
+        self._new = {}
+
+        tmp_path = '%s.%s.tmp' % (self.path, os.getpid())
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_encode_file(entries))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _key(self, fn: Callable, eat_self: bool):
+        # Decorated functions or functions with an explicit `__signature__`
+        # take their signature from elsewhere, so their code does not tell.
+        if (
+            not inspect.isfunction(fn)
+            or hasattr(fn, '__wrapped__')
+            or hasattr(fn, '__signature__')
+        ):
+            return None, None
+
+        code = fn.__code__
+        token = self._token_for(code.co_filename)
+        if token is None:
+            return None, None
+
+        # Lambdas e.g. share their name and maybe their line, so we also
+        # take in everything of the code which makes up the signature.
+        n_params = (
+            code.co_argcount + code.co_kwonlyargcount
+            + bool(code.co_flags & inspect.CO_VARARGS)
+            + bool(code.co_flags & inspect.CO_VARKEYWORDS))
+        key = '\0'.join((
+            code.co_filename,
+            fn.__qualname__,
+            str(code.co_firstlineno),
+            '%s,%s,%s,%s' % (
+                code.co_argcount, code.co_posonlyargcount,
+                code.co_kwonlyargcount, code.co_flags),
+            ','.join(code.co_varnames[:n_params]),
+            str(len(fn.__defaults__ or ())),
+            ','.join(sorted(fn.__kwdefaults__ or ())),
+            '1' if eat_self else '0',
+        ))
+        if '\n' in key or '\x1f' in key:
+            return None, None
+        return key.encode('utf-8', 'surrogateescape'), token
+
+    def _token_for(self, filename: str) -> str | None:
+        try:
+            return self._tokens[filename]
+        except KeyError:
+            pass
+
+        try:
+            stat = os.stat(filename)
+        except (OSError, ValueError):
+            token = None
+        else:
+            token = '%s:%s' % (stat.st_mtime_ns, stat.st_size)
+        self._tokens[filename] = token
+        return token
+
+    def _find(self, key: bytes) -> bytes | None:
+        mapped = self._map
+        if mapped is None:
+            return None
+
+        table = len(HEADER) + _COUNT.size
+        mask = self._slots - 1
+        crc = zlib.crc32(key)
+        i = crc & mask
+        while True:
+            slot_crc, offset = \
+                _SLOT.unpack_from(mapped, table + i * _SLOT.size)
+            if not offset:
+                return None
+            if slot_crc == crc:
+                end = mapped.find(b'\n', offset)
+                record_key, _, value = mapped[offset:end].partition(b'\x1f')
+                if record_key == key:
+                    return value
+            i = (i + 1) & mask
+
+
+def _table_size(content) -> int:
+    """Return the number of slots, or zero if `content` is not ours."""
+    start = len(HEADER)
+    if content[:start] != HEADER or len(content) < start + _COUNT.size:
+        return 0
+    slots, = _COUNT.unpack_from(content, start)
+    if (
+        not slots
+        or slots & (slots - 1)
+        or len(content) < start + _COUNT.size + slots * _SLOT.size
+    ):
+        return 0
+    return slots
+
+
+def _encode_file(entries: dict[bytes, bytes]) -> bytes:
+    slots = 8
+    while slots < 2 * len(entries):
+        slots *= 2
+    mask = slots - 1
+
+    table = [(0, 0)] * slots
+    records = []
+    offset = len(HEADER) + _COUNT.size + slots * _SLOT.size
+    for key, value in entries.items():
+        crc = zlib.crc32(key)
+        i = crc & mask
+        while table[i][1]:
+            i = (i + 1) & mask
+        table[i] = (crc, offset)
+        record = b'%s\x1f%s\n' % (key, value)
+        records.append(record)
+        offset += len(record)
+
+    return b''.join([
+        HEADER,
+        _COUNT.pack(slots),
+        b''.join(_SLOT.pack(*slot) for slot in table),
+    ] + records)
+
+
+def _read_entries(path: str):
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+    except OSError:
+        return
+    slots = _table_size(content)
+    if not slots:
+        return
+
+    records = len(HEADER) + _COUNT.size + slots * _SLOT.size
+    for line in content[records:].splitlines():
+        key, sep, value = line.partition(b'\x1f')
+        if sep:
+            yield key, value
+
+
+def _encode_signature(sig: Signature | None) -> str | None:
+    if sig is None:
+        return '-'
+
+    params = []
+    for p in sig.parameters.values():
+        if not p.name.isidentifier():
+            return None
+        params.append('%s:%d:%d' % (
+            p.name, p.kind, p.default is not Parameter.empty))
+    return ','.join(params)
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_signature(params: str) -> Signature | None:
+    # Signatures are immutable, t.i. functions of the same shape can share
+    # one.
+    if params == '-':
+        return None
+
+    parameters = []
+    for param in params.split(',') if params else ():
+        name, kind, has_default = param.split(':')
+        parameters.append(Parameter(
+            name,
+            _KINDS[int(kind)],
+            default=CACHED_DEFAULT if has_default == '1' else Parameter.empty
+        ))
+    return Signature(parameters)
+
+
+_spec_cache: SpecCacheFile | None = None
+
+
+def get_spec_cache() -> SpecCacheFile | None:
+    """Return the cache file named by `MOCKITO_SPEC_CACHE`, if set."""
+    global _spec_cache
+    path = os.environ.get(ENV_VAR)
+    if not path:
+        return None
+
+    if _spec_cache is None or _spec_cache.path != path:
+        if _spec_cache is not None:
+            _spec_cache.flush()
+        _spec_cache = SpecCacheFile(path)
+    return _spec_cache
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    if _spec_cache is not None:
+        _spec_cache.flush()
@@ -22,14 +22,17 @@
 
 import inspect
 
-from .mockito import when2
+from . import monitoring
+from .mockito import ArgumentError, _get_mock
 from .invocation import RememberedProxyInvocation
 from .mocking import Mock, _Dummy, mock_registry
+from .utils import get_obj_attr_tuple
 
 __all__ = ['spy']
 
 
-def spy(object):
+def spy(object, weak=False, only=None, exclude=None, timing=False,
+        history=None, max_invocations=None, fingerprint=False):
     """Spy an object.
 
     Spying means that all functions will behave as before, so they will
@@ -50,7 +53,28 @@ def spy(object):
         do_work(..., time)
         verify(time).time()
 
+    Set ``weak=True`` to not keep the spy alive in the registry until
+    :func:`unstub`, see :func:`mock`.
+
+    For chatty objects, you can restrict the recording to the methods you
+    actually want to verify. Pass the names of these as `only`, or the
+    names of the methods to leave out as `exclude`. All other attributes
+    are the real ones of `object`, and calling them is not recorded. Note
+    that their methods are looked up only once::
+
+        logger = spy(logger, only=['error'])
+        do_work(..., logger)
+        verify(logger).error(...)
+
+    Set ``timing=True`` to also measure how long the calls of the original
+    methods take, see :func:`latency`.
+
+    Pass `history`, `max_invocations` and `fingerprint` to limit what the
+    spy keeps, see :func:`mock`.
+
     """
+    only = _names(only)
+    exclude = _names(exclude) or frozenset()
     if inspect.isclass(object) or inspect.ismodule(object):
         class_ = None
     else:
@@ -61,7 +85,22 @@ def spy(object):
             __class__ = class_
 
         def __getattr__(self, method_name):
-            return RememberedProxyInvocation(theMock, method_name)
+            if (
+                (only is not None and method_name not in only)
+                or method_name in exclude
+            ):
+                value = getattr(object, method_name)
+                # Bound methods we can hand out directly next time.  Other
+                # values may change, so we look them up again.
+                if getattr(value, '__self__', None) is object:
+                    self.__dict__[method_name] = value
+                return value
+
+            # Cache the proxy on the instance, so that we don't end up here
+            # again for the next access.
+            proxy = self.__dict__[method_name] = \
+                _proxy_method(theMock, method_name)
+            return proxy
 
         def __repr__(self):
             name = 'Spied'
@@ -71,13 +110,107 @@ def spy(object):
 
 
     obj = Spy()
-    theMock = Mock(obj, strict=True, spec=object)
+    theMock = Mock(
+        obj, strict=True, spec=object,
+        history=history, max_invocations=max_invocations,
+        fingerprint=fingerprint)
+    if timing:
+        theMock.enable_timing()
 
-    mock_registry.register(obj, theMock)
+    mock_registry.register(obj, theMock, weak=weak)
     return obj
 
 
-def spy2(fn) -> None:
+_MISSING = object()
+
+
+def _names(names):
+    if names is None:
+        return None
+    if isinstance(names, str):
+        return frozenset((names,))
+    return frozenset(names)
+
+
+def _proxy_method(theMock, method_name):
+    """Return a function which remembers and forwards calls to `method_name`.
+
+    We resolve the method on the original object only once.  If the
+    attribute gets reassigned, we notice by looking at the `__dict__`s
+    Python looks it up in, up to the first one which has it, and resolve
+    again.  Objects which compute their attributes, t.i. which have a
+    `__getattr__` or a `__getattribute__` of their own, we ask every time.
+    """
+    obj = theMock.spec
+    lookup = _lookup_dicts(obj)
+    #: The dicts up to the one which has the method, and what they held
+    #: when we resolved it; `None` if we have to resolve every time
+    watched = None
+    method = None
+
+    def proxy(*params, **named_params):
+        nonlocal watched, method
+        stale = watched is None
+        if not stale:
+            for attrs, value in watched:
+                if attrs.get(method_name, _MISSING) is not value:
+                    stale = True
+                    break
+        if stale:
+            watched = _watch(lookup, method_name)
+            try:
+                method = getattr(obj, method_name)
+            except AttributeError:
+                method = watched = None
+
+        invocation = RememberedProxyInvocation(theMock, method_name, method)
+        return invocation(*params, **named_params)
+
+    proxy.__name__ = proxy.__qualname__ = method_name
+    return proxy
+
+
+def _lookup_dicts(obj):
+    """Return the `__dict__`s Python looks up the attributes of `obj` in.
+
+    Returns `None` if `obj` computes its attributes.
+    """
+    cls = type(obj)
+    if (
+        getattr(cls, '__getattr__', None) is not None
+        or cls.__getattribute__ not in _PLAIN_GETATTRIBUTES
+    ):
+        return None
+
+    lookup = [klass.__dict__ for klass in cls.__mro__]
+    if inspect.isclass(obj):
+        return [klass.__dict__ for klass in obj.__mro__] + lookup
+    own_attrs = getattr(obj, '__dict__', None)
+    if own_attrs is not None:
+        lookup.insert(0, own_attrs)
+    return lookup
+
+
+_PLAIN_GETATTRIBUTES = (
+    object.__getattribute__, type.__getattribute__,
+    type(inspect).__getattribute__)
+
+
+def _watch(lookup, method_name):
+    if lookup is None:
+        return None
+
+    watched = []
+    for attrs in lookup:
+        value = attrs.get(method_name, _MISSING)
+        watched.append((attrs, value))
+        if value is not _MISSING:
+            return watched
+    # Not found, e.g. provided by a module's `__getattr__`
+    return None
+
+
+def spy2(fn, monitor=False, timing=False) -> None:
     """Spy usage of given `fn`.
 
     Patches the module, class or object `fn` lives in, so that all
@@ -93,6 +226,36 @@ def spy2(fn) -> None:
 
     Note that builtins often cannot be patched because they're read-only.
 
+    On Python 3.12 and later, you can pass ``monitor=True`` to not patch
+    anything but to watch the function through :mod:`sys.monitoring`
+    instead. Then calls from modules which imported the function by name,
+    e.g. with ``from time import time``, get recorded as well, and the
+    function runs without any wrapper around it. You can't stub such a
+    function with :func:`when` though, nor watch a stubbed one; both raise
+    an `ArgumentError`. And since we only see the arguments after Python
+    bound them to the parameters, the calls are recorded in a normalized
+    form: positional parameters as positional arguments, and
+    with all defaults filled in.  Verifications get the same treatment, so
+    it doesn't matter how you pass the arguments there.
+
+    Pass ``timing=True`` to also measure how long the calls take, see
+    :func:`latency`.
 
     """
-    when2(fn, Ellipsis).thenCallOriginalImplementation()
+    if monitor:
+        if timing:
+            raise ArgumentError("Can't time calls we only watch.")
+        monitoring.check_available()
+
+    obj, name = get_obj_attr_tuple(fn)
+    theMock = _get_mock(obj, strict=True)
+    if timing:
+        theMock.enable_timing()
+    if monitor:
+        if theMock.stubbed_invocations_for(name):
+            raise ArgumentError(
+                "Can't watch '%s', it is stubbed or spied already." % name)
+        monitoring.watch(theMock, name)
+        return
+
+    theMock.pass_through(name)
@@ -0,0 +1,136 @@
+# Copyright (c) 2008-2016 Szczepan Faber, Serhiy Oplakanets, Herr Kaste
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+'''Measure how long the original implementations of spied methods take.'''
+
+from __future__ import annotations
+import functools
+from array import array
+from time import perf_counter_ns
+
+from typing import Any, Callable
+
+__all__ = ['Histogram', 'timed']
+
+# Like HdrHistogram, we split each power of two into the same number of
+# buckets, so that every bucket is at most 1/32 (~3%) wider than its
+# lower bound.  Values up to 2**SUB_BUCKET_BITS get a bucket each.
+SUB_BUCKET_BITS = 6
+_HALF = 1 << (SUB_BUCKET_BITS - 1)
+#: Longer calls (2**40ns are about 18 minutes) all go into the last bucket.
+MAX_BITS = 40
+
+
+def _index(value: int) -> int:
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    if shift <= 0:
+        return value
+    return shift * _HALF + (value >> shift)
+
+
+def _highest_value(index: int) -> int:
+    # The inverse of `_index`, t.i. the largest value of the bucket.
+    if index < 2 * _HALF:
+        return index
+    shift = index // _HALF - 1
+    return ((index - shift * _HALF + 1) << shift) - 1
+
+
+_BUCKETS = _index((1 << MAX_BITS) - 1) + 1
+
+
+class Histogram(object):
+    """The wall times of the calls of one method, in nanoseconds.
+
+    Values are counted in fixed buckets, so the percentiles are accurate
+    to about 3%, while `min` and `max` are exact.  An empty histogram
+    reports zero for all of them.
+    """
+
+    def __init__(self) -> None:
+        self.counts = array('Q', bytes(8 * _BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        if value > self.max:
+            self.max = value
+        if value < self.min or not self.count:
+            self.min = value
+        self.count += 1
+        self.total += value
+
+        # `_index`, inlined as we're on the hot path
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        index = value if shift <= 0 else shift * _HALF + (value >> shift)
+        self.counts[index if index < _BUCKETS else _BUCKETS - 1] += 1
+
+    def percentile(self, percent: float) -> int:
+        """Return the value `percent` of the calls took at most."""
+        if not 0 <= percent <= 100:
+            raise ValueError('percent must be between 0 and 100')
+        if not self.count:
+            return 0
+
+        # The rank of the wanted value, t.i. ceil(count * percent / 100)
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return max(self.min, min(_highest_value(index), self.max))
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def p50(self) -> int:
+        return self.percentile(50)
+
+    @property
+    def p90(self) -> int:
+        return self.percentile(90)
+
+    @property
+    def p99(self) -> int:
+        return self.percentile(99)
+
+    def __repr__(self):
+        return "<Histogram count=%s p50=%sns p99=%sns max=%sns>" % (
+            self.count, self.p50, self.p99, self.max)
+
+
+def timed(fn: Callable, histogram: Histogram) -> Callable:
+    """Wrap `fn` to record the wall time of each call in `histogram`."""
+    record = histogram.record
+
+    @functools.wraps(fn)
+    def timed_fn(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            record(perf_counter_ns() - start)
+
+    return timed_fn
@@ -0,0 +1,164 @@
+# Copyright (c) 2008-2016 Szczepan Faber, Serhiy Oplakanets, Herr Kaste
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+'''Generate replacement functions tailored to the signature of the original.
+
+A "trampoline" takes the positional parameters of the function it replaces
+as positional-only parameters, so that Python itself unpacks a call, and
+then jumps to ``dispatch(params, params_without_first_arg, named_params)``.
+A prepended `self` is dropped without slicing.  Purely positional calls are
+validated by a simple range check that is part of the generated code; all
+other calls are validated by ``validate(params, named_params)`` as usual.
+
+The recorded call stays exactly as it was made: positional arguments are
+recorded as positional arguments, keyword arguments as keyword arguments.
+'''
+
+from __future__ import annotations
+import keyword
+import os
+import sys
+
+from .signature import Parameter, Signature
+
+from typing import Callable
+
+__all__ = ['make_trampoline', 'trampolines_enabled']
+
+
+def trampolines_enabled() -> bool:
+    return os.environ.get("MOCKITO_TRAMPOLINES", "0") == "1"
+
+
+class _Missing(object):
+    def __repr__(self):
+        return 'MISSING'
+
+
+MISSING = _Missing()
+
+POSITIONAL = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def make_trampoline(
+    name: str,
+    sig: Signature,
+    eat_self: bool,
+    dispatch: Callable,
+    validate: Callable
+) -> Callable | None:
+    """Return a trampoline for a function with the signature `sig`.
+
+    `sig` does not contain `self`.  If `eat_self` is set, the trampoline
+    takes an additional first argument, which is passed to `dispatch` but
+    not recorded.  Returns `None` if we cannot generate a trampoline.
+    """
+    # Positional-only parameters need Python 3.8
+    if sys.version_info < (3, 8):
+        return None
+
+    positional = [p for p in sig.parameters.values() if p.kind in POSITIONAL]
+    required = len([p for p in positional if p.default is Parameter.empty])
+    has_var_positional = any(
+        p.kind is Parameter.VAR_POSITIONAL for p in sig.parameters.values())
+    has_required_keywords = any(
+        p.kind is Parameter.KEYWORD_ONLY and p.default is Parameter.empty
+        for p in sig.parameters.values())
+
+    fn_name = name if _is_valid_name(name) else '_mockito_trampoline'
+    source = _generate(
+        fn_name,
+        eat_self,
+        len(positional),
+        _fast_path_condition(
+            required,
+            None if has_var_positional else len(positional),
+            has_required_keywords
+        )
+    )
+    namespace: dict[str, object] = {
+        '_mockito_missing': MISSING,
+        '_mockito_dispatch': dispatch,
+        '_mockito_validate': validate,
+    }
+    exec(compile(source, '<mockito trampoline>', 'exec'), namespace)
+    fn: Callable = namespace[fn_name]  # type: ignore[assignment]
+    fn.__name__ = name
+    return fn
+
+
+def _is_valid_name(name: str) -> bool:
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _fast_path_condition(
+    required: int, maximum: int | None, has_required_keywords: bool
+) -> str:
+    # Without any keyword arguments, a call binds iff the number of
+    # positional arguments is in range.
+    if has_required_keywords:
+        return 'False'
+    conditions = ['not _mockito_kwargs']
+    if required:
+        conditions.append('%i <= len(_mockito_params)' % required)
+    if maximum is not None:
+        conditions.append('len(_mockito_params) <= %i' % maximum)
+    return ' and '.join(conditions)
+
+
+def _generate(
+    name: str, eat_self: bool, positional: int, fast_path_condition: str
+) -> str:
+    names = ['_mockito_p%i' % i for i in range(positional)]
+    parameter_list = (
+        (['_mockito_self'] if eat_self else [])
+        + ['%s=_mockito_missing' % n for n in names]
+        + ['/'] * bool(eat_self or names)
+        + ['*_mockito_args', '**_mockito_kwargs']
+    )
+
+    # A missing positional argument means all following ones are missing
+    # too, t.i. we have a sequence of `if/elif`s here.
+    body = []
+    for i, n in enumerate(names):
+        body += [
+            "%s %s is _mockito_missing:" % ('elif' if i else 'if', n),
+            "    _mockito_params = (%s)" % ''.join(
+                m + ', ' for m in names[:i]),
+        ]
+    given = "(%s) + _mockito_args" % ''.join(m + ', ' for m in names)
+    if names:
+        body += ["else:", "    _mockito_params = %s" % given]
+    else:
+        body += ["_mockito_params = _mockito_args"]
+
+    body += [
+        "if not (%s):" % fast_path_condition,
+        "    _mockito_validate(_mockito_params, _mockito_kwargs)",
+        "return _mockito_dispatch(%s, _mockito_params, _mockito_kwargs)" % (
+            "(_mockito_self,) + _mockito_params" if eat_self
+            else "_mockito_params"
+        ),
+    ]
+    return "def %s(%s):\n%s" % (
+        name,
+        ', '.join(parameter_list),
+        ''.join('    %s\n' % line for line in body)
+    )
@@ -175,7 +175,13 @@ class InOrder(VerificationMode):
     def verify(
         self, wanted_invocation: MatchingInvocation, count: int
     ) -> None:
-        for invocation in wanted_invocation.mock.invocations:
+        invocations = wanted_invocation.mock.invocations
+        if not invocations.ordered:
+            raise VerificationError(
+                "\nCan't verify the order of invocations, as the mock only "
+                "counted them.")
+
+        for invocation in invocations:
             if not invocation.verified_inorder:
                 if not wanted_invocation.matches(invocation):
                     raise VerificationError(
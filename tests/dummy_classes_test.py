@@ -0,0 +1,128 @@
+import gc
+import weakref
+
+import pytest
+
+from mockito import mock, mock_many, when, verify, unstub
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+class Dog(object):
+    def bark(self, sound='Wuff'):
+        return sound
+
+    @classmethod
+    def create(cls):
+        return cls()
+
+    @staticmethod
+    def greet(name):
+        return 'Hi ' + name
+
+
+class TestSharedDummyClasses:
+    def testDummiesOfTheSameSpecShareTheirClass(self):
+        assert type(mock()) is type(mock())
+        assert type(mock(Dog)) is type(mock(Dog))
+        assert type(mock(Dog)) is not type(mock(Dog, strict=False))
+        assert type(mock(Dog)) is not type(mock())
+
+    def testStubbingMethodsKeepsTheSharedClass(self):
+        rex, bello = mock(Dog), mock(Dog)
+        when(rex).bark().thenReturn('Grr')
+
+        assert type(rex) is type(bello)
+
+    def testStubbingMagicMethodsGivesADummyAClassOfItsOwn(self):
+        a, b = mock(), mock()
+        when(a).__len__().thenReturn(2)
+
+        assert type(a) is not type(b)
+        assert type(a).__base__ is type(b)
+
+    def testStubbedMethodsStayWithTheirDummy(self):
+        rex, bello = mock(Dog), mock(Dog)
+        when(rex).bark().thenReturn('Grr')
+
+        assert rex.bark() == 'Grr'
+        with pytest.raises(AttributeError):
+            bello.bark()
+
+    def testStubbedMagicMethodsStayWithTheirDummy(self):
+        a, b = mock(), mock()
+        when(a).__call__().thenReturn(1)
+        when(a).__len__().thenReturn(2)
+
+        assert a() == 1
+        assert len(a) == 2
+        assert b() is None
+        with pytest.raises(TypeError):
+            len(b)
+        verify(a).__call__()
+        verify(b).__call__()
+
+    def testUnstubRemovesStubbedMagicMethods(self):
+        dummy = mock()
+        when(dummy).__call__().thenReturn(1)
+        when(dummy).__len__().thenReturn(2)
+
+        unstub(dummy)
+        assert dummy() is None
+        with pytest.raises(TypeError):
+            len(dummy)
+
+    def testStubClassAndStaticMethods(self):
+        dog = mock(Dog)
+        when(dog).create().thenReturn('Rex')
+        when(dog).greet('Rex').thenReturn('Hi')
+
+        assert dog.create() == 'Rex'
+        assert dog.greet('Rex') == 'Hi'
+        verify(dog).create()
+        verify(dog).greet('Rex')
+
+    def testConfigurationStaysWithItsDummy(self):
+        dummy = mock({'name': 'Rex', '__len__': lambda: 3})
+        assert dummy.name == 'Rex'
+        assert len(dummy) == 3
+
+        other = mock()
+        assert callable(other.name)
+        with pytest.raises(TypeError):
+            len(other)
+
+    def testSettingUpTheClassOfAnUnspeccedDummyStaysWithIt(self):
+        dummy = mock()
+        dummy.__class__.name = property(lambda self: 'Rex')
+
+        assert dummy.name == 'Rex'
+        assert isinstance(dummy, dummy.__class__)
+        assert callable(mock().name)
+        assert not hasattr(type(mock()), 'name')
+
+
+class TestSpecsAreNotKeptAlive:
+    @pytest.mark.parametrize('lazy', [False, True])
+    def testSpecClass(self, lazy):
+        class Cat(object):
+            def meow(self):
+                pass
+
+        ref = weakref.ref(Cat)
+        when(mock(Cat, lazy=lazy)).meow().thenReturn('Meow')
+        unstub()
+        del Cat
+        gc.collect()
+        assert ref() is None
+
+    def testSpecInstance(self):
+        dog = Dog()
+        ref = weakref.ref(dog)
+        mock(spec=dog)
+        mock_many(dog, n=2)
+        unstub()
+        del dog
+        gc.collect()
+        assert ref() is None
@@ -0,0 +1,207 @@
+from array import array
+
+import pytest
+
+from mockito import (
+    ANY, arg_that, captor, ensureNoUnverifiedInteractions, eq, expect,
+    inorder, mock, spy, verify, when)
+from mockito import fingerprints
+from mockito.fingerprints import Fingerprint, take
+from mockito.matchers import MatcherError
+from mockito.verification import VerificationError
+
+from .test_base import recorded
+
+
+pytestmark = pytest.mark.usefixtures('unstub')
+
+
+class Handle(object):
+    pass
+
+
+class Socket(object):
+    def send(self, data, flags=0):
+        return len(data)
+
+
+class TestTake:
+    @pytest.fixture(autouse=True)
+    def fingerprintEverything(self, monkeypatch):
+        monkeypatch.setattr(fingerprints, 'MIN_SIZE', 0)
+
+    @pytest.mark.parametrize('value', [
+        b'data', bytearray(b'data'), 'text', [1, 'a'], (1, b'a'), {'a': [1]},
+        {1, 2}, frozenset([b'a']), array('d', [1.5, 2.5]),
+    ])
+    def testEqualsTheValue(self, value):
+        fingerprint = take(value)
+
+        assert isinstance(fingerprint, Fingerprint)
+        assert fingerprint == value
+        assert value == fingerprint
+        assert fingerprint == take(value)
+        assert hash(fingerprint) == hash(take(value))
+
+    @pytest.mark.parametrize('value', [1, 1.5, None, True, Handle()])
+    def testKeepsNumbersAndOtherObjects(self, value):
+        assert take(value) is value
+
+    def testKeepsContainersOfOtherObjects(self):
+        value = [1, Handle()]
+        assert take(value) is value
+
+    @pytest.mark.parametrize('a, b', [
+        ([1, 2.0], [1.0, 2]),
+        ({'a': 1, 'b': 2}, {'b': 2, 'a': 1}),
+        ({3, 1, 2}, frozenset([1, 2, 3])),
+        (b'abc', bytearray(b'abc')),
+    ])
+    def testEqualValuesHaveTheSameDigest(self, a, b):
+        assert take(a) == take(b)
+
+    @pytest.mark.parametrize('a, b', [
+        ('1', 1),
+        ('a', b'a'),
+        ([1, 2], (1, 2)),
+        ([[1], 2], [[1, 2]]),
+        (array('i', [1]), array('d', [1])),
+    ])
+    def testDifferentValuesHaveDifferentDigests(self, a, b):
+        assert take(a) != take(b)
+
+    def testHashesNonContiguousBuffers(self):
+        view = memoryview(b'abcdef')[::2]
+        assert take(view) == b'ace'
+
+    def testKeepsTheMetadata(self):
+        fingerprint = take(b'x' * 100)
+
+        assert fingerprint.type is bytes
+        assert fingerprint.length == 100
+        assert repr(fingerprint).startswith('<bytes len=100 digest=')
+
+
+class TestSmallValues:
+    @pytest.mark.parametrize('value', [
+        b'data', 'text', [1, b'a'], {'a': [1]}, array('d', [1.5, 2.5])])
+    def testAreKeptAsTheyAre(self, value):
+        assert take(value) is value
+
+    @pytest.mark.parametrize('value', [
+        b'x' * 256, 'x' * 256, [b'x' * 200, b'y' * 200],
+        {'a': b'x' * 200, 'b': b'y' * 200}, array('d', range(32))])
+    def testLargeValuesGetAFingerprint(self, value):
+        assert isinstance(take(value), Fingerprint)
+
+
+class TestRecording:
+    def testKeepsFingerprintsInsteadOfTheArguments(self):
+        m = mock(fingerprint=True)
+        payload = b'x' * 1000
+        m.send(payload, 1, meta={'id': 1}, header={'id': b'y' * 1000})
+
+        invocation, = recorded(m)
+        data, flags = invocation.params
+        assert isinstance(data, Fingerprint)
+        assert data is not payload
+        assert flags == 1
+        assert invocation.named_params['meta'] == {'id': 1}
+        assert isinstance(invocation.named_params['header'], Fingerprint)
+
+    def testPrintsWantedArgumentsAsWritten(self):
+        m = mock(fingerprint=True)
+        m.send(b'x' * 1000)
+
+        with pytest.raises(VerificationError) as exc:
+            verify(m).send(b'y' * 1000)
+        wanted, actual = str(exc.value).split('Instead got:')
+        assert repr(b'y' * 1000) in wanted
+        assert '<bytes len=1000 digest=' in actual
+
+    def testVerifiesConcreteValuesByDigest(self):
+        m = mock(fingerprint=True)
+        m.send(b'x' * 1000)
+        m.send(b'y', meta={'id': 1})
+
+        verify(m).send(b'x' * 1000)
+        verify(m).send(b'y', meta={'id': 1})
+        verify(m, times=0).send(b'z')
+        verify(m, times=2).send(...)
+        ensureNoUnverifiedInteractions(m)
+
+    def testInOrder(self):
+        m = mock(fingerprint=True)
+        m.send(b'a')
+        m.send(b'b')
+
+        inorder.verify(m).send(b'a')
+        inorder.verify(m).send(b'b')
+
+    def testStubsSeeTheRealArguments(self):
+        m = mock(fingerprint=True)
+        values = captor()
+        when(m).send(values).thenReturn('captured')
+        when(m).send(arg_that(lambda data: data.startswith(b'x'))) \
+            .thenAnswer(lambda data: len(data))
+
+        assert m.send(b'xyz') == 3
+        assert m.send(b'abc') == 'captured'
+        assert values.value == b'abc'
+
+    def testExpect(self):
+        m = mock(fingerprint=True)
+        expect(m, times=1).send(b'data').thenReturn(4)
+
+        assert m.send(b'data') == 4
+        ensureNoUnverifiedInteractions(m)
+
+    def testSpy(self):
+        s = spy(Socket(), fingerprint=True)
+        assert s.send(b'data') == 4
+
+        verify(s).send(b'data')
+
+    @pytest.mark.parametrize('history', ['counts', 'disk', 2])
+    def testCombinesWithHistory(self, history):
+        m = mock(history=history, fingerprint=True)
+        for i in range(3):
+            m.send(b'x' * 1000)
+
+        verify(m, atleast=2).send(b'x' * 1000)
+
+
+DATA = b'data' * 100
+
+
+class TestMatchers:
+    @pytest.mark.parametrize('matcher', [
+        ANY, ANY(), ANY(bytes), eq(DATA), Ellipsis])
+    def testMatchersWhichDontNeedTheValue(self, matcher):
+        m = mock(fingerprint=True)
+        m.send(DATA)
+
+        verify(m).send(matcher)
+
+    def testAnyChecksTheType(self):
+        m = mock(fingerprint=True)
+        m.send(DATA)
+
+        with pytest.raises(VerificationError):
+            verify(m).send(ANY(str))
+
+    @pytest.mark.parametrize('matcher', [
+        arg_that(lambda data: len(data) == 400), captor()])
+    def testMatchersWhichNeedTheValueRaise(self, matcher):
+        m = mock(fingerprint=True)
+        m.send(DATA)
+
+        with pytest.raises(MatcherError) as exc:
+            verify(m).send(matcher)
+        assert 'needs the real value' in str(exc.value)
+
+    def testMatchersSeeValuesWeKept(self):
+        m = mock(fingerprint=True)
+        m.send(3)
+
+        verify(m).send(arg_that(lambda n: n > 2))
@@ -0,0 +1,409 @@
+import pytest
+
+from mockito import (
+    ANY, ensureNoUnverifiedInteractions, forget_invocations, inorder, mock,
+    expect, mock_many, spy, spy2, verify, when)
+from mockito import history
+from mockito.invocation import InvocationError
+from mockito.mock_registry import mock_registry
+from mockito.verification import VerificationError
+
+from . import module
+from .test_base import recorded
+
+
+pytestmark = pytest.mark.usefixtures('unstub')
+
+
+class Heart(object):
+    def beat(self, n):
+        return n
+
+
+class TestHistory:
+    def testKeepsTheLatestInvocations(self):
+        m = mock(history=3)
+        for i in range(10):
+            m.beat(i)
+
+        assert [i.params for i in recorded(m)] == [(7,), (8,), (9,)]
+
+    def testCountsAllCalls(self):
+        m = mock(history=3)
+        for i in range(10):
+            m.beat(i)
+        m.stop()
+
+        verify(m, times=10).beat(...)
+        verify(m, times=1).stop(...)
+
+    def testVerifiesKeptInvocations(self):
+        m = mock(history=3)
+        for i in range(10):
+            m.beat(i)
+
+        verify(m, atleast=1).beat(9)
+
+    def testAtLeastPassesIfTheKeptInvocationsSuffice(self):
+        m = mock(history=3)
+        for i in range(10):
+            m.beat(1)
+
+        verify(m, atleast=3).beat(1)
+
+    @pytest.mark.parametrize('verification', [
+        dict(times=10),
+        dict(atleast=4),
+        dict(atmost=3),
+        dict(times=0),
+    ])
+    def testRaisesIfTheCountIsUnknown(self, verification):
+        m = mock(history=3)
+        for i in range(10):
+            m.beat(1)
+
+        with pytest.raises(VerificationError) as exc:
+            verify(m, **verification).beat(1)
+        assert "Can't tell how often" in str(exc.value)
+
+    def testExactAsLongAsNothingOfTheMethodIsDropped(self):
+        m = mock(history=3)
+        for i in range(10):
+            m.tick()
+        m.beat(1)
+
+        verify(m, times=1).beat(1)
+        verify(m, times=0).beat(2)
+
+    def testEnsureNoUnverifiedInteractionsSeesOnlyKeptInvocations(self):
+        m = mock(history=2)
+        m.beat(1)
+        m.beat(2)
+        m.beat(3)
+
+        verify(m, atleast=1).beat(2)
+        verify(m, atleast=1).beat(3)
+        ensureNoUnverifiedInteractions(m)
+
+    def testInOrder(self):
+        m = mock(history=2)
+        m.beat(1)
+        m.beat(2)
+        m.beat(3)
+
+        inorder.verify(m, atleast=1).beat(2)
+        inorder.verify(m, atleast=1).beat(3)
+
+    def testForgetInvocationsKeepsTheHistory(self):
+        m = mock(history=2)
+        m.beat(1)
+        forget_invocations(m)
+        for i in range(5):
+            m.beat(i)
+
+        verify(m, times=5).beat(...)
+        assert len(recorded(m)) == 2
+
+    def testSpy(self):
+        s = spy(Heart(), history=1)
+        assert s.beat(1) == 1
+        assert s.beat(2) == 2
+
+        verify(s, times=2).beat(...)
+        verify(s, atleast=1).beat(2)
+
+    def testMockMany(self, monkeypatch):
+        monkeypatch.setattr(history, '_defaults', (1, None))
+        hearts = mock_many(n=2)
+        for heart in hearts:
+            heart.beat(1)
+            heart.beat(2)
+
+        verify(hearts, times=4).beat(...)
+        verify(hearts, atleast=2).beat(2)
+        with pytest.raises(VerificationError):
+            verify(hearts, atleast=1).beat(1)
+
+    @pytest.mark.parametrize('history', [0, -1, True, False, 1.5])
+    def testRejectsEmptyHistories(self, history):
+        with pytest.raises(ValueError):
+            mock(history=history)
+
+
+class TestEnvironment:
+    @pytest.mark.parametrize('value, expected', [
+        ('3', 3), ('counts', 'counts'), ('disk', 'disk'), ('', None)])
+    def testReadsTheHistory(self, monkeypatch, value, expected):
+        monkeypatch.setenv(history.HISTORY_ENV_VAR, value)
+        assert history._from_env(history.HISTORY_ENV_VAR) == expected
+
+    @pytest.mark.parametrize('value', ['-5', '0', 'count'])
+    def testRejectsBadHistories(self, monkeypatch, value):
+        monkeypatch.setenv(history.HISTORY_ENV_VAR, value)
+        with pytest.raises(ValueError) as exc:
+            history._from_env(history.HISTORY_ENV_VAR)
+        assert str(exc.value).startswith("MOCKITO_HISTORY='%s': " % value)
+
+    def testReadsTheMaxInvocations(self, monkeypatch):
+        monkeypatch.setenv(history.MAX_INVOCATIONS_ENV_VAR, '1000000')
+        assert history._int_from_env(history.MAX_INVOCATIONS_ENV_VAR) \
+            == 1000000
+
+    @pytest.mark.parametrize('value', ['1e6', '-1', '0', 'many'])
+    def testRejectsBadMaxInvocations(self, monkeypatch, value):
+        monkeypatch.setenv(history.MAX_INVOCATIONS_ENV_VAR, value)
+        with pytest.raises(ValueError) as exc:
+            history._int_from_env(history.MAX_INVOCATIONS_ENV_VAR)
+        assert str(exc.value).startswith(
+            "MOCKITO_MAX_INVOCATIONS='%s': " % value)
+
+    def testReadsTheEnvironmentOnTheFirstLog(self, monkeypatch):
+        monkeypatch.setattr(history, '_defaults', None)
+        monkeypatch.setenv(history.HISTORY_ENV_VAR, '1')
+        monkeypatch.setenv(history.MAX_INVOCATIONS_ENV_VAR, '5')
+
+        assert isinstance(
+            mock_registry.mock_for(mock()).invocations, history.BoundedLog)
+        assert history._defaults == (1, 5)
+
+    def testRaisesForBadValuesOnTheFirstLog(self, monkeypatch):
+        monkeypatch.setattr(history, '_defaults', None)
+        monkeypatch.setenv(history.MAX_INVOCATIONS_ENV_VAR, 'many')
+
+        with pytest.raises(ValueError):
+            mock()
+        assert history._defaults is None
+
+class TestMaxInvocations:
+    @pytest.mark.parametrize('max_invocations', [0, True, 1.5])
+    def testRejectsBadLimits(self, max_invocations):
+        with pytest.raises(ValueError):
+            mock(max_invocations=max_invocations)
+
+    def testRaisesOnTheCallAfterTheLimit(self):
+        m = mock(max_invocations=3)
+        for i in range(3):
+            m.beat(i)
+
+        with pytest.raises(InvocationError) as exc:
+            m.beat(3)
+        assert "more than 3 calls" in str(exc.value)
+        assert "'beat'" in str(exc.value)
+        verify(m, times=3).beat(...)
+
+    def testKeepsAllInvocationsWithoutHistory(self):
+        m = mock(max_invocations=3)
+        for i in range(3):
+            m.beat(i)
+
+        assert len(recorded(m)) == 3
+
+    def testCombinesWithHistory(self):
+        m = mock(history=1, max_invocations=3)
+        for i in range(3):
+            m.beat(i)
+
+        with pytest.raises(InvocationError):
+            m.beat(3)
+
+    def testStartsOverAfterForgettingTheInvocations(self):
+        m = mock(max_invocations=1)
+        m.beat(1)
+        forget_invocations(m)
+
+        m.beat(2)
+        verify(m).beat(2)
+
+    def testAppliesToAllMocksByDefault(self, monkeypatch):
+        monkeypatch.setattr(history, '_defaults', (None, 1))
+        spy2(module.one_arg)
+        when(module).send(...).thenReturn('sent')
+
+        module.one_arg('foo')
+        with pytest.raises(InvocationError):
+            module.send('foo')
+
+
+class TestCounts:
+    def testKeepsOneInvocationPerDistinctCall(self):
+        m = mock(history='counts')
+        for i in range(100):
+            m.beat(i % 3)
+            m.beat(i % 3, loud=True)
+
+        assert len(recorded(m)) == 6
+
+    def testVerifiesCounts(self):
+        m = mock(history='counts')
+        for i in range(10):
+            m.beat(i % 2)
+
+        verify(m, times=5).beat(0)
+        verify(m, times=10).beat(...)
+        verify(m, atleast=10).beat(ANY(int))
+        verify(m, times=0).beat(2)
+        with pytest.raises(VerificationError):
+            verify(m, times=4).beat(1)
+
+    def testCountsKeywordArgumentsRegardlessOfTheirOrder(self):
+        m = mock(history='counts')
+        m.beat(a=1, b=2)
+        m.beat(b=2, a=1)
+
+        verify(m, times=2).beat(a=1, b=2)
+        assert len(recorded(m)) == 1
+
+    def testCountsUnhashableArguments(self):
+        m = mock(history='counts')
+        m.post({'id': 1})
+        m.post({'id': 1})
+        m.post({'id': 2}, tags=['a'])
+
+        verify(m, times=2).post({'id': 1})
+        verify(m, times=1).post({'id': 2}, tags=['a'])
+        assert len(recorded(m)) == 2
+
+    def testCountsEqualArgumentsOfDifferentTypesApart(self):
+        m = mock(history='counts')
+        m.beat(1)
+        m.beat(1.0)
+        m.beat(True)
+        m.post([1], n=1)
+        m.post([1], n=1.0)
+
+        verify(m, times=3).beat(1)
+        verify(m, times=1).beat(ANY(float))
+        verify(m, times=1).beat(ANY(bool))
+        verify(m, times=2).post([1], n=1)
+        verify(m, times=1).post([1], n=ANY(float))
+        assert len(recorded(m)) == 5
+
+    def testUnverifiedInteractions(self):
+        m = mock(history='counts')
+        m.beat(1)
+        m.beat(1)
+        m.stop()
+
+        verify(m, times=2).beat(1)
+        with pytest.raises(VerificationError):
+            ensureNoUnverifiedInteractions(m)
+        verify(m).stop()
+        ensureNoUnverifiedInteractions(m)
+
+    def testCannotVerifyTheOrder(self):
+        m = mock(history='counts')
+        m.beat(1)
+
+        with pytest.raises(VerificationError) as exc:
+            inorder.verify(m).beat(1)
+        assert "only counted them" in str(exc.value)
+
+    def testStubsStillAnswer(self):
+        m = mock(history='counts')
+        when(m).beat(1).thenReturn('one')
+
+        assert m.beat(1) == 'one'
+        assert m.beat(1) == 'one'
+        verify(m, times=2).beat(1)
+
+    def testWithMaxInvocations(self):
+        m = mock(history='counts', max_invocations=2)
+        m.beat(1)
+        m.beat(1)
+
+        with pytest.raises(InvocationError):
+            m.beat(1)
+
+    def testRejectsUnknownModes(self):
+        with pytest.raises(ValueError):
+            mock(history='all')
+
+
+class Handle(object):
+    pass
+
+
+class Unpicklable(object):
+    def __eq__(self, other):
+        return isinstance(other, Unpicklable)
+
+    def __reduce__(self):
+        raise TypeError("can't pickle")
+
+
+class TestDisk:
+    def testVerifies(self):
+        m = mock(history='disk')
+        for i in range(10):
+            m.send(i % 2, data=b'x' * i)
+        m.stop()
+
+        verify(m, times=10).send(...)
+        verify(m).send(1, data=b'x')
+        verify(m, times=5).send(0, data=ANY(bytes))
+        verify(m).stop()
+        ensureNoUnverifiedInteractions(m)
+
+    def testOpensTheFileOnlyOnTheFirstCall(self):
+        m = mock(history='disk')
+        verify(m, times=0).send(...)
+        assert list(recorded(m)) == []
+        assert recorded(m)._file is None
+
+        m.send(1)
+        assert recorded(m)._file is not None
+
+    def testIteratesInOrder(self):
+        m = mock(history='disk')
+        m.send(1)
+        m.stop()
+        m.send(2, flag=True)
+
+        assert [str(i) for i in recorded(m)] == [
+            'send(1)', 'stop()', 'send(2, flag=True)']
+        assert str(recorded(m)[-1]) == 'send(2, flag=True)'
+        assert len(recorded(m)) == 3
+
+    def testInOrder(self):
+        m = mock(history='disk')
+        m.send(1)
+        m.send(2)
+
+        inorder.verify(m).send(1)
+        inorder.verify(m).send(2)
+
+    def testKeepsObjectsWithoutEqualityByReference(self):
+        handle = Handle()
+        m = mock(history='disk')
+        m.send(handle, [handle])
+
+        verify(m).send(handle, [handle])
+        invocation, = recorded(m)
+        assert invocation.params[0] is handle
+
+    def testKeepsUnpicklableCallsInMemory(self):
+        m = mock(history='disk')
+        value = Unpicklable()
+        m.send(1)
+        m.send(value)
+        m.send(2)
+
+        verify(m).send(Unpicklable())
+        assert recorded(m)[1].params[0] is value
+        assert [str(i) for i in recorded(m)][::2] == ['send(1)', 'send(2)']
+
+    def testExpectChecksOffTheLatestInvocation(self):
+        m = mock(history='disk')
+        when(m).send(1).thenReturn('sent')
+        expect(m, times=1).stop()
+
+        assert m.send(1) == 'sent'
+        m.stop()
+        verify(m).send(1)
+        ensureNoUnverifiedInteractions(m)
+
+    def testSpy(self):
+        s = spy(Heart(), history='disk')
+        assert s.beat(1) == 1
+
+        verify(s).beat(1)
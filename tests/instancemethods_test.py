@@ -26,6 +26,7 @@ from mockito import (
     verifyZeroInteractions, verifyExpectedInteractions,
     verifyStubbedInvocationsAreUsed)
 from mockito.invocation import InvocationError
+from mockito.mock_registry import mock_registry
 from mockito.verification import VerificationError
 
 pytestmark = pytest.mark.usefixtures("unstub")
@@ -505,3 +506,31 @@ class TestImplicitVerificationsUsingExpect:
         rex.bark('Miau')
         rex.waggle()
 
+
+class TestCallPlan:
+    def testCallsDoNotIntrospectTheMockedObject(self):
+        rex = Dog()
+        when(rex).bark('Miau').thenReturn('Wuff')
+        theMock = mock_registry.mock_for(rex)
+
+        def fail(*args):
+            raise AssertionError('introspected on call')
+
+        theMock.has_method = fail
+        theMock.get_signature = fail
+        theMock.eat_self = fail
+
+        assert rex.bark('Miau') == 'Wuff'
+        with pytest.raises(TypeError):
+            rex.bark('Miau', 'Miau')
+
+    def testPlanIsDroppedOnUnstub(self):
+        rex = Dog()
+        when(rex).bark('Miau').thenReturn('Wuff')
+        theMock = mock_registry.mock_for(rex)
+        assert 'bark' in theMock._call_plans
+
+        unstub(rex)
+
+        assert 'bark' not in theMock._call_plans
+        assert rex.bark('Miau') == 'Miau!'
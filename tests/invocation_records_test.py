@@ -0,0 +1,61 @@
+import pytest
+
+from mockito import mock, spy, verify, when
+from mockito import invocation
+from mockito.mock_registry import mock_registry
+
+from .test_base import recorded
+
+
+class Service(object):
+    def handle(self, x, y=None):
+        return x
+
+
+@pytest.mark.usefixtures('unstub')
+class TestCompactRecords:
+
+    @pytest.mark.parametrize('cls', [
+        invocation.RememberedInvocation,
+        invocation.RememberedProxyInvocation,
+        invocation.ObservedInvocation,
+        invocation.VerifiableInvocation,
+        invocation.StubbedInvocation,
+    ])
+    def testInvocationsHaveNoDict(self, cls):
+        assert '__dict__' not in dir(cls)
+
+    def testRecordsOfMocks(self):
+        m = mock()
+        m.handle(1)
+
+        record, = recorded(m)
+        assert not hasattr(record, '__dict__')
+        assert record.params == (1,)
+        assert record.named_params == {}
+
+    def testRecordsOfSpies(self):
+        s = spy(Service())
+        s.handle(1, y=2)
+
+        record, = recorded(s)
+        assert not hasattr(record, '__dict__')
+        assert record.named_params == {'y': 2}
+
+    def testRecordsShareTheEmptyNamedParams(self):
+        m = mock()
+        m.handle(1)
+        m.handle(2)
+
+        first, second = recorded(m)
+        assert first.named_params is second.named_params
+        assert first.named_params == {}
+
+    def testStubsKeepTheirOwnStrictness(self):
+        m = mock(strict=False)
+        when(m, strict=True).handle(1).thenReturn(2)
+
+        stub, = mock_registry.mock_for(m).stubbed_invocations
+        assert stub.strict is True
+        assert m.handle(1) == 2
+        verify(m).handle(1)
@@ -0,0 +1,68 @@
+import inspect
+import types
+
+import pytest
+
+from mockito import mock, when, verify
+from mockito.invocation import InvocationError
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+def make_sdk():
+    # A namespace which resolves its members on first access, and counts
+    # how often it had to.
+    sdk = types.ModuleType('sdk')
+    sdk.lookups = []
+
+    def resolve(name):
+        if not name.startswith('get_'):
+            raise AttributeError(name)
+        sdk.lookups.append(name)
+
+        def fn(key, default=None):
+            """Fetch `key`."""
+        return fn
+    sdk.__getattr__ = resolve
+    return sdk
+
+
+class TestLazySpec:
+    def testResolvesEachMemberOnceForAllDummies(self):
+        sdk = make_sdk()
+        for _ in range(3):
+            client = mock(sdk, lazy=True)
+            when(client).get_user('joe').thenReturn('Joe')
+            assert client.get_user('joe') == 'Joe'
+            verify(client).get_user('joe')
+
+        assert sdk.lookups == ['get_user']
+
+    def testChecksMembersAndSignatures(self):
+        client = mock(make_sdk(), lazy=True)
+
+        with pytest.raises(InvocationError):
+            when(client).delete_user('joe')
+        with pytest.raises(TypeError):
+            when(client).get_user('joe', 'x', 'y')
+
+    def testAdHocMethodsResolveTheSpecOnlyWhenAsked(self):
+        sdk = make_sdk()
+        client = mock(sdk, strict=False, lazy=True)
+
+        assert client.get_user('joe') is None
+        verify(client).get_user('joe')
+        assert sdk.lookups == []
+
+        assert client.get_user.__doc__ == 'Fetch `key`.'
+        assert list(inspect.signature(client.get_user).parameters) == \
+            ['key', 'default']
+        assert sdk.lookups == ['get_user']
+
+    def testAdHocMethodsOfUnknownMembers(self):
+        client = mock(make_sdk(), strict=False, lazy=True)
+
+        assert client.frobnicate() is None
+        assert client.frobnicate.__doc__ is None
+        assert not hasattr(client.frobnicate, '__wrapped__')
@@ -0,0 +1,141 @@
+import pytest
+
+from mockito import (
+    mock_many, when, expect, patch, verify, unstub, reset,
+    forget_invocations,
+    verifyStubbedInvocationsAreUsed, verifyZeroInteractions,
+    ArgumentError, VerificationError)
+from mockito.mock_registry import mock_registry
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+class Connection(object):
+    def send(self, data):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestMockMany:
+    def testCreatesSpeccedDummies(self):
+        conns = mock_many(Connection, 3)
+
+        assert len(conns) == 3
+        assert len(set(map(id, conns))) == 3
+        for conn in conns:
+            assert isinstance(conn, Connection)
+            with pytest.raises(AttributeError):
+                conn.send  # strict by default
+
+    def testDummiesAreStubbedAndVerifiedOneByOne(self):
+        a, b = mock_many(Connection, 2)
+        when(a).send('foo').thenReturn(3)
+
+        assert a.send('foo') == 3
+        with pytest.raises(AttributeError):
+            b.send('foo')
+        verify(a).send('foo')
+        verifyZeroInteractions(b)
+
+    def testConfigIsAppliedToAllDummies(self):
+        conns = mock_many(
+            Connection, 2,
+            config={'host': 'localhost', 'send': lambda data: len(data)})
+
+        for conn in conns:
+            assert conn.host == 'localhost'
+            assert conn.send('foo') == 3
+            verify(conn).send('foo')
+        verifyStubbedInvocationsAreUsed(conns)
+
+    def testDummiesShareTheirClassAndConfiguration(self):
+        conns = mock_many(
+            Connection, 2,
+            config={'host': 'localhost', 'send': lambda data: len(data)})
+
+        assert type(conns[0]) is type(conns[1])
+        for conn in conns:
+            assert 'send' not in conn.__dict__
+        stubs = [mock_registry.mock_for(conn).stubbed_invocations_for('send')
+                 for conn in conns]
+        assert stubs[0][0] is stubs[1][0]
+
+    def testStubsTakePrecedenceOverTheSharedConfiguration(self):
+        conns = mock_many(
+            Connection, 2, config={'send': lambda data: len(data)})
+        when(conns[0]).send('bar').thenReturn('stubbed')
+
+        assert conns[0].send('bar') == 'stubbed'
+        assert conns[0].send('foo') == 3
+        assert conns[1].send('bar') == 3
+
+    def testResetKeepsTheSharedConfiguration(self):
+        conns = mock_many(
+            Connection, 2, config={'send': lambda data: len(data)})
+        when(conns[0]).send('bar').thenReturn('stubbed')
+        conns[0].send('bar')
+
+        reset(conns)
+        assert conns[0].send('bar') == 3
+        verify(conns[0]).send('bar')
+
+    def testVerifyAllDummiesAtOnce(self):
+        conns = mock_many(None, 3)
+        for conn in conns:
+            conn.close()
+        conns[0].send('foo')
+
+        verify(conns, times=3).close()
+        verify(conns).send('foo')
+        with pytest.raises(VerificationError):
+            verify(conns, times=2).close()
+
+    def testReadingTheInvocationsOfAllDummiesKeepsTheirLogs(self):
+        conns = mock_many(None, 2)
+        conns[0].close()
+        conns[1].send('foo')
+
+        aggregate = mock_registry.mock_for(conns)
+        assert len(aggregate.invocations) == 2
+        assert [i.method_name for i in aggregate.invocations] \
+            == ['close', 'send']
+        assert aggregate.invocations[-1].method_name == 'send'
+        conns[0].close()
+        assert len(aggregate.invocations) == 3
+        verify(conns[0], times=2).close()
+        verify(conns[1]).send('foo')
+
+    @pytest.mark.parametrize('stub', [
+        lambda conns: when(conns).close(),
+        lambda conns: expect(conns).close(),
+        lambda conns: patch(conns, 'close', lambda: None),
+    ])
+    def testRefusesToStubAllDummiesAtOnce(self, stub):
+        conns = mock_many(Connection, 2)
+
+        with pytest.raises(ArgumentError) as exc:
+            stub(conns)
+        assert 'stub the individual dummies' in str(exc.value)
+
+    def testForgetInvocationsOfAllDummies(self):
+        conns = mock_many(None, 2)
+        conns[0].close()
+        conns[1].close()
+
+        forget_invocations(conns)
+        verifyZeroInteractions(conns)
+        verifyZeroInteractions(conns[0])
+
+    def testUnstubAllDummiesAtOnce(self):
+        conns = mock_many(Connection, 2)
+        for conn in conns:
+            when(conn).close().thenReturn('closed')
+
+        unstub(conns)
+        for conn in conns:
+            assert mock_registry.mock_for(conn) is None
+            with pytest.raises(AttributeError):
+                conn.close()
@@ -0,0 +1,213 @@
+import pytest
+
+from mockito import (
+    ANY, ARGS, KWARGS, ArgumentError, expect, patch, spy2, unstub, verify,
+    verifyZeroInteractions, when, when2)
+from mockito import monitoring
+from mockito.invocation import ObservedInvocation
+from mockito.mock_registry import mock_registry
+
+from . import module
+from .module import one_arg as imported_one_arg
+from .test_base import recorded
+
+
+pytestmark = pytest.mark.usefixtures('unstub')
+needs_monitoring = pytest.mark.skipif(
+    not monitoring.AVAILABLE, reason='sys.monitoring needs Python 3.12')
+
+
+class Dog(object):
+    def bark(self, sound, times=1, *, loud=False):
+        return sound * times
+
+    def howl(self, *args, **kwargs):
+        return args, kwargs
+
+    @classmethod
+    def create(cls, name):
+        return name
+
+    @staticmethod
+    def static(value):
+        return value
+
+
+@needs_monitoring
+class TestSpyThroughMonitoring:
+
+    def testDoesNotPatchTheFunction(self):
+        original = module.one_arg
+        spy2(module.one_arg, monitor=True)
+
+        assert module.one_arg is original
+
+    def testSeesCallsOfImportedNames(self):
+        spy2(module.one_arg, monitor=True)
+
+        assert imported_one_arg('foo') == 'foo'
+        verify(module).one_arg('foo')
+
+    def testRecordsObservedInvocations(self):
+        spy2(module.one_arg, monitor=True)
+
+        module.one_arg('foo')
+        invocation, = recorded(module)
+        assert isinstance(invocation, ObservedInvocation)
+
+    def testOnlyWatchesTheGivenFunction(self):
+        spy2(module.one_arg, monitor=True)
+
+        module.send('foo')
+        verifyZeroInteractions(module)
+
+    def testStopsOnUnstub(self):
+        spy2(module.one_arg, monitor=True)
+        unstub(module)
+
+        assert monitoring._watchers == {}
+        assert monitoring._tool_id is None
+        module.one_arg('foo')
+        assert mock_registry.mock_for(module) is None
+
+    def testWatchesOnlyOnce(self):
+        spy2(module.one_arg, monitor=True)
+        spy2(module.one_arg, monitor=True)
+
+        module.one_arg('foo')
+        verify(module, times=1).one_arg('foo')
+
+    def testCanWatchAgainAfterUnstub(self):
+        spy2(module.one_arg, monitor=True)
+        unstub()
+        spy2(module.one_arg, monitor=True)
+
+        module.one_arg('foo')
+        verify(module).one_arg('foo')
+
+    def testRejectsBuiltins(self):
+        import time
+        with pytest.raises(TypeError):
+            spy2(time.time, monitor=True)
+
+
+@needs_monitoring
+class TestMethods:
+
+    def testOnlyRecordsCallsOfTheGivenInstance(self):
+        rex, bello = Dog(), Dog()
+        spy2(rex.bark, monitor=True)
+
+        rex.bark('Wuff')
+        bello.bark('Miau')
+        verify(rex).bark('Wuff')
+        verify(rex, times=0).bark('Miau')
+
+    def testRecordsAllInstancesWhenWatchingTheClass(self):
+        spy2(Dog.bark, monitor=True)
+
+        Dog().bark('Wuff')
+        Dog().bark('Miau')
+        verify(Dog).bark('Wuff')
+        verify(Dog).bark('Miau')
+
+    def testClassmethods(self):
+        spy2(Dog.create, monitor=True)
+
+        Dog.create('Rex')
+        verify(Dog).create('Rex')
+
+    def testStaticmethods(self):
+        spy2(Dog.static, monitor=True)
+
+        Dog.static('Rex')
+        verify(Dog).static('Rex')
+
+
+@needs_monitoring
+class TestNormalizedArguments:
+
+    def testFillsInDefaults(self):
+        rex = Dog()
+        spy2(rex.bark, monitor=True)
+
+        rex.bark('Wuff')
+        rex.bark(sound='Wuff', times=2)
+        rex.bark('Wuff', loud=True)
+        verify(rex).bark('Wuff')
+        verify(rex).bark('Wuff', 2)
+        verify(rex).bark('Wuff', loud=True)
+        verify(rex, times=2).bark('Wuff', 1, loud=ANY)
+        verify(rex).bark(sound='Wuff', times=2, loud=False)
+        verify(rex, times=3).bark('Wuff', ...)
+
+    def testRecordsArgumentsWhichEqualTheirDefault(self):
+        rex = Dog()
+        spy2(rex.bark, monitor=True)
+
+        rex.bark('Wuff', 1)
+        verify(rex).bark('Wuff', 1)
+        verify(rex).bark('Wuff')
+        verify(rex).bark(ANY, ANY)
+
+    def testStopsNormalizingOnUnstub(self):
+        rex = Dog()
+        spy2(rex.bark, monitor=True)
+        theMock = mock_registry.mock_for(rex)
+        unstub(rex)
+
+        assert theMock.normalizers == {}
+
+    def testVarArgs(self):
+        rex = Dog()
+        spy2(rex.howl, monitor=True)
+
+        rex.howl(1, 2, foo='bar')
+        verify(rex).howl(1, 2, foo='bar')
+        verify(rex).howl(*ARGS, **KWARGS)
+
+
+@needs_monitoring
+def testCanStillStubOtherFunctions():
+    spy2(module.one_arg, monitor=True)
+    when(module).send('foo').thenReturn('bar')
+
+    assert module.send('foo') == 'bar'
+    module.one_arg('foo')
+    verify(module).one_arg('foo')
+
+
+@needs_monitoring
+class TestRefusesToMixStubsAndWatchers:
+
+    @pytest.mark.parametrize('stub', [
+        lambda: when(module).one_arg('foo'),
+        lambda: when2(module.one_arg, 'foo'),
+        lambda: expect(module).one_arg('foo'),
+        lambda: patch(module, 'one_arg', lambda arg: arg),
+    ])
+    def testCantStubAWatchedFunction(self, stub):
+        spy2(module.one_arg, monitor=True)
+
+        with pytest.raises(ArgumentError):
+            stub()
+        module.one_arg('foo')
+        module.one_arg(arg='foo')
+        verify(module, times=2).one_arg('foo')
+
+    @pytest.mark.parametrize('stub', [
+        lambda: when(module).one_arg('foo').thenReturn('bar'),
+        lambda: spy2(module.one_arg),
+    ])
+    def testCantWatchAStubbedFunction(self, stub):
+        stub()
+
+        with pytest.raises(ArgumentError):
+            spy2(module.one_arg, monitor=True)
+        assert monitoring._watchers == {}
+
+
+@pytest.mark.skipif(monitoring.AVAILABLE, reason='sys.monitoring available')
+def testNeedsPython312():
+    with pytest.raises(RuntimeError):
+        spy2(module.one_arg, monitor=True)
@@ -1,4 +1,3 @@
-
 from mockito.mock_registry import IdentityMap
 
 
@@ -52,3 +51,42 @@ class TestIdentityMap:
         td[{"one", "two", "foo"}] = object()
         td[{"one", "two", "foo"}] = object()
         assert len(td.values()) == 2
+
+    def testKeepsInsertionOrder(self):
+        td = IdentityMap()
+        keys = [object() for _ in range(5)]
+        for n, key in enumerate(keys):
+            td[key] = n
+        td[keys[1]] = 'again'
+
+        assert td.values() == [0, 2, 3, 4, 'again']
+
+    def testLookupsDoNotScaleWithTheNumberOfKeys(self):
+        td = IdentityMap()
+        keys = [object() for _ in range(10000)]
+        for key in keys:
+            td[key] = key
+        store = td._store = LookupCountingDict(td._store)
+
+        last = keys[-1]
+        assert td.get(last) is last
+        assert td.get(object()) is None
+        # One hashed lookup per `get`, and no scan over the other keys.
+        assert store.lookups == 2
+
+
+class LookupCountingDict(dict):
+    lookups = 0
+
+    def __getitem__(self, key):
+        self.lookups += 1
+        return super().__getitem__(key)
+
+    def __iter__(self):
+        raise AssertionError('scanned all the keys')
+
+    def values(self):
+        raise AssertionError('scanned all the keys')
+
+    def items(self):
+        raise AssertionError('scanned all the keys')
@@ -1,5 +1,6 @@
 import mockito
-from mockito import when, patch
+from mockito import mock, patch, verify, when
+from mockito.fingerprints import take
 import pytest
 
 import numpy as np
@@ -29,3 +30,25 @@ class TestEnsureNumpyWorks:
         when(module).one_arg(Ellipsis).thenReturn('yep')
         assert module.one_arg(array) == 'yep'
 
+
+
+class TestFingerprints:
+    def testVerifiesArraysByDigest(self):
+        m = mock(fingerprint=True)
+        m.send(np.arange(60).reshape(6, 10))
+
+        verify(m).send(np.arange(60).reshape(6, 10))
+        verify(m, times=0).send(np.arange(60))
+
+    def testKeepsShapeAndDtype(self):
+        fingerprint = take(np.zeros((20, 30)))
+
+        assert fingerprint.shape == (20, 30)
+        assert fingerprint.dtype == 'float64'
+        assert fingerprint == np.zeros((20, 30))
+        assert np.zeros((20, 30)) == fingerprint
+
+    def testHashesNonContiguousArrays(self):
+        array = np.arange(1600).reshape(40, 40)
+
+        assert take(array[:, 0]) == np.arange(0, 1600, 40)
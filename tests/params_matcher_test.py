@@ -0,0 +1,116 @@
+import pytest
+
+from mockito import mock, when, patch, unstub
+from mockito.invocation import MatchingInvocation, compile_params_matcher
+from mockito.matchers import (
+    ARGS_SENTINEL, KWARGS_SENTINEL, any_, eq, gt, Matcher
+)
+
+
+def interpreted_match(params, named_params, args, kwargs):  # noqa: C901
+    # The straight-forward interpretation of a pattern, as `matches` used
+    # to do it on every call.
+    def compare(p1, p2):
+        if isinstance(p1, Matcher):
+            return p1.matches(p2)
+        return not p1 != p2
+
+    for x, p1 in enumerate(params):
+        if p1 is Ellipsis:
+            return True
+        if p1 is ARGS_SENTINEL:
+            break
+        try:
+            p2 = args[x]
+        except IndexError:
+            return False
+        if not compare(p1, p2):
+            return False
+    else:
+        if len(params) != len(args):
+            return False
+
+    for key, p1 in sorted(
+        named_params.items(),
+        key=lambda k_v: 1 if k_v[0] is KWARGS_SENTINEL else 0
+    ):
+        if key is KWARGS_SENTINEL:
+            break
+        try:
+            p2 = kwargs[key]
+        except KeyError:
+            return False
+        if not compare(p1, p2):
+            return False
+    else:
+        if len(named_params) != len(kwargs):
+            return False
+
+    return True
+
+
+PATTERNS = [
+    ((), {}),
+    ((1,), {}),
+    ((1, 2), {}),
+    ((any_(),), {}),
+    ((1, gt(1)), {}),
+    ((Ellipsis,), {}),
+    ((1, Ellipsis), {}),
+    ((ARGS_SENTINEL,), {}),
+    ((1, ARGS_SENTINEL), {}),
+    ((), {'a': 1}),
+    ((), {'a': eq(1), 'b': 2}),
+    ((), {KWARGS_SENTINEL: '_'}),
+    ((), {'a': 1, KWARGS_SENTINEL: '_'}),
+    ((1, ARGS_SENTINEL), {'a': any_(), KWARGS_SENTINEL: '_'}),
+]
+
+CALLS = [
+    ((), {}),
+    ((1,), {}),
+    ((2,), {}),
+    ((1, 2), {}),
+    ((1, 2, 3), {}),
+    ((), {'a': 1}),
+    ((), {'a': 2}),
+    ((), {'b': 2}),
+    ((), {'a': 1, 'b': 2}),
+    ((1,), {'a': 1}),
+    ((1, 2), {'a': 1, 'b': 2, 'c': 3}),
+]
+
+
+@pytest.mark.parametrize('params, named_params', PATTERNS)
+@pytest.mark.parametrize('args, kwargs', CALLS)
+def testCompiledMatcherAgreesWithInterpretation(
+    params, named_params, args, kwargs
+):
+    params_match = compile_params_matcher(params, named_params)
+    assert params_match(args, kwargs) == interpreted_match(
+        params, named_params, args, kwargs)
+
+
+def testUsesCustomCompareFunction():
+    params_match = compile_params_matcher(
+        (1, 'a'), {'b': 2}, lambda p1, p2: str(p1) == str(p2))
+
+    assert params_match(('1', 'a'), {'b': '2'})
+    assert not params_match(('1', 'b'), {'b': '2'})
+
+
+class TestPatchingCompare:
+    def teardown_method(self):
+        unstub()
+
+    def testPatchedCompareAppliesToExistingStubs(self):
+        dummy = mock()
+        when(dummy).foo('1').thenReturn('yep')
+
+        def lenient_compare(p1, p2):
+            return str(p1) == str(p2)
+
+        assert dummy.foo(1) is None
+        with patch(MatchingInvocation.compare, lenient_compare):
+            assert dummy.foo(1) == 'yep'
+        assert dummy.foo(1) is None
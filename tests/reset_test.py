@@ -0,0 +1,144 @@
+import pytest
+
+from mockito import (
+    mock, mock_many, when, expect, verify, unstub, reset, MockPool,
+    verifyZeroInteractions, captor, ArgumentError)
+from mockito.invocation import InvocationError
+from mockito.mock_registry import mock_registry
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+class Connection(object):
+    def send(self, data):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestReset:
+    def testForgetsStubsAndInvocations(self):
+        conn = mock(Connection)
+        when(conn).send('foo').thenReturn(3)
+        conn.send('foo')
+
+        reset(conn)
+        with pytest.raises(AttributeError):
+            conn.send('foo')
+        verifyZeroInteractions(conn)
+
+    def testKeepsTheMockRegistered(self):
+        conn = mock(Connection)
+        theMock = mock_registry.mock_for(conn)
+
+        reset(conn)
+        assert mock_registry.mock_for(conn) is theMock
+        when(conn).send('foo').thenReturn(3)
+        assert conn.send('foo') == 3
+        verify(conn).send('foo')
+
+    def testForgetsExpectations(self):
+        conn = mock(Connection)
+        expect(conn, times=1).close()
+        conn.close()
+
+        reset(conn)
+        expect(conn, times=1).close()
+        conn.close()
+        with pytest.raises(InvocationError):
+            conn.close()
+
+    def testRestoresTheConfiguration(self):
+        conn = mock({'host': 'localhost', 'send': lambda data: len(data)})
+        conn.port = 80
+        when(conn).send('foo').thenReturn(0)
+        when(conn).__len__().thenReturn(1)
+
+        reset(conn)
+        assert conn.host == 'localhost'
+        assert conn.send('foo') == 3
+        assert conn.port != 80
+        with pytest.raises(TypeError):
+            len(conn)
+
+    def testResetsAllDummiesOfMockMany(self):
+        conns = mock_many(None, 2)
+        for conn in conns:
+            when(conn).close().thenReturn('closed')
+            conn.close()
+
+        reset(conns)
+        verifyZeroInteractions(conns)
+        assert conns[0].close() is None
+
+    def testClearsCaptors(self):
+        conn = mock(Connection)
+        stubbed, verified = captor(), captor()
+        when(conn).send(stubbed).thenReturn(3)
+        conn.send('foo')
+        verify(conn).send(verified)
+
+        reset(conn)
+        assert stubbed.all_values == []
+        assert verified.all_values == []
+
+    def testClearsCaptorsOfMockMany(self):
+        conns = mock_many(None, 2)
+        conns[0].send('foo')
+        data = captor()
+        verify(conns).send(data)
+
+        reset(conns)
+        assert data.all_values == []
+
+    def testRaisesForUnregisteredObjects(self):
+        with pytest.raises(ArgumentError):
+            reset(object())
+
+
+class TestMockPool:
+    def testHandsOutDummiesOfTheSpec(self):
+        pool = MockPool(Connection)
+        a, b = pool.get(), pool.get()
+
+        assert a is not b
+        assert isinstance(a, Connection)
+        with pytest.raises(AttributeError):
+            a.send('foo')
+
+    def testReusesReleasedDummies(self):
+        pool = MockPool(Connection, {'host': 'localhost'})
+        conn = pool.get()
+        when(conn).send('foo').thenReturn(3)
+        conn.send('foo')
+
+        pool.release()
+        again = pool.get()
+        assert again is conn
+        assert again.host == 'localhost'
+        with pytest.raises(AttributeError):
+            again.send('foo')
+        verifyZeroInteractions(again)
+
+    def testDummiesSurviveUnstub(self):
+        pool = MockPool(Connection)
+        conn = pool.get()
+        pool.release()
+        unstub()
+
+        conn = pool.get()
+        when(conn).send('foo').thenReturn(3)
+        assert conn.send('foo') == 3
+        verify(conn).send('foo')
+
+    def testDummiesGetBackTheirConfigurationAfterUnstub(self):
+        pool = MockPool(Connection, {'send': lambda data: len(data)})
+        conn = pool.get()
+        pool.release()
+        unstub()
+
+        conn = pool.get()
+        assert conn.send('foo') == 3
+        verify(conn).send('foo')
@@ -1,8 +1,16 @@
 
 import pytest
 
-from mockito import when, args, kwargs, unstub
-
+from mockito import mock, when, args, kwargs, unstub
+from mockito import signature as signature_module
+from mockito.matchers import ARGS_SENTINEL
+from mockito.signature import (
+    Signature, SignatureCache, ValidationCache, get_signature,
+    match_signature, match_signature_allowing_placeholders
+)
+
+import gc
+import weakref
 from collections import namedtuple
 
 
@@ -457,3 +465,115 @@ class TestSignatures:
             finally:  # just to be sure
                 unstub()
 
+
+
+@pytest.mark.usefixtures('unstub')
+class TestSignatureCache:
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        cache = SignatureCache(maxsize=2)
+        monkeypatch.setattr(signature_module, 'signature_cache', cache)
+        return cache
+
+    def testSharesSignaturesAcrossMocks(self, cache):
+        class Dog(object):
+            def bark(self, sound):
+                pass
+
+        for _ in range(3):
+            dog = mock(Dog)
+            when(dog).bark('Wuff')
+            dog.bark('Wuff')
+
+        assert cache.info().misses == 1
+        assert cache.info().hits == 2
+
+    def testEatsSelfOfUnboundMethods(self, cache):
+        assert str(get_signature(SUT, 'one_arg')) == '(a)'
+        assert str(get_signature(SUT(), 'one_arg')) == '(a)'
+        assert str(get_signature(StaticMethods, 'one_arg')) == '(a)'
+        assert str(get_signature(ClassMethods, 'one_arg')) == '(a)'
+
+    def testReplacingTheFunctionInvalidatesItsEntry(self, cache):
+        class Dog(object):
+            def bark(self, sound):
+                pass
+
+        assert str(get_signature(Dog, 'bark')) == '(sound)'
+        Dog.bark.__code__ = (lambda self, sound, loud: None).__code__
+        assert str(get_signature(Dog, 'bark')) == '(sound, loud)'
+        assert cache.info().misses == 2
+
+    def testDropsTheEntryOfACollectedFunction(self, cache):
+        def bark(sound):
+            pass
+
+        ref = weakref.ref(bark)
+        signature_module.signature_cache.get(bark, eat_self=False)
+        assert cache.info().currsize == 1
+
+        del bark
+        gc.collect()
+        assert ref() is None
+        assert cache.info().currsize == 0
+
+    def testIsBounded(self, cache):
+        for name in ('none_args', 'one_arg', 'two_args'):
+            get_signature(SUT, name)
+
+        assert cache.info().currsize == 2
+        get_signature(SUT, 'none_args')
+        assert cache.info().misses == 4
+
+
+class CountingSignature(Signature):
+    binds = 0
+
+    def bind(self, *args, **kwargs):
+        type(self).binds += 1
+        return super(CountingSignature, self).bind(*args, **kwargs)
+
+
+class TestValidationCache:
+    @pytest.fixture
+    def sig(self, monkeypatch):
+        monkeypatch.setattr(
+            signature_module, 'validation_cache', ValidationCache())
+        monkeypatch.setattr(CountingSignature, 'binds', 0)
+
+        def fn(a, b=None, *, c=None):
+            pass
+
+        return CountingSignature.from_callable(fn)
+
+    def testBindsOnlyOncePerShape(self, sig):
+        for value in range(5):
+            match_signature(sig, (value,), {'c': value})
+        assert CountingSignature.binds == 1
+
+        match_signature(sig, (1, 2), {})
+        assert CountingSignature.binds == 2
+
+    def testRaisesAgainForKnownBadShapes(self, sig):
+        for value in range(2):
+            with pytest.raises(TypeError, match='too many positional'):
+                match_signature(sig, (value, 2, 3), {})
+        assert CountingSignature.binds == 1
+
+    def testCachesPlaceholderMatches(self, sig):
+        for value in range(3):
+            match_signature_allowing_placeholders(
+                sig, (value, Ellipsis), {})
+            with pytest.raises(TypeError):
+                match_signature_allowing_placeholders(
+                    sig, (value, 1, 2, Ellipsis), {})
+        assert CountingSignature.binds == 0
+
+        for value in range(3):
+            match_signature_allowing_placeholders(sig, (value,), {'c': 1})
+        assert CountingSignature.binds == 1
+
+    def testPlaceholdersArePartOfTheShape(self, sig):
+        match_signature_allowing_placeholders(sig, (1, 2), {})
+        match_signature_allowing_placeholders(sig, (1, ARGS_SENTINEL), {})
+        assert CountingSignature.binds == 2
@@ -0,0 +1,155 @@
+import importlib.util
+
+import pytest
+
+from mockito import mock, when, unstub
+from mockito import signature as signature_module
+from mockito import spec_cache
+from mockito.signature import SignatureCache
+
+
+SOURCE = '''
+class Dog(object):
+    def bark(self, sound, times=1, *, loud=False):
+        pass
+
+    sit, stay = (lambda self, x: 1), (lambda self, x, y: 2)
+
+    @staticmethod
+    def wag(*args, **kwargs):
+        pass
+
+
+def fetch(url, timeout=None):
+    pass
+'''
+
+
+def load_module(path, source=SOURCE):
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location('specs', str(path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def shape(sig):
+    return [
+        (p.name, p.kind, p.default is p.empty)
+        for p in sig.parameters.values()
+    ]
+
+
+@pytest.fixture
+def specs(tmp_path):
+    return load_module(tmp_path / 'specs.py')
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'spec-cache')
+
+
+class TestSpecCacheFile:
+    @pytest.mark.parametrize('fn_name, eat_self', [
+        ('fetch', False),
+        ('Dog.bark', True),
+        ('Dog.wag', False),
+    ])
+    def testRoundTrip(self, specs, cache_path, fn_name, eat_self):
+        fn = specs
+        for name in fn_name.split('.'):
+            fn = getattr(fn, name)
+        sig = signature_module._compute_signature(fn, eat_self)
+
+        cache = spec_cache.SpecCacheFile(cache_path)
+        assert cache.load(fn, eat_self) is spec_cache.MISS
+        cache.store(fn, eat_self, sig)
+        cache.flush()
+
+        cached = spec_cache.SpecCacheFile(cache_path).load(fn, eat_self)
+        assert shape(cached) == shape(sig)
+
+    def testMergesWithEntriesWrittenMeanwhile(self, specs, cache_path):
+        one = spec_cache.SpecCacheFile(cache_path)
+        other = spec_cache.SpecCacheFile(cache_path)
+        one.store(specs.fetch, False, None)
+        other.store(specs.Dog.bark, True, None)
+        one.flush()
+        other.flush()
+
+        cache = spec_cache.SpecCacheFile(cache_path)
+        assert cache.load(specs.fetch, False) is None
+        assert cache.load(specs.Dog.bark, True) is None
+
+    def testIgnoresEntriesOfChangedSources(self, specs, tmp_path, cache_path):
+        cache = spec_cache.SpecCacheFile(cache_path)
+        cache.store(specs.fetch, False, None)
+        cache.flush()
+
+        changed = load_module(tmp_path / 'specs.py', SOURCE + '\n# changed\n')
+        assert spec_cache.SpecCacheFile(cache_path) \
+            .load(changed.fetch, False) is spec_cache.MISS
+
+    def testIgnoresForeignFiles(self, specs, cache_path):
+        with open(cache_path, 'wb') as f:
+            f.write(b'something else')
+
+        cache = spec_cache.SpecCacheFile(cache_path)
+        assert cache.load(specs.fetch, False) is spec_cache.MISS
+        cache.store(specs.fetch, False, None)
+        cache.flush()
+        assert spec_cache.SpecCacheFile(cache_path) \
+            .load(specs.fetch, False) is None
+
+    def testSkipsDecoratedFunctions(self, specs, cache_path):
+        def wrapper(*args, **kwargs):
+            pass
+        wrapper.__wrapped__ = specs.fetch
+
+        cache = spec_cache.SpecCacheFile(cache_path)
+        cache.store(wrapper, False, None)
+        assert cache.load(wrapper, False) is spec_cache.MISS
+
+
+class TestSpecCacheInUse:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, cache_path):
+        monkeypatch.setenv(spec_cache.ENV_VAR, cache_path)
+        monkeypatch.setattr(spec_cache, '_spec_cache', None)
+        monkeypatch.setattr(
+            signature_module, 'signature_cache', SignatureCache())
+        yield
+        unstub()
+
+    def testStubbingUsesTheCachedSignatures(self, specs, monkeypatch):
+        dog = mock(specs.Dog)
+        when(dog).bark('Wuff')
+        spec_cache.get_spec_cache().flush()
+
+        # A new process, t.i. nothing cached in memory
+        monkeypatch.setattr(spec_cache, '_spec_cache', None)
+        monkeypatch.setattr(
+            signature_module, 'signature_cache', SignatureCache())
+        monkeypatch.setattr(
+            signature_module, '_compute_signature', None)  # must not be used
+
+        dog = mock(specs.Dog)
+        when(dog).bark('Wuff', loud=True).thenReturn('WUFF')
+        assert dog.bark('Wuff', loud=True) == 'WUFF'
+        with pytest.raises(TypeError):
+            when(dog).bark('Wuff', 'Wuff', 'Wuff')
+
+    def testFunctionsOnTheSameLineKeepTheirSignatures(self, specs):
+        dog = mock(specs.Dog)
+        when(dog).sit(1).thenReturn('sit')
+        when(dog).stay(1, 2).thenReturn('stay')
+
+        assert dog.sit(1) == 'sit'
+        assert dog.stay(1, 2) == 'stay'
+        with pytest.raises(TypeError):
+            when(dog).sit(1, 2)
+
+    def testIsOffWithoutTheEnvironmentVariable(self, monkeypatch):
+        monkeypatch.delenv(spec_cache.ENV_VAR)
+        assert spec_cache.get_spec_cache() is None
@@ -23,7 +23,10 @@ import sys
 
 from .test_base import TestBase
 from mockito import (
-    when, spy, spy2, verify, VerificationError, verifyZeroInteractions)
+    when, spy, spy2, unstub, verify, VerificationError, verifyZeroInteractions,
+    verifyStubbedInvocationsAreUsed)
+from mockito import mocking
+from mockito.mock_registry import mock_registry
 
 import time
 
@@ -158,3 +161,234 @@ class TestSpy2:
         spy2(Dummy.foo)
         assert Dummy().foo() == 'foo'
 
+
+
+def stub_for(obj, method_name):
+    return mock_registry.mock_for(obj).stubbed_invocations_for(method_name)[0]
+
+
+@pytest.mark.usefixtures('unstub')
+class TestPassThrough:
+
+    def testSpy2OnlyRecordsAndForwards(self, monkeypatch):
+        dummy = Dummy()
+        spy2(dummy.return_args)
+        monkeypatch.setattr(
+            mocking, 'remembered_invocation_builder', None)
+
+        assert dummy.return_args(1, a=2) == ((1,), {'a': 2})
+        verify(dummy).return_args(1, a=2)
+
+    def testRecordsCallsOnClasses(self):
+        spy2(Dummy.return_args)
+
+        dummy = Dummy()
+        assert dummy.return_args(1) == ((1,), {})
+        verify(Dummy).return_args(1)
+
+    def testCountsUsage(self):
+        dummy = Dummy()
+        spy2(dummy.foo)
+
+        dummy.foo()
+        dummy.foo()
+        assert stub_for(dummy, 'foo').used == 2
+        verifyStubbedInvocationsAreUsed(dummy)
+
+    def testDoesNotRecordWrongArguments(self):
+        dummy = Dummy()
+        spy2(dummy.foo)
+
+        with pytest.raises(TypeError):
+            dummy.foo(1, 2)
+        verifyZeroInteractions(dummy)
+        assert stub_for(dummy, 'foo').used == 0
+
+    def testDoesNotRecordWrongArgumentsOnClasses(self):
+        spy2(Dummy.foo)
+
+        with pytest.raises(TypeError):
+            Dummy().foo(x=1)
+        verifyZeroInteractions(Dummy)
+
+    def testLaterStubsGetTheFullDispatch(self):
+        dummy = Dummy()
+        spy2(dummy.return_args)
+        when(dummy).return_args('fox').thenReturn('fix')
+
+        assert dummy.return_args('fox') == 'fix'
+        assert dummy.return_args('box') == (('box',), {})
+        verify(dummy, times=2).return_args(...)
+
+    def testSpy2AfterAStub(self):
+        dummy = Dummy()
+        when(dummy).return_args('fox').thenReturn('fix')
+        spy2(dummy.return_args)
+
+        assert dummy.return_args('fox') == (('fox',), {})
+
+    def testUnstubRestoresTheOriginal(self):
+        spy2(Dummy.foo)
+        unstub(Dummy)
+
+        assert 'foo' in Dummy.__dict__
+        assert Dummy.foo.__name__ == 'foo'
+        assert not hasattr(Dummy.foo, '__wrapped__')
+
+
+@pytest.mark.usefixtures('unstub')
+class TestCachedProxies:
+
+    def testReusesTheProxyForAMethod(self):
+        dummy = spy(Dummy())
+
+        assert dummy.foo is dummy.foo
+        assert dummy.foo is not dummy.return_args
+
+    def testRecordsEachCallSeparately(self):
+        dummy = spy(Dummy())
+        return_args = dummy.return_args
+
+        return_args(1)
+        return_args(2)
+        verify(dummy).return_args(1)
+        verify(dummy).return_args(2)
+
+    def testNoticesReassignedAttributes(self):
+        original = Dummy()
+        dummy = spy(original)
+        assert dummy.foo() == 'foo'
+
+        original.foo = lambda: 'bar'
+        assert dummy.foo() == 'bar'
+
+        del original.foo
+        assert dummy.foo() == 'foo'
+        verify(dummy, times=3).foo()
+
+    def testNoticesReassignedClassAttributes(self):
+        class Original(object):
+            def foo(self):
+                return 'foo'
+
+        dummy = spy(Original())
+        assert dummy.foo() == 'foo'
+
+        Original.foo = lambda self: 'bar'
+        assert dummy.foo() == 'bar'
+
+    def testNoticesStubbedBaseClasses(self):
+        class Base(object):
+            def foo(self):
+                return 'base'
+
+        class Child(Base):
+            pass
+
+        dummy = spy(Child())
+        assert dummy.foo() == 'base'
+
+        when(Base).foo().thenReturn('stubbed')
+        assert dummy.foo() == 'stubbed'
+
+        Child.foo = lambda self: 'child'
+        assert dummy.foo() == 'child'
+
+    def testAsksObjectsWhichComputeTheirAttributesEveryTime(self):
+        class Computed(object):
+            answer = 'foo'
+
+            def __getattr__(self, name):
+                answer = self.answer
+                return lambda: answer
+
+        original = Computed()
+        dummy = spy(original)
+        assert dummy.foo() == 'foo'
+
+        original.answer = 'bar'
+        assert dummy.foo() == 'bar'
+
+    def testNoticesReassignedModuleFunctions(self):
+        import types
+        module = types.ModuleType('module')
+        module.fn = lambda: 'foo'
+        dummy = spy(module)
+        assert dummy.fn() == 'foo'
+
+        module.fn = lambda: 'bar'
+        assert dummy.fn() == 'bar'
+
+    def testRaisesOnlyWhenCalled(self):
+        original = Dummy()
+        dummy = spy(original)
+        lol = dummy.lol
+
+        with pytest.raises(AttributeError):
+            lol()
+
+        original.lol = lambda: 'lol'
+        assert lol() == 'lol'
+
+    def testCanStillBeStubbed(self):
+        dummy = spy(Dummy())
+        assert dummy.foo() == 'foo'
+
+        when(dummy).foo().thenReturn('bar')
+        assert dummy.foo() == 'bar'
+
+
+@pytest.mark.usefixtures('unstub')
+class TestSelectiveSpy:
+
+    def testOnlyRecordsTheGivenMethods(self):
+        original = Dummy()
+        dummy = spy(original, only=['foo'])
+
+        assert dummy.foo() == 'foo'
+        assert dummy.return_args(1) == ((1,), {})
+        verify(dummy).foo()
+        verify(dummy, times=0).return_args(...)
+
+    def testExcludedMethodsAreTheRealOnes(self):
+        original = Dummy()
+        dummy = spy(original, exclude=['return_args'])
+
+        assert dummy.return_args == original.return_args
+        assert dummy.return_args.__self__ is original
+
+        dummy.foo()
+        dummy.return_args(1)
+        verify(dummy).foo()
+        verify(dummy, times=0).return_args(...)
+
+    def testAcceptsASingleName(self):
+        dummy = spy(Dummy(), only='foo')
+
+        dummy.foo()
+        dummy.return_args(1)
+        verify(dummy).foo()
+        verify(dummy, times=0).return_args(...)
+
+    def testExcludedAttributesAreNotCached(self):
+        original = Dummy()
+        original.value = 1
+        dummy = spy(original, exclude=['value'])
+
+        assert dummy.value == 1
+        original.value = 2
+        assert dummy.value == 2
+
+    def testExcludedMissingAttributesRaise(self):
+        dummy = spy(Dummy(), exclude=['lol'])
+
+        with pytest.raises(AttributeError):
+            dummy.lol
+
+    def testModule(self):
+        dummy = spy(time, only=['time'])
+
+        dummy.time()
+        dummy.monotonic()
+        verify(dummy).time()
+        verify(dummy, times=0).monotonic()
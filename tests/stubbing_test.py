@@ -19,7 +19,7 @@
 # THE SOFTWARE.
 
 import pytest
-from mockito import any, mock, times, verify, when
+from mockito import any, mock, times, unstub, verify, when
 
 from .test_base import TestBase
 
@@ -62,6 +62,27 @@ class TestEmptyMocks:
         assert dummy(1) == 2
         verify(dummy).__call__(1)
 
+    def testAdHocMethodsAreBuiltOnce(self):
+        dummy = mock()
+        assert dummy.foo is dummy.foo
+        assert dummy.foo is not mock().foo
+
+    def testAdHocMethodsGiveWayToStubs(self):
+        dummy = mock()
+        dummy.foo()
+        dummy()
+
+        when(dummy).foo().thenReturn('bar')
+        when(dummy).__call__().thenReturn('baz')
+        assert dummy.foo() == 'bar'
+        assert dummy() == 'baz'
+        verify(dummy, times=2).foo()
+        verify(dummy, times=2).__call__()
+
+        unstub(dummy)
+        assert dummy.foo() is None
+        assert dummy() is None
+
     def testCheckIsInstanceAgainstItself(self):
         dummy = mock()
         assert isinstance(dummy, dummy.__class__)
@@ -286,6 +307,40 @@ class StubbingTest(TestBase):
         self.assertEqual(2, theMock.foo("oh"))
         self.assertEqual(1, theMock.foo("xxx"))
 
+    def testStubsOfOtherMethodsDoNotInterfere(self):
+        theMock = mock()
+        when(theMock).foo(any()).thenReturn(1)
+        when(theMock).bar(any()).thenReturn(2)
+        when(theMock).foo("oh").thenReturn(3)
+
+        self.assertEqual(1, theMock.foo("xxx"))
+        self.assertEqual(2, theMock.bar("oh"))
+        self.assertEqual(3, theMock.foo("oh"))
+
+    def testEllipsisStubDoesNotCompareArguments(self):
+        class Uncomparable(object):
+            def __eq__(self, other):
+                raise AssertionError("must not be compared")
+
+            __ne__ = __eq__
+
+        theMock = mock()
+        when(theMock).foo(Ellipsis).thenReturn(1)
+
+        self.assertEqual(1, theMock.foo(Uncomparable(), x=Uncomparable()))
+
+    def testForgettingTheLatestStubFallsBackToTheEarlierOne(self):
+        class Dog(object):
+            def bark(self, sound):
+                return sound
+
+        rex = Dog()
+        when(rex).bark(Ellipsis).thenReturn('Grr')
+        with when(rex).bark('Wuff').thenReturn('Miau'):
+            self.assertEqual('Miau', rex.bark('Wuff'))
+        self.assertEqual('Grr', rex.bark('Wuff'))
+        unstub(rex)
+
     def testDoesNotVerifyStubbedCalls(self):
         theMock = mock()
         when(theMock).foo().thenReturn(1)
@@ -20,6 +20,13 @@
 
 import unittest
 
+from mockito.mock_registry import mock_registry
+
+
+def recorded(obj):
+    """Return the invocations the mock of `obj` kept."""
+    return mock_registry.mock_for(obj).invocations
+
 
 class TestBase(unittest.TestCase):
 
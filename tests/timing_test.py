@@ -0,0 +1,135 @@
+import time
+
+import pytest
+
+from mockito import (
+    ArgumentError, latency, mock, reset, spy, spy2, verify, when)
+from mockito.timing import Histogram, timed
+
+
+class Service(object):
+    def fetch(self, key):
+        return key
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class TestHistogram:
+
+    def testEmpty(self):
+        histogram = Histogram()
+
+        assert histogram.count == 0
+        assert histogram.p50 == histogram.p99 == histogram.max == 0
+        assert histogram.mean == 0
+
+    def testExactForSmallValues(self):
+        histogram = Histogram()
+        for value in range(1, 11):
+            histogram.record(value)
+
+        assert histogram.count == 10
+        assert histogram.min == 1
+        assert histogram.max == 10
+        assert histogram.p50 == 5
+        assert histogram.p90 == 9
+        assert histogram.percentile(100) == 10
+        assert histogram.percentile(0) == 1
+        assert histogram.mean == 5.5
+
+    @pytest.mark.parametrize('value', [
+        100, 1_000, 12_345, 1_000_000, 987_654_321, 10 ** 11])
+    def testPercentilesAreAccurateToThreePercent(self, value):
+        histogram = Histogram()
+        histogram.record(1)
+        histogram.record(value)
+        histogram.record(value * 10)
+
+        assert value <= histogram.p50 <= value * 1.032
+        assert histogram.max == value * 10
+
+    def testClampsHugeValues(self):
+        histogram = Histogram()
+        histogram.record(2 ** 50)
+
+        assert histogram.p50 == histogram.max == 2 ** 50
+
+    def testRejectsInvalidPercents(self):
+        with pytest.raises(ValueError):
+            Histogram().percentile(101)
+
+    def testTimed(self):
+        histogram = Histogram()
+        fn = timed(Service.fetch, histogram)
+
+        assert fn(None, 'foo') == 'foo'
+        assert fn.__name__ == 'fetch'
+        assert histogram.count == 1
+
+
+@pytest.mark.usefixtures('unstub')
+class TestTimedSpies:
+
+    def testSpy(self):
+        service = spy(Service(), timing=True)
+
+        service.fetch('foo')
+        service.sleep(0.01)
+
+        verify(service).fetch('foo')
+        assert latency(service, 'fetch').count == 1
+        assert latency(service, 'sleep').count == 1
+        assert latency(service, 'sleep').p50 >= 10_000_000
+
+    def testRecordsCallsThatRaise(self):
+        service = spy(Service(), timing=True)
+
+        with pytest.raises(TypeError):
+            service.fetch()
+        assert latency(service, 'fetch').count == 1
+
+    def testSpy2(self):
+        service = Service()
+        spy2(service.sleep, timing=True)
+
+        service.sleep(0.01)
+        service.sleep(0)
+
+        verify(service, times=2).sleep(...)
+        histogram = latency(service, 'sleep')
+        assert histogram.count == 2
+        assert histogram.max >= 10_000_000
+
+    def testSpy2OnModules(self):
+        spy2(time.monotonic, timing=True)
+
+        time.monotonic()
+        assert latency(time, 'monotonic').count == 1
+
+    def testOnlyTimesTheOriginalImplementation(self):
+        service = Service()
+        spy2(service.fetch, timing=True)
+        when(service).fetch('bar').thenReturn('baz')
+
+        assert service.fetch('bar') == 'baz'
+        assert latency(service, 'fetch').count == 0
+
+    def testResetForgetsTheLatencies(self):
+        service = spy(Service(), timing=True)
+        service.fetch('foo')
+
+        reset(service)
+        assert latency(service, 'fetch').count == 0
+
+    def testUntimedObjectsRaise(self):
+        service = spy(Service())
+
+        with pytest.raises(ArgumentError):
+            latency(service, 'fetch')
+        with pytest.raises(ArgumentError):
+            latency(mock(), 'fetch')
+
+    def testCannotTimeWatchedFunctions(self):
+        with pytest.raises(ArgumentError):
+            spy2(Service.fetch, monitor=True, timing=True)
@@ -0,0 +1,136 @@
+import inspect
+
+import pytest
+
+from mockito import when, spy2, verify, unstub
+from mockito.invocation import InvocationError
+
+from . import module
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+@pytest.fixture(autouse=True)
+def trampolines(monkeypatch):
+    monkeypatch.setenv("MOCKITO_TRAMPOLINES", "1")
+
+
+def is_trampoline(fn):
+    fn = getattr(fn, '__func__', fn)
+    return fn.__code__.co_filename == '<mockito trampoline>'
+
+
+class Dog(object):
+    def bark(self, sound, times=1, *, loud=False):
+        return sound * times
+
+    def growl(self, *args, **kwargs):
+        return args, kwargs
+
+    @staticmethod
+    def static(a, b=2):
+        return a + b
+
+    @classmethod
+    def klass(cls, a):
+        return a
+
+
+class TestTrampolines:
+    def testPatchesWithTrampolines(self):
+        rex = Dog()
+        when(rex).bark('Wuff').thenReturn('Miau')
+        when(Dog).static(1).thenReturn(2)
+        when(Dog).klass(1).thenReturn(2)
+        when(module).one_arg(Ellipsis).thenReturn('mocked')
+
+        assert is_trampoline(rex.bark)
+        assert is_trampoline(Dog.static)
+        assert is_trampoline(Dog.klass)
+        assert is_trampoline(module.one_arg)
+
+    def testKeepsTheSignatureForIntrospection(self):
+        when(Dog).bark('Wuff').thenReturn('Miau')
+
+        assert Dog.bark.__name__ == 'bark'
+        assert str(inspect.signature(Dog.bark)) == (
+            '(self, sound, times=1, *, loud=False)')
+
+    def testRecordsCallsAsTheyWereMade(self):
+        rex = Dog()
+        when(rex).bark(Ellipsis).thenReturn('Miau')
+
+        rex.bark('Wuff')
+        rex.bark(sound='Wuff')
+        rex.bark('Wuff', 2, loud=True)
+
+        verify(rex).bark('Wuff')
+        verify(rex).bark(sound='Wuff')
+        verify(rex).bark('Wuff', 2, loud=True)
+
+    def testMatchesStubsAsUsual(self):
+        rex = Dog()
+        when(rex).bark('Wuff').thenReturn('positional')
+        when(rex).bark(sound='Wuff').thenReturn('keyword')
+
+        assert rex.bark('Wuff') == 'positional'
+        assert rex.bark(sound='Wuff') == 'keyword'
+        with pytest.raises(InvocationError):
+            rex.bark('Wuff', 2)
+
+    def testPassesVarArgs(self):
+        rex = Dog()
+        when(rex).growl(Ellipsis).thenCallOriginalImplementation()
+
+        assert rex.growl(1, 2, a=3) == ((1, 2), {'a': 3})
+        verify(rex).growl(1, 2, a=3)
+
+    def testCallsOriginalImplementationWithSelf(self):
+        rex = Dog()
+        when(rex).bark(Ellipsis).thenCallOriginalImplementation()
+
+        assert rex.bark('Wuff', 2) == 'WuffWuff'
+
+    def testStaticAndClassMethods(self):
+        when(Dog).static(1).thenReturn('static')
+        when(Dog).klass(1).thenReturn('class')
+
+        assert Dog.static(1) == 'static'
+        assert Dog().static(1) == 'static'
+        assert Dog.klass(1) == 'class'
+        assert Dog().klass(1) == 'class'
+
+    def testSpy2KeepsItsForwarderUntilStubbed(self):
+        spy2(module.one_arg)
+        assert not is_trampoline(module.one_arg)
+
+        when(module).one_arg('bar').thenReturn('stubbed')
+        assert is_trampoline(module.one_arg)
+        assert module.one_arg('foo') == 'foo'
+        assert module.one_arg('bar') == 'stubbed'
+        verify(module).one_arg('foo')
+
+    @pytest.mark.parametrize('call', [
+        lambda rex: rex.bark(),
+        lambda rex: rex.bark('Wuff', 1, 2),
+        lambda rex: rex.bark('Wuff', sound='Wuff'),
+        lambda rex: rex.bark('Wuff', volume=11),
+    ])
+    def testValidatesTheSignature(self, call):
+        rex = Dog()
+        when(rex).bark(Ellipsis).thenReturn('Miau')
+
+        with pytest.raises(TypeError):
+            call(rex)
+        verify(rex, times=0).bark(Ellipsis)
+
+    def testLooseStubsAreNotTrampolined(self):
+        when(module, strict=False).one_arg(Ellipsis).thenReturn('mocked')
+        assert not is_trampoline(module.one_arg)
+
+    def testCanBeDisabled(self, monkeypatch):
+        monkeypatch.setenv("MOCKITO_TRAMPOLINES", "0")
+        when(module).one_arg(Ellipsis).thenReturn('mocked')
+        assert not is_trampoline(module.one_arg)
+        unstub()
@@ -0,0 +1,135 @@
+import gc
+import weakref
+
+import pytest
+
+from mockito import mock, spy, when, verify, unstub
+from mockito.mock_registry import mock_registry
+
+from . import module
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+class Payload(object):
+    pass
+
+
+def collect():
+    # Spies live in reference cycles with their classes, so only the
+    # cyclic garbage collector can free them.
+    gc.collect()
+
+
+def collected():
+    return sum(generation['collected'] for generation in gc.get_stats())
+
+
+@pytest.fixture
+def no_gc():
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+class TestWeakMocks:
+    def testVerifyWorksAsUsual(self):
+        m = mock(weak=True)
+        m.foo(1)
+        verify(m).foo(1)
+
+    def testStubbingWorksAsUsual(self):
+        m = mock(weak=True)
+        when(m).foo(1).thenReturn(2)
+        assert m.foo(1) == 2
+
+    def testReleasesForgottenMockAndItsInvocations(self):
+        m = mock(weak=True)
+        payload = Payload()
+        m.foo(payload)
+        theMock = weakref.ref(mock_registry.mock_for(m))
+        recorded = weakref.ref(payload)
+
+        del m, payload
+        collect()
+
+        assert theMock() is None
+        assert recorded() is None
+
+    def testForgottenMockDropsOutOfTheRegistry(self):
+        before = len(mock_registry.get_registered_mocks())
+        m = mock(weak=True)
+        assert len(mock_registry.get_registered_mocks()) == before + 1
+
+        del m
+        collect()
+
+        assert len(mock_registry.get_registered_mocks()) == before
+
+    def testStrongMocksAreKeptAlive(self):
+        m = mock()
+        theMock = weakref.ref(mock_registry.mock_for(m))
+
+        del m
+        collect()
+
+        assert theMock() is not None
+
+    def testReleasesForgottenSpy(self):
+        s = spy(Payload(), weak=True)
+        theMock = weakref.ref(mock_registry.mock_for(s))
+
+        del s
+        collect()
+
+        assert theMock() is None
+
+    def testUnstubAllRestoresPatchedModulesAlongWeakMocks(self):
+        m = mock(weak=True)
+        when(module).one_arg(Ellipsis).thenReturn('mocked')
+        assert module.one_arg('foo') == 'mocked'
+
+        unstub()
+
+        assert module.one_arg('foo') == 'foo'
+        assert mock_registry.mock_for(m) is None
+
+
+@pytest.mark.usefixtures('no_gc')
+class TestNoReferenceCycles:
+    def testRecordsDoNotReferToTheirMock(self):
+        m = mock(weak=True)
+        m.foo(1)
+        theMock = mock_registry.mock_for(m)
+
+        record, = theMock.invocations
+        assert theMock not in gc.get_referents(record)
+
+    def testForgottenMockIsFreedByRefcounting(self):
+        # Keeps the class all unspecced dummies share alive, which, like all
+        # classes, only the cyclic GC can free.
+        sibling = mock()  # noqa: F841
+        m = mock(weak=True)
+        payload = Payload()
+        for i in range(100):
+            m.foo(payload, i)
+        recorded = weakref.ref(payload)
+        theMock = weakref.ref(mock_registry.mock_for(m))
+
+        del m, payload
+        assert recorded() is None
+        assert theMock() is None
+
+        before = collected()
+        gc.collect()
+        assert collected() == before
+
+    def testAdHocMethodsStillKnowTheirDummy(self):
+        m = mock(weak=True)
+
+        assert m.foo is m.foo
+        assert m.foo.__self__ is m